@@ -27,8 +27,8 @@ from robot.output import LOGGER, LogLevel
 from robot.result.keywordremover import KeywordRemover
 from robot.result.flattenkeywordmatcher import validate_flatten_keyword
 from robot.utils import (abspath, create_destination_directory, escape,
-                         get_link_path, html_escape, is_list_like, plural_or_not as s,
-                         seq2str, split_args_from_name_or_path)
+                         get_link_path, html_escape, is_compressed, is_list_like,
+                         plural_or_not as s, seq2str, split_args_from_name_or_path)
 
 from .gatherfailed import gather_failed_tests, gather_failed_suites
 from .languages import Languages
@@ -51,7 +51,9 @@ class _BaseSettings:
                  'Log'              : ('log', 'log.html'),
                  'Report'           : ('report', 'report.html'),
                  'XUnit'            : ('xunit', None),
+                 'Profile'          : ('profile', None),
                  'SplitLog'         : ('splitlog', False),
+                 'SearchIndex'      : ('searchindex', 0),
                  'TimestampOutputs' : ('timestampoutputs', False),
                  'LogTitle'         : ('logtitle', None),
                  'ReportTitle'      : ('reporttitle', None),
@@ -72,14 +74,15 @@ class _BaseSettings:
                  'PythonPath'       : ('pythonpath', []),
                  'StdOut'           : ('stdout', None),
                  'StdErr'           : ('stderr', None)}
-    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile']
+    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile', 'Profile']
 
     def __init__(self, options=None, **extra_options):
         self.start_time = datetime.now()
         self._opts = {}
         self._cli_opts = self._cli_opts.copy()
         self._cli_opts.update(self._extra_cli_opts)
-        self._process_cli_opts(dict(options or {}, **extra_options))
+        self._original_opts = dict(options or {}, **extra_options)
+        self._process_cli_opts(dict(self._original_opts))
 
     def _process_cli_opts(self, opts):
         for name, (cli_name, default) in self._cli_opts.items():
@@ -113,9 +116,9 @@ class _BaseSettings:
             if isinstance(value, Path):
                 return str(value)
             return value if value and value.upper() != 'NONE' else None
-        if name == 'OutputDir':
+        if name in ['OutputDir', 'ParseCache']:
             return Path(value).absolute()
-        if name in ['SuiteStatLevel', 'ConsoleWidth']:
+        if name in ['SuiteStatLevel', 'ConsoleWidth', 'Processes', 'SearchIndex']:
             return self._convert_to_positive_integer_or_default(name, value)
         if name == 'VariableFiles':
             return [split_args_from_name_or_path(item) for item in value]
@@ -127,8 +130,12 @@ class _BaseSettings:
             return [v for v in [self._process_tag_stat_link(v) for v in value] if v]
         if name == 'Randomize':
             return self._process_randomize_value(value)
+        if name == 'Shard':
+            return self._process_shard(value)
         if name == 'MaxErrorLines':
             return self._process_max_error_lines(value)
+        if name == 'CompressionLevel':
+            return self._process_compression_level(value)
         if name == 'MaxAssignLength':
             return self._process_max_assign_length(value)
         if name == 'PythonPath':
@@ -184,6 +191,13 @@ class _BaseSettings:
                                 f"Expected integer greater than 10, got {value}.")
         return value
 
+    def _process_compression_level(self, value):
+        value = self._convert_to_integer('CompressionLevel', value)
+        if not 0 <= value <= 9:
+            self._raise_invalid('CompressionLevel',
+                                f"Expected integer between 0 and 9, got {value}.")
+        return value
+
     def _process_max_assign_length(self, value):
         value = self._convert_to_integer('MaxAssignLength', value)
         return max(value, 0)
@@ -206,6 +220,20 @@ class _BaseSettings:
             self._raise_invalid('Randomize', f"Seed should be integer, got '{seed}'.")
         return value, seed
 
+    def _process_shard(self, value):
+        if isinstance(value, str):
+            index, _, total = value.partition('/')
+        else:
+            index, total = value
+        try:
+            index, total = int(index), int(total)
+        except ValueError:
+            self._raise_invalid('Shard', f"Expected format 'INDEX/TOTAL', got '{value}'.")
+        if not 1 <= index <= total:
+            self._raise_invalid('Shard', f"Index must be between 1 and total, "
+                                         f"got '{value}'.")
+        return index, total
+
     def __getitem__(self, name):
         if name not in self._opts:
             raise KeyError(f"Non-existing option '{name}'.")
@@ -216,7 +244,8 @@ class _BaseSettings:
     def _get_output_file(self, option):
         """Returns path of the requested output file and creates needed dirs.
 
-        `option` can be 'Output', 'Log', 'Report', 'XUnit' or 'DebugFile'.
+        `option` can be 'Output', 'Log', 'Report', 'XUnit', 'DebugFile' or
+        'Profile'.
         """
         name = self._opts[option]
         if not name:
@@ -232,6 +261,9 @@ class _BaseSettings:
 
     def _process_output_name(self, option, name):
         base, ext = os.path.splitext(name)
+        if is_compressed(name):
+            base, inner = os.path.splitext(base)
+            ext = inner + ext
         if self['TimestampOutputs']:
             s = self.start_time
             base = (f'{base}-{s.year}{s.month:02}{s.day:02}-'
@@ -248,6 +280,8 @@ class _BaseSettings:
             return '.html'
         if file_type == 'DebugFile':
             return '.txt'
+        if file_type == 'Profile':
+            return '.json'
         raise FrameworkError(f"Invalid output file type '{file_type}'.")
 
     def _process_metadata(self, value):
@@ -390,6 +424,10 @@ class _BaseSettings:
     def xunit(self) -> 'Path|None':
         return self['XUnit']
 
+    @property
+    def profile(self) -> 'Path|None':
+        return self['Profile']
+
     @property
     def log_level(self):
         return self['LogLevel']
@@ -398,6 +436,10 @@ class _BaseSettings:
     def split_log(self):
         return self['SplitLog']
 
+    @property
+    def search_index_size(self):
+        return self['SearchIndex']
+
     @property
     def suite_names(self):
         return self._filter_empty(self['SuiteNames'])
@@ -472,6 +514,8 @@ class _BaseSettings:
 class RobotSettings(_BaseSettings):
     _extra_cli_opts = {'Extension'          : ('extension', ('.robot', '.rbt', '.robot.rst')),
                        'Output'             : ('output', 'output.xml'),
+                       'OutputIndex'        : ('outputindex', False),
+                       'AsyncOutput'        : ('asyncoutput', False),
                        'LogLevel'           : ('loglevel', 'INFO'),
                        'MaxErrorLines'      : ('maxerrorlines', 40),
                        'MaxAssignLength'    : ('maxassignlength', 200),
@@ -496,21 +540,51 @@ class RobotSettings(_BaseSettings):
                        'ConsoleWidth'       : ('consolewidth', 78),
                        'ConsoleMarkers'     : ('consolemarkers', 'AUTO'),
                        'DebugFile'          : ('debugfile', None),
-                       'Language'           : ('language', [])}
+                       'Language'           : ('language', []),
+                       'Processes'          : ('processes', 1),
+                       'Shard'              : ('shard', None),
+                       'ShardTimings'       : ('shardtimings', None),
+                       'ParseCache'         : ('parsecache', None),
+                       'LazyLibraries'      : ('lazylibraries', False)}
     _languages = None
 
     def get_rebot_settings(self):
         settings = RebotSettings()
         settings.start_time = self.start_time
+        # Processes are not copied because forking the execution process,
+        # which may still have library threads running, is not safe.
         not_copied = {'Include', 'Exclude', 'TestNames', 'SuiteNames', 'ParseInclude',
                       'Name', 'Doc', 'Metadata', 'SetTag', 'Output', 'LogLevel',
-                      'TimestampOutputs'}
+                      'TimestampOutputs', 'Profile', 'Processes'}
         for opt in settings._opts:
             if opt in self and opt not in not_copied:
                 settings._opts[opt] = self[opt]
         settings._opts['ProcessEmptySuite'] = self['RunEmptySuite']
         return settings
 
+    def get_worker_options(self, output):
+        """Returns options for running suites in a separate worker process.
+
+        Worker processes get the original execution options, but they do not
+        create logs, reports or console output and write their results into
+        the given ``output`` file.
+        """
+        options = dict(self._original_opts)
+        listeners = options.get('listener', [])
+        if not is_list_like(listeners):
+            listeners = [listeners]
+        if any(not isinstance(listener, (str, Path)) for listener in listeners):
+            self._raise_invalid('Processes', 'Listeners given as objects are not '
+                                             'supported when using worker processes.')
+        options.update(output=str(output), log=None, report=None, xunit=None,
+                       debugfile=None, profile=None, outputindex=False,
+                       timestampoutputs=False,
+                       console='none', dotted=False, quiet=False, stdout=None,
+                       stderr=None,
+                       processes=1, rpa=self.rpa, prerunmodifier=[],
+                       rerunfailed=None, rerunfailedsuites=None)
+        return options
+
     def _output_disabled(self):
         return self.output is None
 
@@ -549,6 +623,8 @@ class RobotSettings(_BaseSettings):
             'randomize_suites': self.randomize_suites,
             'randomize_tests': self.randomize_tests,
             'randomize_seed': self.randomize_seed,
+            'shard': self.shard,
+            'shard_timings': self.shard_timings,
         }
 
     @property
@@ -572,6 +648,14 @@ class RobotSettings(_BaseSettings):
             return names + rerun
         return names or rerun
 
+    @property
+    def shard(self):
+        return self['Shard']
+
+    @property
+    def shard_timings(self):
+        return self['ShardTimings']
+
     @property
     def randomize_seed(self):
         return self['Randomize'][1]
@@ -673,6 +757,26 @@ class RobotSettings(_BaseSettings):
     def extension(self):
         return self['Extension']
 
+    @property
+    def processes(self):
+        return self['Processes']
+
+    @property
+    def parse_cache(self):
+        return self['ParseCache']
+
+    @property
+    def lazy_libraries(self):
+        return self['LazyLibraries']
+
+    @property
+    def output_index(self) -> bool:
+        return self['OutputIndex'] and self.output is not None
+
+    @property
+    def async_output(self) -> bool:
+        return self['AsyncOutput']
+
 
 class RebotSettings(_BaseSettings):
     _extra_cli_opts = {'Output'            : ('output', None),
@@ -680,7 +784,10 @@ class RebotSettings(_BaseSettings):
                        'ProcessEmptySuite' : ('processemptysuite', False),
                        'StartTime'         : ('starttime', None),
                        'EndTime'           : ('endtime', None),
-                       'Merge'             : ('merge', False)}
+                       'Merge'             : ('merge', False),
+                       'Processes'         : ('processes', 1),
+                       'CompressionLevel'  : ('compressionlevel', 9),
+                       'LowMemory'         : ('lowmemory', False)}
 
     def _output_disabled(self):
         return False
@@ -739,6 +846,18 @@ class RebotSettings(_BaseSettings):
     def merge(self):
         return self['Merge']
 
+    @property
+    def low_memory(self):
+        return self['LowMemory']
+
+    @property
+    def processes(self):
+        return self['Processes']
+
+    @property
+    def compression_level(self):
+        return self['CompressionLevel']
+
     @property
     def console_output_config(self):
         return {
@@ -33,12 +33,42 @@ window.fileLoading = (function () {
         }
     }
 
+    function getCallbackHandlerForTestPages(suite) {
+        var pending = [];
+        var loading = false;
+
+        function loadPending() {
+            loading = true;
+            while (pending.length && suite.loadedTestPages >=
+                   Math.min(pending[0].pageCount, suite.testPageFileNames.length)) {
+                pending.shift().callable();
+            }
+            if (!pending.length) {
+                loading = false;
+                return;
+            }
+            loadKeywordsFile(suite.testPageFileNames[suite.loadedTestPages], function () {
+                suite.loadedTestPages++;
+                loadPending();
+            });
+        }
+
+        // Pages are loaded one by one in order and callables are called in
+        // the order they were registered once enough pages are loaded.
+        return function (pageCount, callable) {
+            pending.push({pageCount: pageCount, callable: callable});
+            if (!loading)
+                loadPending();
+        }
+    }
+
     function notifyFileLoaded(filename) {
         fileLoadingCallbacks[filename]();
     }
 
     return {
         getCallbackHandlerForKeywords: getCallbackHandlerForKeywords,
+        getCallbackHandlerForTestPages: getCallbackHandlerForTestPages,
         notify: notifyFileLoaded
     }
 }());
@@ -28,7 +28,11 @@ function populateChildren(elementId, childElement, childrenNames) {
     if (!childElement.hasClass('populated')) {
         var element = window.testdata.findLoaded(elementId);
         var callback = drawCallback(element, childElement, childrenNames);
-        element.callWhenChildrenReady(callback);
+        // Only the first page of tests is needed for drawing suites.
+        if (element.type == 'suite')
+            element.callWhenTestPagesReady(1, callback);
+        else
+            element.callWhenChildrenReady(callback);
         childElement.addClass('populated');
     }
 }
@@ -41,9 +45,51 @@ function drawCallback(element, childElement, childrenNames) {
                 $.tmpl(child.template, child).appendTo(childElement);
             });
         });
+        if (element.type == 'suite' && element.hasMoreTestPages()) {
+            $.tmpl('testPageLoaderTemplate', element).appendTo(childElement);
+            setTimeout(loadTestPagesInView, 0);
+        }
     }
 }
 
+function drawNextTestPage(suiteId) {
+    var suite = window.testdata.findLoaded(suiteId);
+    var loader = testPageLoader(suite);
+    if (loader.hasClass('loading'))
+        return;
+    loader.addClass('loading');
+    suite.callWhenTestPagesReady(suite.loadedTestPages + 1, function () {
+        drawLoadedTests(suite);
+        setTimeout(loadTestPagesInView, 0);
+    });
+}
+
+function drawLoadedTests(suite) {
+    var loader = testPageLoader(suite);
+    if (!loader.length)
+        return;
+    var tests = suite.tests();
+    for (var i = loader.siblings('.test').length; i < tests.length; i++)
+        $.tmpl('testTemplate', tests[i]).insertBefore(loader);
+    if (suite.hasMoreTestPages())
+        loader.removeClass('loading');
+    else
+        loader.remove();
+}
+
+function testPageLoader(suite) {
+    return $('#' + suite.id).children('.children').children('.test-page-loader');
+}
+
+function loadTestPagesInView() {
+    var bottom = $(window).scrollTop() + 2 * $(window).height();
+    $('.test-page-loader:visible').not('.loading').each(function () {
+        var loader = $(this);
+        if (loader.offset().top < bottom)
+            drawNextTestPage(loader.attr('data-suite'));
+    });
+}
+
 function expandSuite(suite) {
     if (suite.status == "FAIL")
         expandFailed(suite);
@@ -64,6 +110,8 @@ function expandElement(item, retryCount) {
         return;
     }
     populateChildren(item.id, children, item.childrenNames);
+    if (item.type == 'suite')
+        drawLoadedTests(item);
     element.children('.element-header').removeClass('closed');
 }
 
@@ -87,6 +135,7 @@ function expandFailed(element) {
         window.expandDecider = function (e) {
             return e.status == "FAIL";
         };
+        window.expandLoadedTestsOnly = true;
         expandRecursively();
     }
 }
@@ -94,6 +143,7 @@ function expandFailed(element) {
 function expandAll(elementId) {
     window.elementsToExpand = [window.testdata.findLoaded(elementId)];
     window.expandDecider = function () { return true; };
+    window.expandLoadedTestsOnly = false;
     expandRecursively();
 }
 
@@ -106,7 +156,9 @@ function expandRecursively() {
         return;
     }
     expandElement(element);
-    element.callWhenChildrenReady(function () {
+    callWhenChildrenToExpandReady(element, function () {
+        if (element.type == 'suite')
+            drawLoadedTests(element);
         var children = element.children();
         for (var i = children.length-1; i >= 0; i--) {
             var child = children[i];
@@ -118,6 +170,15 @@ function expandRecursively() {
     });
 }
 
+function callWhenChildrenToExpandReady(element, callable) {
+    // Expanding failed items considers only tests that have already been
+    // loaded to avoid loading and drawing all tests of big suites.
+    if (element.type == 'suite' && window.expandLoadedTestsOnly)
+        element.callWhenTestPagesReady(1, callable);
+    else
+        element.callWhenChildrenReady(callable);
+}
+
 function elementHiddenByUser(id) {
     var element = $('#' + id);
     return !element.is(":visible");
@@ -231,3 +292,59 @@ function LogLevelController(minLevel, defaultLevel) {
         showTrace: showTrace
     };
 }
+
+function SearchController(index) {
+    var query = null;
+    var matches = [];
+    var position = -1;
+    var failure = -1;
+
+    function next(text) {
+        if (text != query) {
+            query = text;
+            matches = index.find(text);
+            position = -1;
+        }
+        if (!matches.length)
+            return null;
+        position = (position + 1) % matches.length;
+        return matches[position];
+    }
+
+    function nextFailure() {
+        if (!index.failures.length)
+            return null;
+        failure = (failure + 1) % index.failures.length;
+        return index.failures[failure];
+    }
+
+    function status() {
+        if (query === null)
+            return '';
+        if (!matches.length)
+            return 'No matches';
+        return (position + 1) + '/' + matches.length + (index.truncated ? '+' : '');
+    }
+
+    return {
+        next: next,
+        nextFailure: nextFailure,
+        status: status,
+        hasFailures: function () { return index.failures.length > 0; }
+    };
+}
+
+function searchSelected(event, text) {
+    if (event.keyCode != 13)
+        return;
+    var id = window.searchController.next(text.trim());
+    $('#search-status').text(window.searchController.status());
+    if (id)
+        makeElementVisible(id);
+}
+
+function nextFailureSelected() {
+    var id = window.searchController.nextFailure();
+    if (id)
+        makeElementVisible(id);
+}
@@ -13,7 +13,15 @@ window.model = (function () {
         suite.populateTests = createIterablePopulator('Test');
         suite.populateSuites = createIterablePopulator('Suite');
         suite.childrenNames = ['keyword', 'suite', 'test'];
-        suite.callWhenChildrenReady = function (callable) { callable(); };
+        suite.testPageFileNames = [];
+        suite.loadedTestPages = 0;
+        suite.hasMoreTestPages = function () {
+            return suite.loadedTestPages < suite.testPageFileNames.length;
+        };
+        suite.callWhenTestPagesReady = window.fileLoading.getCallbackHandlerForTestPages(suite);
+        suite.callWhenChildrenReady = function (callable) {
+            suite.callWhenTestPagesReady(suite.testPageFileNames.length, callable);
+        };
         suite.children = function () {
             return suite.keywords().concat(suite.tests()).concat(suite.suites());
         };
@@ -199,12 +207,19 @@ window.model = (function () {
     }
 
     function createGetAllFunction(numberOfElements, creator) {
-        var cached = null;
+        // Number of elements can grow when tests are loaded from pages.
+        // Creators may access already created elements while populating.
+        var cached = [];
+        var populating = false;
         return function () {
-            if (cached === null) {
-                cached = [];
-                for (var i = 0; i < numberOfElements(); i++) {
-                    cached.push(creator(i));
+            if (!populating) {
+                populating = true;
+                try {
+                    for (var i = cached.length; i < numberOfElements(); i++) {
+                        cached.push(creator(i));
+                    }
+                } finally {
+                    populating = false;
                 }
             }
             return cached;
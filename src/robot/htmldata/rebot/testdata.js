@@ -95,12 +95,27 @@ window.testdata = function () {
             populator = Populator(model, strings, creator);
         } else {
             index = modelOrIndex;
-            parent.childFileName = window.settings['splitLogBase'] + '-' + index + '.js';
+            parent.childFileName = splitLogFileName(index);
             populator = SplitLogPopulator(index, creator);
         }
         parent.populateKeywords(populator);
     }
 
+    function lazyPopulateTestsFromFiles(suite, testsOrPages, strings) {
+        var creator = childCreator(suite, createTest);
+        // Tests of big suites are in page files and the model has only their indices.
+        if (testsOrPages.length && typeof(testsOrPages[0]) === 'number') {
+            suite.testPageFileNames = util.map(testsOrPages, splitLogFileName);
+            suite.populateTests(TestPagePopulator(suite, testsOrPages, creator));
+        } else {
+            suite.populateTests(Populator(testsOrPages, strings, creator));
+        }
+    }
+
+    function splitLogFileName(index) {
+        return window.settings['splitLogBase'] + '-' + index + '.js';
+    }
+
     function tags(taglist, strings) {
         return util.map(taglist, strings.get);
     }
@@ -155,7 +170,7 @@ window.testdata = function () {
             metadata: parseMetadata(element[4], strings)
         });
         suite.populateKeywords(Populator(element[8], strings, childCreator(suite, createKeyword)));
-        suite.populateTests(Populator(element[7], strings, childCreator(suite, createTest)));
+        lazyPopulateTestsFromFiles(suite, element[7], strings);
         suite.populateSuites(Populator(element[6], strings, childCreator(suite, createSuite)));
         return suite;
     }
@@ -201,6 +216,31 @@ window.testdata = function () {
         };
     }
 
+    function TestPagePopulator(suite, pageIndices, creator) {
+        function page(pageIndex) {
+            return window['keywords'+pageIndices[pageIndex]];
+        }
+        return {
+            numberOfItems: function () {
+                var count = 0;
+                for (var i = 0; i < suite.loadedTestPages; i++)
+                    count += page(i).length;
+                return count;
+            },
+            creator: function (index) {
+                var pageIndex = 0;
+                var indexInPage = index;
+                while (indexInPage >= page(pageIndex).length) {
+                    indexInPage -= page(pageIndex).length;
+                    pageIndex++;
+                }
+                return creator(page(pageIndex)[indexInPage],
+                               StringStore(window['strings'+pageIndices[pageIndex]]),
+                               index);
+            }
+        };
+    }
+
     function suite() {
         var elem = window.output.suite;
         if (elementsById[elem.id])
@@ -226,7 +266,7 @@ window.testdata = function () {
             callback(result);
             return;
         }
-        current.callWhenChildrenReady(function () {
+        callWhenChildReady(current, ids[0], function () {
             var id = ids.shift();
             var type = id[0];
             var index = parseInt(id.substring(1)) - 1;
@@ -239,6 +279,25 @@ window.testdata = function () {
         });
     }
 
+    function callWhenChildReady(element, id, callable) {
+        if (element.type != 'suite')
+            element.callWhenChildrenReady(callable);
+        else if (id[0] === 't')
+            callWhenTestReady(element, parseInt(id.substring(1)) - 1, callable);
+        else
+            callable();
+    }
+
+    function callWhenTestReady(suite, index, callable) {
+        // Test pages are loaded only until the page containing the test.
+        if (index < suite.tests().length || !suite.hasMoreTestPages())
+            callable();
+        else
+            suite.callWhenTestPagesReady(suite.loadedTestPages + 1, function () {
+                callWhenTestReady(suite, index, callable);
+            });
+    }
+
     function selectFrom(element, type, index) {
         if (type === 'k') {
             var keywords = util.filter(element.keywords(), function (kw) {
@@ -272,6 +331,64 @@ window.testdata = function () {
         return _statistics;
     }
 
+    function searchIndex() {
+        var data = window.output.search_index;
+        if (!data)
+            return null;
+        var ids = [];
+        var tokens = null;
+
+        function id(index) {
+            if (!ids[index]) {
+                var parent = data.ids[index*2];
+                var part = data.ids[index*2+1];
+                ids[index] = parent < 0 ? part : id(parent) + '-' + part;
+            }
+            return ids[index];
+        }
+
+        function words(text) {
+            return util.map(text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [],
+                            function (word) { return word.substring(0, 30); });
+        }
+
+        function itemsMatching(word) {
+            // Indexed words are matched by prefix. Short words are not indexed.
+            if (tokens === null)
+                tokens = Object.keys(data.tokens);
+            var items = {};
+            for (var i = 0; i < tokens.length; i++) {
+                if (tokens[i].indexOf(word) === 0)
+                    util.map(data.tokens[tokens[i]], function (item) { items[item] = true; });
+            }
+            return items;
+        }
+
+        function find(text) {
+            var matches = null;
+            util.map(words(text), function (word) {
+                var items = itemsMatching(word);
+                if (matches === null)
+                    matches = items;
+                else
+                    for (var item in matches)
+                        if (!items[item])
+                            delete matches[item];
+            });
+            var indices = [];
+            for (var item in matches || {})
+                indices.push(parseInt(item));
+            indices.sort(function (a, b) { return a - b; });
+            return util.map(indices, id);
+        }
+
+        return {
+            find: find,
+            failures: util.map(data.failures, id),
+            truncated: data.truncated
+        };
+    }
+
     function StringStore(strings) {
 
         function getText(id) {
@@ -305,6 +422,7 @@ window.testdata = function () {
         findLoaded: findLoaded,
         ensureLoaded: ensureLoaded,
         statistics: statistics,
+        searchIndex: searchIndex,
         StringStore: StringStore,  // exposed for tests
         LEVELS: LEVELS
     };
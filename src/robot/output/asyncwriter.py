@@ -0,0 +1,102 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import atexit
+from queue import Queue
+from threading import Thread
+from typing import TextIO
+
+
+class AsyncFileWriter:
+    """File like object writing text to a file in a background thread.
+
+    Written text is collected into blocks that are passed to a writer thread
+    using a bounded queue. If the queue is full, writing blocks until the
+    writer thread has caught up. Errors occurring in the writer thread are
+    raised when text is written, or the writer flushed or closed, next time.
+
+    :meth:`flush` waits until all text written so far is in the file. It is
+    called automatically when the interpreter exits so that only the text
+    written after that is lost if execution is stopped forcefully.
+    """
+
+    def __init__(self, file: TextIO, block_size: int = 64 * 1024,
+                 queue_size: int = 16):
+        self.file = file
+        self.block_size = block_size
+        self._buffer = []
+        self._buffered = 0
+        self._queue = Queue(queue_size)
+        self._error = None
+        self._thread = Thread(target=self._write_blocks, name='RobotOutputWriter',
+                              daemon=True)
+        self._thread.start()
+        atexit.register(self._flush_at_exit)
+
+    def _write_blocks(self):
+        while True:
+            block = self._queue.get()
+            try:
+                if block is None:
+                    return
+                if not self._error:
+                    self.file.write(block)
+            except Exception as err:
+                self._error = err
+            finally:
+                self._queue.task_done()
+
+    def write(self, text: str):
+        self._raise_possible_error()
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.block_size:
+            self._queue_buffer()
+
+    def _queue_buffer(self):
+        if self._buffer:
+            self._queue.put(''.join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+
+    def _raise_possible_error(self):
+        if self._error:
+            raise self._error
+
+    def flush(self):
+        self._queue_buffer()
+        self._queue.join()
+        self._raise_possible_error()
+        self.file.flush()
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def tell(self) -> int:
+        """Returns the position in the file after flushing buffered text."""
+        self.flush()
+        return self.file.tell()
+
+    def close(self):
+        atexit.unregister(self._flush_at_exit)
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+            self.file.close()
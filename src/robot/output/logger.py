@@ -21,6 +21,7 @@ from robot.errors import DataError
 from .console import ConsoleOutput
 from .filelogger import FileLogger
 from .loggerhelper import AbstractLogger
+from .replayer import ResultReplayer
 from .stdoutlogsplitter import StdoutLogSplitter
 
 
@@ -63,6 +64,7 @@ class Logger(AbstractLogger):
         self._error_listener = None
         self._enabled = 0
         self._cache_only = False
+        self._captured_messages = None
         if register_console_logger:
             self.register_console_logger()
 
@@ -89,6 +91,17 @@ class Logger(AbstractLogger):
     def __iter__(self):
         return iter(self.end_loggers)
 
+    def replay_suite(self, suite):
+        """Replays an already executed result suite to loggers.
+
+        Used with suites executed in separate worker processes. Listeners are
+        not notified, because they were already called in the workers.
+        """
+        listeners = self._listeners
+        start_loggers = [lo for lo in self.start_loggers if lo not in listeners]
+        end_loggers = [lo for lo in self.end_loggers if lo not in listeners]
+        suite.visit(ResultReplayer(start_loggers, end_loggers))
+
     def __enter__(self):
         if not self._enabled:
             self.register_syslog()
@@ -160,6 +173,9 @@ class Logger(AbstractLogger):
 
     def message(self, msg):
         """Messages about what the framework is doing, warnings, errors, ..."""
+        if self._captured_messages is not None:
+            self._captured_messages.append(msg)
+            return
         if not self._cache_only:
             for logger in self:
                 logger.message(msg)
@@ -179,6 +195,21 @@ class Logger(AbstractLogger):
         finally:
             self._cache_only = False
 
+    @property
+    @contextmanager
+    def captured_messages(self):
+        """Captures messages instead of passing them to loggers.
+
+        Yields a list where captured messages are added. They can be written
+        later using :meth:`message` if needed.
+        """
+        prev_captured = self._captured_messages
+        self._captured_messages = []
+        try:
+            yield self._captured_messages
+        finally:
+            self._captured_messages = prev_captured
+
     @property
     @contextmanager
     def delayed_logging(self):
@@ -451,6 +482,10 @@ class Logger(AbstractLogger):
         for logger in self:
             logger.debug_file(path)
 
+    def profile_file(self, path):
+        for logger in self:
+            logger.profile_file(path)
+
     def result_file(self, kind, path):
         kind_file = getattr(self, f'{kind.lower()}_file')
         kind_file(path)
@@ -205,7 +205,15 @@ class LoggerApi:
         """
         self.result_file('Debug', path)
 
-    def result_file(self, kind: Literal['Output', 'Report', 'Log', 'XUnit', 'Debug'],
+    def profile_file(self, path: Path):
+        """Called when profile file is closed.
+
+        Calls :meth:`result_file` by default.
+        """
+        self.result_file('Profile', path)
+
+    def result_file(self, kind: Literal['Output', 'Report', 'Log', 'XUnit', 'Debug',
+                                        'Profile'],
                     path: Path):
         """Called when any result file is closed by default.
 
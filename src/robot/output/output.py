@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from robot.errors import DataError
+
 from . import pyloggingconf
 from .debugfile import DebugFile
 from .listeners import Listeners, LibraryListeners
@@ -21,6 +23,7 @@ from .loggerapi import LoggerApi
 from .loggerhelper import AbstractLogger
 from .loglevel import LogLevel
 from .outputfile import OutputFile
+from .profiler import Profiler
 
 
 class Output(AbstractLogger, LoggerApi):
@@ -28,9 +31,12 @@ class Output(AbstractLogger, LoggerApi):
     def __init__(self, settings):
         self.log_level = LogLevel(settings.log_level)
         self.output_file = OutputFile(settings.output, self.log_level, settings.rpa,
-                                      legacy_output=settings.legacy_output)
+                                      legacy_output=settings.legacy_output,
+                                      index=settings.output_index,
+                                      async_output=settings.async_output)
         self.listeners = Listeners(settings.listeners, self.log_level)
         self.library_listeners = LibraryListeners(self.log_level)
+        self.profiler = Profiler() if settings.profile else None
         self._register_loggers(DebugFile(settings.debug_file))
         self._settings = settings
 
@@ -43,6 +49,8 @@ class Output(AbstractLogger, LoggerApi):
         LOGGER.register_listeners(self.listeners or None, self.library_listeners)
         if debug_file:
             LOGGER.register_logger(debug_file)
+        if self.profiler:
+            LOGGER.register_logger(self.profiler)
 
     def register_error_listener(self, listener):
         LOGGER.register_error_listener(listener)
@@ -56,6 +64,25 @@ class Output(AbstractLogger, LoggerApi):
         self.output_file.close()
         LOGGER.unregister_output_file()
         LOGGER.output_file(self._settings['Output'])
+        if self._settings.output_index:
+            self._write_index()
+        if self.profiler:
+            self._write_profile(self._settings.profile)
+
+    def _write_index(self):
+        try:
+            self.output_file.write_index()
+        except DataError as err:
+            LOGGER.error(err.message)
+
+    def _write_profile(self, path):
+        LOGGER.unregister_logger(self.profiler)
+        try:
+            self.profiler.write(path)
+        except DataError as err:
+            LOGGER.error(err.message)
+        else:
+            LOGGER.profile_file(path)
 
     def start_suite(self, data, result):
         LOGGER.start_suite(data, result)
@@ -63,6 +90,9 @@ class Output(AbstractLogger, LoggerApi):
     def end_suite(self, data, result):
         LOGGER.end_suite(data, result)
 
+    def replay_suite(self, result):
+        LOGGER.replay_suite(result)
+
     def start_test(self, data, result):
         LOGGER.start_test(data, result)
 
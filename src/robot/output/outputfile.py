@@ -16,8 +16,12 @@
 from pathlib import Path
 
 from robot.errors import DataError
-from robot.utils import get_error_message
+from robot.result import OutputIndexBuilder, TestSuite
+from robot.utils import (get_error_message, is_compressed, open_file,
+                         strip_compression_suffix)
+from robot.version import get_full_version
 
+from .asyncwriter import AsyncFileWriter
 from .loggerapi import LoggerApi
 from .loglevel import LogLevel
 from .jsonlogger import JsonLogger
@@ -27,40 +31,70 @@ from .xmllogger import LegacyXmlLogger, NullLogger, XmlLogger
 class OutputFile(LoggerApi):
 
     def __init__(self, path: 'Path|None', log_level: LogLevel, rpa: bool = False,
-                 legacy_output: bool = False):
+                 legacy_output: bool = False, index: bool = False,
+                 async_output: bool = False):
+        self.file = None
         # `self.logger` is replaced with `NullLogger` when flattening.
-        self.logger = self.real_logger = self._get_logger(path, rpa, legacy_output)
+        self.logger = self.real_logger = self._get_logger(path, rpa, legacy_output,
+                                                          async_output)
+        self.index = self._get_index_builder(path, rpa) if index else None
         self.is_logged = log_level.is_logged
         self.flatten_level = 0
         self.errors = []
 
-    def _get_logger(self, path, rpa, legacy_output):
+    def _get_logger(self, path, rpa, legacy_output, async_output):
         if not path:
             return NullLogger()
         try:
-            file = open(path, 'w', encoding='UTF-8')
+            file = self.file = open_file(path, 'w', encoding='UTF-8', compress=True)
         except Exception:
             raise DataError(f"Opening output file '{path}' failed: "
                             f"{get_error_message()}")
-        if path.suffix.lower() == '.json':
+        if async_output:
+            file = self.file = AsyncFileWriter(file)
+        if self._is_json(path):
             return JsonLogger(file, rpa)
         if legacy_output:
             return LegacyXmlLogger(file, rpa)
         return XmlLogger(file, rpa)
 
+    def _is_json(self, path):
+        return strip_compression_suffix(path).suffix.lower() == '.json'
+
+    def _get_index_builder(self, path, rpa):
+        # Offsets in compressed files cannot be used for seeking.
+        if not self.file or is_compressed(path):
+            return None
+        format = 'json' if self._is_json(path) else 'xml'
+        return OutputIndexBuilder(path, format, get_full_version('Robot'), rpa)
+
     def start_suite(self, data, result):
+        if self.index:
+            # Text file `tell()` returns byte offsets when writing UTF-8.
+            self.index.start(result.id, result.name, self.file.tell())
         self.logger.start_suite(result)
 
     def end_suite(self, data, result):
         self.logger.end_suite(result)
+        if self.index:
+            self.index.end(self.file.tell())
+        elif isinstance(self.file, AsyncFileWriter):
+            # Data of ended suites is in the file even if execution is killed.
+            self.file.flush()
 
     def start_test(self, data, result):
+        if self.index:
+            self.index.start(result.id, result.name, self.file.tell())
         self.logger.start_test(result)
 
     def end_test(self, data, result):
         self.logger.end_test(result)
+        if self.index:
+            self.index.end(self.file.tell())
 
     def start_keyword(self, data, result):
+        if self.index and self._is_suite_teardown(result):
+            self._teardown_start = self.file.tell()
         self.logger.start_keyword(result)
         if result.tags.robot('flatten'):
             self.flatten_level += 1
@@ -72,6 +106,11 @@ class OutputFile(LoggerApi):
             if self.flatten_level == 0:
                 self.logger = self.real_logger
         self.logger.end_keyword(result)
+        if self.index and self._is_suite_teardown(result):
+            self.index.teardown(self._teardown_start, self.file.tell())
+
+    def _is_suite_teardown(self, result):
+        return result.type == result.TEARDOWN and isinstance(result.parent, TestSuite)
 
     def start_for(self, data, result):
         self.logger.start_for(result)
@@ -172,3 +211,11 @@ class OutputFile(LoggerApi):
     def close(self):
         self.logger.errors(self.errors)
         self.logger.close()
+
+    def write_index(self) -> 'Path|None':
+        """Writes the output index after the output file has been closed."""
+        if not self.index:
+            return None
+        index = self.index.index
+        index.save()
+        return index.get_index_path(index.output)
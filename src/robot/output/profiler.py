@@ -0,0 +1,183 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import csv
+import json
+import os
+from pathlib import Path
+
+from robot.result import Keyword, ResultVisitor
+from robot.utils import file_writer
+
+from .loggerapi import LoggerApi
+
+
+class KeywordProfile:
+    """Call count and times of one keyword.
+
+    ``total_time`` contains the whole time spent in the keyword. Recursive
+    calls are counted only once. ``self_time`` excludes time spent in child
+    keywords and control structures.
+    """
+
+    def __init__(self, owner, name):
+        self.owner = owner
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+
+    def to_dict(self):
+        return {'owner': self.owner,
+                'name': self.name,
+                'calls': self.calls,
+                'total_time': round(self.total_time, 6),
+                'self_time': round(self.self_time, 6)}
+
+
+class _Frame:
+
+    def __init__(self, item):
+        self.item = item
+        self.child_time = 0.0
+
+
+class Profiler(LoggerApi):
+    """Collects keyword call counts and times during execution.
+
+    Times are got from start and end times of the result objects, so the
+    profiler works both during execution and with existing results. Use
+    :meth:`from_result` with existing results.
+
+    :meth:`write` writes a summary of keywords and collapsed stacks that
+    flame graph tools like ``flamegraph.pl`` and speedscope understand.
+    The summary is written as CSV if the path has a ``.csv`` extension and
+    as JSON otherwise. Collapsed stacks are written into a file having the
+    same base name and a ``.folded`` extension. Stacks contain only keywords
+    and their values are self times in microseconds. Time spent in control
+    structures themselves is reported using the control structure type as
+    the last stack frame.
+    """
+
+    def __init__(self):
+        self.keywords = {}
+        self.stacks = {}
+        self._frames = []
+        self._active = {}
+
+    @classmethod
+    def from_result(cls, result):
+        """Creates a profiler based on an existing result or result suite."""
+        profiler = cls()
+        result.visit(ResultProfiler(profiler))
+        return profiler
+
+    def start_body_item(self, data, result):
+        self.start(result)
+
+    def end_body_item(self, data, result):
+        self.end(result)
+
+    def start(self, item):
+        self._frames.append(_Frame(item))
+        if isinstance(item, Keyword):
+            key = (item.owner or '', item.name or '')
+            self._active[key] = self._active.get(key, 0) + 1
+
+    def end(self, item):
+        frame = self._frames.pop()
+        if isinstance(item, Keyword):
+            key = (item.owner or '', item.name or '')
+            self._active[key] -= 1
+        if item.not_run:
+            return
+        elapsed = item.elapsed_time.total_seconds()
+        if self._frames:
+            self._frames[-1].child_time += elapsed
+        self_time = max(elapsed - frame.child_time, 0.0)
+        if isinstance(item, Keyword):
+            self._record_keyword(key, elapsed, self_time)
+            self._record_stack(self._get_stack(item), self_time)
+        else:
+            self._record_stack(self._get_stack(item.type), self_time)
+
+    def _record_keyword(self, key, elapsed, self_time):
+        if key not in self.keywords:
+            self.keywords[key] = KeywordProfile(*key)
+        profile = self.keywords[key]
+        profile.calls += 1
+        profile.self_time += self_time
+        if not self._active[key]:
+            profile.total_time += elapsed
+
+    def _get_stack(self, last):
+        frames = [f.item for f in self._frames if isinstance(f.item, Keyword)]
+        return ';'.join(self._format_frame(f) for f in frames + [last])
+
+    def _format_frame(self, item):
+        if isinstance(item, Keyword):
+            item = item.full_name or ''
+        return item.replace(';', ',')
+
+    def _record_stack(self, stack, self_time):
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + self_time
+
+    def write(self, path):
+        """Writes the summary to the given path and stacks next to it."""
+        path = Path(path)
+        profiles = sorted(self.keywords.values(),
+                          key=lambda p: (-p.self_time, p.owner, p.name))
+        with file_writer(path, newline='', usage='profile') as output:
+            if path.suffix.lower() == '.csv':
+                self._write_csv(profiles, output)
+            else:
+                self._write_json(profiles, output)
+        with file_writer(self.get_stacks_path(path), usage='profile') as output:
+            self._write_stacks(output)
+
+    def get_stacks_path(self, path):
+        return Path(os.path.splitext(path)[0] + '.folded')
+
+    def _write_csv(self, profiles, output):
+        writer = csv.DictWriter(output, ['owner', 'name', 'calls', 'total_time',
+                                         'self_time'])
+        writer.writeheader()
+        for profile in profiles:
+            writer.writerow(profile.to_dict())
+
+    def _write_json(self, profiles, output):
+        json.dump({'keywords': [p.to_dict() for p in profiles]}, output, indent=2)
+        output.write('\n')
+
+    def _write_stacks(self, output):
+        for stack in sorted(self.stacks):
+            value = round(self.stacks[stack] * 1_000_000)
+            if value:
+                output.write(f'{stack} {value}\n')
+
+
+class ResultProfiler(ResultVisitor):
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def start_body_item(self, item):
+        self.profiler.start(item)
+
+    def end_body_item(self, item):
+        self.profiler.end(item)
+
+    def visit_message(self, message):
+        pass
@@ -0,0 +1,142 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from robot.result import ResultVisitor
+
+
+class ResultReplayer(ResultVisitor):
+    """Replays an already executed result structure to loggers.
+
+    Loggers get results both as the ``data`` and the ``result`` argument,
+    because the original running model is not available.
+    """
+
+    def __init__(self, start_loggers, end_loggers):
+        self.start_loggers = start_loggers
+        self.end_loggers = end_loggers
+
+    def _start(self, name, item):
+        for logger in self.start_loggers:
+            getattr(logger, f'start_{name}')(item, item)
+
+    def _end(self, name, item):
+        for logger in self.end_loggers:
+            getattr(logger, f'end_{name}')(item, item)
+
+    def start_suite(self, suite):
+        self._start('suite', suite)
+
+    def end_suite(self, suite):
+        self._end('suite', suite)
+
+    def start_test(self, test):
+        self._start('test', test)
+
+    def end_test(self, test):
+        self._end('test', test)
+
+    def start_keyword(self, keyword):
+        self._start('keyword', keyword)
+
+    def end_keyword(self, keyword):
+        self._end('keyword', keyword)
+
+    def start_for(self, for_):
+        self._start('for', for_)
+
+    def end_for(self, for_):
+        self._end('for', for_)
+
+    def start_for_iteration(self, iteration):
+        self._start('for_iteration', iteration)
+
+    def end_for_iteration(self, iteration):
+        self._end('for_iteration', iteration)
+
+    def start_while(self, while_):
+        self._start('while', while_)
+
+    def end_while(self, while_):
+        self._end('while', while_)
+
+    def start_while_iteration(self, iteration):
+        self._start('while_iteration', iteration)
+
+    def end_while_iteration(self, iteration):
+        self._end('while_iteration', iteration)
+
+    def start_group(self, group):
+        self._start('group', group)
+
+    def end_group(self, group):
+        self._end('group', group)
+
+    def start_if(self, if_):
+        self._start('if', if_)
+
+    def end_if(self, if_):
+        self._end('if', if_)
+
+    def start_if_branch(self, branch):
+        self._start('if_branch', branch)
+
+    def end_if_branch(self, branch):
+        self._end('if_branch', branch)
+
+    def start_try(self, try_):
+        self._start('try', try_)
+
+    def end_try(self, try_):
+        self._end('try', try_)
+
+    def start_try_branch(self, branch):
+        self._start('try_branch', branch)
+
+    def end_try_branch(self, branch):
+        self._end('try_branch', branch)
+
+    def start_var(self, var):
+        self._start('var', var)
+
+    def end_var(self, var):
+        self._end('var', var)
+
+    def start_break(self, break_):
+        self._start('break', break_)
+
+    def end_break(self, break_):
+        self._end('break', break_)
+
+    def start_continue(self, continue_):
+        self._start('continue', continue_)
+
+    def end_continue(self, continue_):
+        self._end('continue', continue_)
+
+    def start_return(self, return_):
+        self._start('return', return_)
+
+    def end_return(self, return_):
+        self._end('return', return_)
+
+    def start_error(self, error):
+        self._start('error', error)
+
+    def end_error(self, error):
+        self._end('error', error)
+
+    def visit_message(self, message):
+        for logger in self.end_loggers:
+            logger.log_message(message)
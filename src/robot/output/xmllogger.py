@@ -29,7 +29,8 @@ class XmlLogger(ResultVisitor):
             self._writer.start('robot', self._get_start_attrs(rpa))
 
     def _get_writer(self, output, preamble=True):
-        return XmlWriter(output, usage='output', write_empty=False, preamble=preamble)
+        return XmlWriter(output, usage='output', write_empty=False, preamble=preamble,
+                         compress=True)
 
     def _get_start_attrs(self, rpa):
         return {'generator': get_full_version(self.generator),
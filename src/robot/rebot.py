@@ -62,12 +62,14 @@ can be replaced with any supported Python interpreter. Yet another alternative
 is running the `robot/rebot.py` script like `python path/to/robot/rebot.py`.
 
 Inputs to Rebot are XML output files generated by Robot Framework or by earlier
-Rebot executions. When more than one input file is given, a new top level test
-suite containing suites in the given files is created by default. This allows
-combining multiple outputs together to create higher level reports. An
-exception is that if --merge is used, results are combined by adding suites
-and tests in subsequent outputs into the first suite structure. If same test
-is found from multiple outputs, the last one replaces the earlier ones.
+Rebot executions. Outputs compressed with gzip or xz, having a `.gz` or `.xz`
+suffix, are read transparently. When more than one input file is given, a new
+top level test suite containing suites in the given files is created by
+default. This allows combining multiple outputs together to create higher
+level reports. An exception is that if --merge is used, results are combined
+by adding suites and tests in subsequent outputs into the first suite
+structure. If same test is found from multiple outputs, the last one replaces
+the earlier ones.
 
 For more information about Rebot and other built-in tools, see
 http://robotframework.org/robotframework/#built-in-tools. For more details
@@ -83,6 +85,26 @@ Options
  -R --merge               When combining results, merge outputs together
                           instead of putting them under a new top level suite.
                           Example: rebot --merge orig.xml rerun.xml
+    --processes count     Use the given number of processes to make processing
+                          faster. Outputs are read in parallel in worker
+                          processes, at most one per CPU, but only if log and
+                          output files are not created. Long strings in large
+                          log and report files are compressed in parallel.
+                          On platforms supporting forking processes, output,
+                          xunit, log and report files are written
+                          concurrently. Results are combined in the order the
+                          outputs are given. Default is 1, meaning everything
+                          is done in the main process.
+                          Example: rebot --processes 8 --log NONE outputs/*.xml
+    --compressionlevel level  Compression level from 0 to 9 to use with long
+                          strings in log and report files. Lower levels are
+                          faster but create bigger files. Default is 9.
+    --lowmemory           Read outputs test by test without keeping all tests
+                          in memory. Outputs are read twice and only report
+                          and xunit files can be created. Requires disabling
+                          the log file and does not support --merge,
+                          --prerebotmodifier or options selecting tests.
+                          Example: rebot --lowmemory --log NONE output.xml
  -N --name name           Set the name of the top level suite.
  -D --doc documentation   Set the documentation of the top level suite.
                           Simple formatting is supported (e.g. *bold*). If
@@ -129,6 +151,8 @@ Options
                           specified. Given path, similarly as paths given to
                           --log, --report and --xunit, is relative to
                           --outputdir unless given as an absolute path.
+                          The output is compressed if the path has a `.gz` or
+                          `.xz` suffix similarly as with Robot.
     --legacyoutput        Create XML output file in format compatible with
                           Robot Framework 6.x and earlier.
  -l --log file            HTML log file. Can be disabled by giving a special
@@ -138,6 +162,14 @@ Options
                           similarly as --log. Default: report.html
  -x --xunit file          xUnit compatible result file. Not created unless this
                           option is specified.
+    --profile file        Keyword profile with call counts, total times and
+                          self times of keywords calculated from the start
+                          and end times in the outputs. Written as CSV if the
+                          file has a `.csv` extension and as JSON otherwise.
+                          Collapsed stacks for flame graph tools are written
+                          to a file with the same base name and a `.folded`
+                          extension. Not created unless this option is
+                          specified.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -146,6 +178,13 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --searchindex size    Add an index for finding words in suite, test and
+                          keyword names, keyword arguments and messages to the
+                          log file. The size is the maximum number of indexed
+                          word occurrences and failures. Words in items after
+                          the limit is reached are not found. The default
+                          is 0, meaning no index is created.
+                          Example: --searchindex 1000000
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Log`.
     --reporttitle title   Title for the generated report file. The default
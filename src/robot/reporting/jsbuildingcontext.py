@@ -14,30 +14,40 @@
 #  limitations under the License.
 
 from datetime import datetime
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
 from robot.output.loggerhelper import LEVELS
 from robot.utils import attribute_escape, get_link_path, html_escape, safe_str
 
 from .expandkeywordmatcher import ExpandKeywordMatcher
+from .searchindex import SearchIndexBuilder
 from .stringcache import StringCache
 
 
 class JsBuildingContext:
 
     def __init__(self, log_path=None, split_log=False, expand_keywords=None,
-                 prune_input=False):
+                 prune_input=False, processes=1, compression_level=9,
+                 test_page_size=1000, search_index_size=0):
         self._log_dir = self._get_log_dir(log_path)
         self._split_log = split_log
         self._prune_input = prune_input
-        self._strings = self._top_level_strings = StringCache()
+        self._processes = processes
+        self._compression_level = compression_level
+        self._strings = self._top_level_strings = StringCache(compression_level)
+        self._parent_strings = []
+        # Tests of suites having more tests than this are split into pages.
+        self.test_page_size = test_page_size if split_log else None
         self.basemillis = None
         self.split_results = []
         self.min_level = 'NONE'
         self._msg_links = {}
         self._expand_matcher = ExpandKeywordMatcher(expand_keywords) \
             if expand_keywords else None
+        self._search_index = SearchIndexBuilder(search_index_size) \
+            if search_index_size else None
+        self._not_indexed = nullcontext()
 
     def _get_log_dir(self, log_path):
         # log_path can be a custom object in unit tests
@@ -66,9 +76,13 @@ class JsBuildingContext:
             if self._log_dir and source and source.exists() else ''
         return self.string(rel_source)
 
-    def timestamp(self, ts: datetime) -> 'int|None':
+    def timestamp(self, ts: 'datetime|str|None') -> 'int|None':
         if not ts:
             return None
+        # Times read from outputs may still be strings. They are converted
+        # directly without storing the `datetime` to the result model.
+        if isinstance(ts, str):
+            ts = datetime.fromisoformat(ts)
         millis = round(ts.timestamp() * 1000)
         if self.basemillis is None:
             self.basemillis = millis
@@ -90,6 +104,19 @@ class JsBuildingContext:
     def expand_keywords(self):
         return self._expand_matcher.matched_ids if self._expand_matcher else None
 
+    def indexed(self, type, texts=(), failed=False):
+        if self._search_index is None:
+            return self._not_indexed
+        return self._search_index.item(type, texts, failed)
+
+    def index_message(self, msg):
+        if self._search_index is not None:
+            self._search_index.add(msg.message, msg.html)
+
+    @property
+    def search_index(self):
+        return self._search_index.index if self._search_index else None
+
     def link(self, msg):
         return self._msg_links.get(self._link_key(msg))
 
@@ -98,17 +125,18 @@ class JsBuildingContext:
 
     @property
     def strings(self):
-        return self._strings.dump()
+        return self._strings.dump(self._processes)
 
     def start_splitting_if_needed(self, split=False):
         if self._split_log and split:
-            self._strings = StringCache()
+            self._parent_strings.append(self._strings)
+            self._strings = StringCache(self._compression_level)
             return True
         return False
 
     def end_splitting(self, model):
         self.split_results.append((model, self.strings))
-        self._strings = self._top_level_strings
+        self._strings = self._parent_strings.pop()
         return len(self.split_results)
 
     @contextmanager
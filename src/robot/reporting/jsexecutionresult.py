@@ -21,27 +21,78 @@ from .stringcache import StringIndex
 class JsExecutionResult:
 
     def __init__(self, suite, statistics, errors, strings, basemillis=None,
-                 split_results=None, min_level=None, expand_keywords=None):
+                 split_results=None, min_level=None, expand_keywords=None,
+                 search_index=None):
         self.suite = suite
         self.strings = strings
         self.min_level = min_level
-        self.data = self._get_data(statistics, errors, basemillis or 0, expand_keywords)
+        self.data = self._get_data(statistics, errors, basemillis or 0, expand_keywords,
+                                   search_index)
         self.split_results = split_results or []
 
-    def _get_data(self, statistics, errors, basemillis, expand_keywords):
+    def _get_data(self, statistics, errors, basemillis, expand_keywords,
+                  search_index):
         return {'stats': statistics,
                 'errors': errors,
                 'baseMillis': basemillis,
                 'generated': int(time.time() * 1000) - basemillis,
-                'expand_keywords': expand_keywords}
+                'expand_keywords': expand_keywords,
+                'search_index': search_index}
 
     def remove_data_not_needed_in_report(self):
         self.data.pop('errors')
+        self.data.pop('search_index')
+        if self.split_results:
+            merger = _TestPageMerger(self.split_results)
+            self.suite, self.strings = merger.merge(self.suite, self.strings)
         remover = _KeywordRemover()
         self.suite = remover.remove_keywords(self.suite)
         self.suite, self.strings = remover.remove_unused_strings(self.suite, self.strings)
 
 
+class _TestPageMerger:
+    """Merges tests written to separate page files back to the suite model.
+
+    Strings used by pages are added to the top level strings and string
+    indices in merged tests updated accordingly.
+    """
+
+    def __init__(self, split_results):
+        self._split_results = split_results
+        self._strings = []
+        self._indices = {}
+
+    def merge(self, suite, strings):
+        self._strings = list(strings)
+        self._indices = {string: index for index, string in enumerate(strings)}
+        suite = self._merge_suite(suite)
+        return suite, tuple(self._strings)
+
+    def _merge_suite(self, suite):
+        tests = suite[7]
+        if tests and not isinstance(tests[0], tuple):
+            tests = tuple(test for page in tests for test in self._get_page(page))
+        return suite[:6] + (tuple(self._merge_suite(s) for s in suite[6]),
+                            tests) + suite[8:]
+
+    def _get_page(self, index):
+        tests, strings = self._split_results[index - 1]
+        remap = [self._add_string(string) for string in strings]
+        return self._remap_string_indices(tests, remap)
+
+    def _add_string(self, string):
+        if string not in self._indices:
+            self._indices[string] = len(self._strings)
+            self._strings.append(string)
+        return StringIndex(self._indices[string])
+
+    def _remap_string_indices(self, model, remap):
+        return tuple(remap[item] if isinstance(item, StringIndex) else
+                     self._remap_string_indices(item, remap)
+                     if isinstance(item, tuple) else item
+                     for item in model)
+
+
 class _KeywordRemover:
 
     def remove_keywords(self, suite):
@@ -31,9 +31,12 @@ KEYWORD_TYPES = {'KEYWORD': 0, 'SETUP': 1, 'TEARDOWN': 2,
 class JsModelBuilder:
 
     def __init__(self, log_path=None, split_log=False, expand_keywords=None,
-                 prune_input_to_save_memory=False):
+                 prune_input_to_save_memory=False, processes=1, compression_level=9,
+                 test_page_size=1000, search_index_size=0):
         self._context = JsBuildingContext(log_path, split_log, expand_keywords,
-                                          prune_input_to_save_memory)
+                                          prune_input_to_save_memory, processes,
+                                          compression_level, test_page_size,
+                                          search_index_size)
 
     def build_from(self, result_from_xml):
         # Statistics must be build first because building suite may prune input.
@@ -45,9 +48,38 @@ class JsModelBuilder:
             basemillis=self._context.basemillis,
             split_results=self._context.split_results,
             min_level=self._context.min_level,
-            expand_keywords=self._context.expand_keywords
+            expand_keywords=self._context.expand_keywords,
+            search_index=self._context.search_index
         )
 
+    def build_from_stream(self, stream):
+        """Builds a report model based on a :class:`~robot.result.ResultStream`.
+
+        Tests are read from the stream only once. Statistics and the suite
+        model are built at the same time and possible other
+        :attr:`~robot.result.ResultStream.visitors` get tests during the same
+        pass. The model contains only data needed in reports, so calling
+        :meth:`~.JsExecutionResult.remove_data_not_needed_in_report` with it
+        is not needed.
+        """
+        suite_builder = StreamedSuiteBuilder(self._context)
+        stream.visitors.append(suite_builder)
+        try:
+            statistics = StatisticsBuilder().build(stream.statistics)
+        finally:
+            stream.visitors.remove(suite_builder)
+        result = JsExecutionResult(
+            statistics=statistics,
+            suite=suite_builder.model,
+            errors=None,
+            strings=self._context.strings,
+            basemillis=self._context.basemillis,
+            min_level=self._context.min_level
+        )
+        result.data.pop('errors')
+        result.data.pop('search_index')
+        return result
+
 
 class Builder:
     robot_note = re.compile('<span class="robot-note">(.*)</span>')
@@ -59,9 +91,14 @@ class Builder:
         self._timestamp = self._context.timestamp
 
     def _get_status(self, item, note_only=False):
+        # Times read from outputs are used directly as strings and floats so
+        # that `datetime` and `timedelta` objects are not stored to the model.
+        elapsed = item._elapsed_time
+        if not isinstance(elapsed, float):
+            elapsed = item.elapsed_time.total_seconds()
         model = (STATUSES[item.status],
-                 self._timestamp(item.start_time),
-                 round(item.elapsed_time.total_seconds() * 1000))
+                 self._timestamp(item._start_time or item.start_time),
+                 round(elapsed * 1000))
         msg = item.message
         if not msg:
             return model
@@ -97,7 +134,8 @@ class SuiteBuilder(Builder):
         self._build_body_item = BodyItemBuilder(context).build
 
     def build(self, suite):
-        with self._context.prune_input(suite.tests, suite.suites):
+        with self._context.prune_input(suite.tests, suite.suites), \
+                self._context.indexed('s', [suite.name]):
             stats = self._get_statistics(suite)  # Must be done before pruning
             fixture = []
             if suite.has_setup:
@@ -111,10 +149,24 @@ class SuiteBuilder(Builder):
                     tuple(self._yield_metadata(suite)),
                     self._get_status(suite),
                     tuple(self._build_suite(s) for s in suite.suites),
-                    tuple(self._build_test(t) for t in suite.tests),
+                    self._build_tests(suite.tests),
                     tuple(self._build_body_item(kw, split=True) for kw in fixture),
                     stats)
 
+    def _build_tests(self, tests):
+        # With split logs, tests of big suites are written to separate page
+        # files and the model contains only indices of these files.
+        size = self._context.test_page_size
+        if not size or len(tests) <= size:
+            return tuple(self._build_test(t) for t in tests)
+        return tuple(self._build_test_page(tests, start, min(start + size, len(tests)))
+                     for start in range(0, len(tests), size))
+
+    def _build_test_page(self, tests, start, end):
+        self._context.start_splitting_if_needed(split=True)
+        page = tuple(self._build_test(tests[index]) for index in range(start, end))
+        return self._context.end_splitting(page)
+
     def _yield_metadata(self, suite):
         for name, value in suite.metadata.items():
             yield self._string(name)
@@ -125,6 +177,43 @@ class SuiteBuilder(Builder):
         return (stats.total, stats.passed, stats.failed, stats.skipped)
 
 
+class StreamedSuiteBuilder(SuiteBuilder):
+    """Builds suites incrementally when tests are read from a stream.
+
+    Strings are added in the same order as with :class:`SuiteBuilder` and
+    suite statistics are got from :class:`~robot.result.StreamedTestSuite`
+    objects. Suite setups and teardowns are not included.
+    """
+
+    def __init__(self, context):
+        super().__init__(context)
+        self._stack = []
+        self.model = None
+
+    def start_suite(self, suite):
+        # Items preceding child suites and tests are built first to keep
+        # string indices and `basemillis` same as when building a full model.
+        start = (self._string(suite.name, attr=True),
+                 self._string(suite.source),
+                 self._context.relative_source(suite.source),
+                 self._html(suite.doc),
+                 tuple(self._yield_metadata(suite)),
+                 self._get_status(suite))
+        self._stack.append((start, [], []))
+
+    def visit_test(self, test):
+        self._stack[-1][2].append(self._build_test(test))
+
+    def end_suite(self, suite):
+        start, suites, tests = self._stack.pop()
+        model = start + (tuple(suites), tuple(tests), (),
+                         self._get_statistics(suite))
+        if self._stack:
+            self._stack[-1][1].append(model)
+        else:
+            self.model = model
+
+
 class TestBuilder(Builder):
 
     def __init__(self, context):
@@ -133,7 +222,8 @@ class TestBuilder(Builder):
 
     def build(self, test):
         body = self._get_body_items(test)
-        with self._context.prune_input(test.body):
+        with self._context.prune_input(test.body), \
+                self._context.indexed('t', [test.name, *test.tags], test.failed):
             return (self._string(test.name, attr=True),
                     self._string(test.timeout),
                     self._html(test.doc),
@@ -182,16 +272,17 @@ class BodyItemBuilder(Builder):
                tags='', body=None, split=False):
         if body is None:
             body = item.body.flatten()
-        return (KEYWORD_TYPES[item.type],
-                self._string(name, attr=True),
-                self._string(owner, attr=True),
-                self._string(timeout),
-                self._html(doc),
-                self._string(args),
-                self._string(assign),
-                self._string(tags),
-                self._get_status(item, note_only=True),
-                self._build_body(body, split))
+        with self._context.indexed('k', (name, owner, args), item.failed):
+            return (KEYWORD_TYPES[item.type],
+                    self._string(name, attr=True),
+                    self._string(owner, attr=True),
+                    self._string(timeout),
+                    self._html(doc),
+                    self._string(args),
+                    self._string(assign),
+                    self._string(tags),
+                    self._get_status(item, note_only=True),
+                    self._build_body(body, split))
 
 
 class MessageBuilder(Builder):
@@ -200,6 +291,7 @@ class MessageBuilder(Builder):
         if msg.level in ('WARN', 'ERROR'):
             self._context.create_link_target(msg)
         self._context.message_level(msg.level)
+        self._context.index_message(msg)
         return self._build(msg)
 
     def _build(self, msg):
@@ -13,15 +13,20 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
+from multiprocessing import get_all_start_methods, get_context
+
 from robot.conf import RebotSettings
 from robot.errors import DataError
 from robot.model import ModelModifier
 from robot.output import LOGGER
-from robot.result import ExecutionResult, Result
+from robot.output.profiler import Profiler
+from robot.result import ExecutionResult, Result, ResultStream
+from robot.utils import get_error_message, XmlWriter
 
 from .jsmodelbuilders import JsModelBuilder
 from .logreportwriters import LogWriter, ReportWriter
-from .xunitwriter import XUnitWriter
+from .xunitwriter import XUnitFileWriter, XUnitWriter
 
 
 class ResultWriter:
@@ -52,34 +57,113 @@ class ResultWriter:
             are not given.
         """
         settings = settings or RebotSettings(options)
+        if settings.low_memory:
+            return self._write_streamed_results(settings)
         results = Results(settings, *self._sources)
-        if settings.output:
-            self._write_output(results.result, settings.output, settings.legacy_output)
-        if settings.xunit:
-            self._write_xunit(results.result, settings.xunit)
-        if settings.log:
-            config = dict(settings.log_config,
-                          minLevel=results.js_result.min_level)
-            self._write_log(results.js_result, settings.log, config)
-        if settings.report:
-            results.js_result.remove_data_not_needed_in_report()
-            self._write_report(results.js_result, settings.report,
-                               settings.report_config)
+        file_writer = self._get_file_writer(settings)
+        try:
+            if settings.output:
+                self._write_output(results.result, settings.output,
+                                   settings.legacy_output, file_writer)
+            if settings.xunit:
+                self._write_xunit(results.result, settings.xunit, file_writer)
+            if settings.profile:
+                self._write_profile(results.result, settings.profile, file_writer)
+            if settings.log:
+                config = dict(settings.log_config,
+                              minLevel=results.js_result.min_level)
+                self._write_log(results.js_result, settings.log, config, file_writer)
+            if settings.report:
+                # The same model is used with the log and with the report.
+                # Data not needed in the report is removed when writing it.
+                self._write_report(results.js_result, settings.report,
+                                   settings.report_config, file_writer,
+                                   remove_log_data=True)
+        finally:
+            file_writer.close()
         return results.return_code
 
-    def _write_output(self, result, path, legacy_output=False):
-        self._write('Output', result.save, path, legacy_output)
+    def _get_file_writer(self, settings):
+        if settings.processes > 1 and ConcurrentFileWriter.is_supported():
+            return ConcurrentFileWriter()
+        return FileWriter()
+
+    def _write_streamed_results(self, settings):
+        self._validate_streamed_results(settings)
+        stream = ResultStream(*self._sources, rpa=settings.rpa)
+        if settings.rpa is None:
+            settings.rpa = stream.rpa
+        stream.configure(settings.status_rc, settings.suite_config,
+                         settings.statistics_config)
+        xunit = self._open_xunit(settings.xunit) if settings.xunit else None
+        if xunit:
+            stream.visitors.append(xunit)
+        if settings.report:
+            builder = JsModelBuilder(processes=settings.processes,
+                                     compression_level=settings.compression_level)
+            js_result = builder.build_from_stream(stream)
+        elif xunit:
+            stream.visit(xunit)
+        if xunit:
+            xunit.end_result(stream.result)
+            LOGGER.result_file('XUnit', settings.xunit)
+        if settings.report:
+            self._write_report(js_result, settings.report, settings.report_config)
+        return stream.return_code
+
+    def _validate_streamed_results(self, settings):
+        if any(isinstance(source, Result) for source in self._sources):
+            raise DataError('Result objects cannot be used with --lowmemory.')
+        for name, value in [('log', settings.log), ('output', settings.output),
+                            ('profile', settings.profile)]:
+            if value:
+                raise DataError(f"Creating {name} file is not supported when "
+                                f"using --lowmemory. Use '--{name} NONE'.")
+        if settings.merge:
+            raise DataError('--merge cannot be used with --lowmemory.')
+        if settings.pre_rebot_modifiers:
+            raise DataError('--prerebotmodifier cannot be used with --lowmemory.')
+
+    def _open_xunit(self, path):
+        try:
+            return XUnitFileWriter(XmlWriter(path, usage='xunit'))
+        except DataError as err:
+            LOGGER.error(err.message)
+            return None
+
+    def _write_output(self, result, path, legacy_output=False, file_writer=None):
+        self._write('Output', result.save, path, legacy_output,
+                    file_writer=file_writer)
+
+    def _write_xunit(self, result, path, file_writer=None):
+        self._write('XUnit', XUnitWriter(result).write, path,
+                    file_writer=file_writer)
+
+    def _write_profile(self, result, path, file_writer=None):
+        def write(path):
+            Profiler.from_result(result).write(path)
+        self._write('Profile', write, path, file_writer=file_writer)
+
+    def _write_log(self, js_result, path, config, file_writer=None):
+        self._write('Log', LogWriter(js_result).write, path, config,
+                    file_writer=file_writer)
 
-    def _write_xunit(self, result, path):
-        self._write('XUnit', XUnitWriter(result).write, path)
+    def _write_report(self, js_result, path, config, file_writer=None,
+                      remove_log_data=False):
+        def write(path, config):
+            if remove_log_data:
+                js_result.remove_data_not_needed_in_report()
+            ReportWriter(js_result).write(path, config)
+        self._write('Report', write, path, config, file_writer=file_writer)
 
-    def _write_log(self, js_result, path, config):
-        self._write('Log', LogWriter(js_result).write, path, config)
+    def _write(self, name, writer, path, *args, file_writer=None):
+        (file_writer or FileWriter()).write(name, writer, path, *args)
 
-    def _write_report(self, js_result, path, config):
-        self._write('Report', ReportWriter(js_result).write, path, config)
 
-    def _write(self, name, writer, path, *args):
+class FileWriter:
+    """Writes result files one by one in the current process."""
+
+    def write(self, name, writer, path, *args):
         try:
             writer(path, *args)
         except DataError as err:
@@ -87,6 +171,62 @@ class ResultWriter:
         else:
             LOGGER.result_file(name, path)
 
+    def close(self):
+        pass
+
+
+class ConcurrentFileWriter(FileWriter):
+    """Writes result files concurrently in forked child processes.
+
+    Forked processes get the result models without them needing to be
+    serialized. The main process can thus continue, for example, building
+    the log and report model while the output file is being written.
+    Written files and possible errors are reported in the original order
+    when :meth:`close` is called.
+    """
+
+    def __init__(self):
+        self._context = get_context('fork')
+        self._running = []
+
+    @classmethod
+    def is_supported(cls):
+        # Forking is not safe on macOS even though it is available.
+        return 'fork' in get_all_start_methods() and sys.platform != 'darwin'
+
+    def write(self, name, writer, path, *args):
+        reader, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(target=self._write_in_child,
+                                        args=(sender, writer, path, args))
+        process.start()
+        sender.close()
+        self._running.append((name, path, process, reader))
+
+    def _write_in_child(self, sender, writer, path, args):
+        try:
+            writer(path, *args)
+        except DataError as err:
+            sender.send(err.message)
+        except Exception:
+            sender.send(get_error_message())
+        else:
+            sender.send(None)
+        finally:
+            sender.close()
+
+    def close(self):
+        for name, path, process, reader in self._running:
+            try:
+                error = reader.recv()
+            except EOFError:
+                error = f"Writing {name.lower()} file '{path}' failed."
+            process.join()
+            if error:
+                LOGGER.error(error)
+            else:
+                LOGGER.result_file(name, path)
+        self._running = []
+
 
 class Results:
 
@@ -106,11 +246,20 @@ class Results:
     @property
     def result(self):
         if self._result is None:
-            include_keywords = bool(self._settings.log or self._settings.output)
+            include_keywords = bool(self._settings.log or self._settings.output
+                                    or self._settings.profile)
             flattened = self._settings.flatten_keywords
+            # Keywords are removed and messages filtered already when parsing
+            # outputs unless pre-Rebot modifiers need to see them first.
+            process = not self._settings.pre_rebot_modifiers
             self._result = ExecutionResult(include_keywords=include_keywords,
                                            flattened_keywords=flattened,
+                                           remove_keywords=self._settings.remove_keywords
+                                           if process else None,
+                                           log_level=self._settings.log_level
+                                           if process else None,
                                            merge=self._settings.merge,
+                                           processes=self._settings.processes,
                                            rpa=self._settings.rpa,
                                            *self._sources)
             if self._settings.rpa is None:
@@ -132,7 +281,10 @@ class Results:
             builder = JsModelBuilder(log_path=self._settings.log,
                                      split_log=self._settings.split_log,
                                      expand_keywords=self._settings.expand_keywords,
-                                     prune_input_to_save_memory=self._prune)
+                                     prune_input_to_save_memory=self._prune,
+                                     processes=self._settings.processes,
+                                     compression_level=self._settings.compression_level,
+                                     search_index_size=self._settings.search_index_size)
             self._js_result = builder.build_from(self.result)
             if self._prune:
                 self._result = None
@@ -0,0 +1,112 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import re
+from contextlib import contextmanager
+
+
+class SearchIndexBuilder:
+    """Builds an inverted index from words to suites, tests and keywords.
+
+    Item ids are tracked while the log model is built so that the possibly
+    expensive ``id`` property of model objects does not need to be used.
+    Ids are stored as pairs of the index of the parent id and the last part
+    of the id. Only items having indexed words, failed items, and their
+    parents are stored.
+
+    The index size is limited by ``max_size``. It is the maximum number of
+    word-to-item mappings and failures the index can contain. Later items
+    are ignored when the limit is reached and the index is marked truncated.
+    """
+    _words = re.compile(r'\w{3,}')
+    _html_tags = re.compile(r'<[^>]*>')
+    max_word_length = 30
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._size = 0
+        self._ids = []
+        self._tokens = {}
+        self._failures = []
+        # Items being built as lists [type, part, id index, child counts].
+        self._stack = []
+        self.truncated = False
+
+    @contextmanager
+    def item(self, type: str, texts=(), failed=False):
+        """Adds suite (``s``), test (``t``) or keyword (``k``) to the index.
+
+        Failed tests and suite setups and teardowns are stored as failures.
+        """
+        if self._stack:
+            parent = self._stack[-1]
+            count = parent[3][type] = parent[3].get(type, 0) + 1
+            failed = failed and (type == 't' or parent[0] == 's')
+        else:
+            count = 1
+        self._stack.append([type, f'{type}{count}', None, {}])
+        try:
+            if failed:
+                self._add_failure()
+            for text in texts:
+                self.add(text)
+            yield
+        finally:
+            self._stack.pop()
+
+    def add(self, text: str, html: bool = False):
+        """Adds words in the given text to the current item."""
+        if not text or self.truncated:
+            return
+        if html:
+            text = self._html_tags.sub(' ', text)
+        # Dictionary instead of a set keeps the order when the index is truncated.
+        words = dict.fromkeys(word[:self.max_word_length]
+                              for word in self._words.findall(text.lower()))
+        if not words:
+            return
+        index = self._get_id_index()
+        for word in words:
+            items = self._tokens.setdefault(word, [])
+            if not items or items[-1] != index:
+                if not self._increment_size():
+                    return
+                items.append(index)
+
+    def _add_failure(self):
+        if self._increment_size():
+            self._failures.append(self._get_id_index())
+
+    def _increment_size(self):
+        if self._size >= self.max_size:
+            self.truncated = True
+            return False
+        self._size += 1
+        return True
+
+    def _get_id_index(self, depth=-1):
+        item = self._stack[depth]
+        if item[2] is None:
+            parent = self._get_id_index(depth - 1) if len(self._stack) + depth else -1
+            item[2] = len(self._ids) // 2
+            self._ids.extend((parent, item[1]))
+        return item[2]
+
+    @property
+    def index(self):
+        return {'ids': tuple(self._ids),
+                'tokens': {token: tuple(items) for token, items in self._tokens.items()},
+                'failures': tuple(self._failures),
+                'truncated': self.truncated}
@@ -13,6 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+
 from robot.utils import compress_text, html_format
 
 
@@ -24,9 +28,14 @@ class StringCache:
     empty = StringIndex(0)
     _compress_threshold = 80
     _use_compressed_threshold = 1.1
+    # Strings are encoded in worker processes in batches of this many
+    # characters if there are more characters than the parallel threshold.
+    _batch_size = 2 * 1024 * 1024
+    _parallel_threshold = 8 * _batch_size
 
-    def __init__(self):
+    def __init__(self, compression_level=9):
         self._cache = {('', False): self.empty}
+        self._compression_level = compression_level
 
     def add(self, text, html=False):
         if not text:
@@ -36,15 +45,56 @@ class StringCache:
             self._cache[key] = StringIndex(len(self._cache))
         return self._cache[key]
 
-    def dump(self):
-        return tuple(self._encode(text, html) for text, html in self._cache)
+    def dump(self, processes=1):
+        """Returns all strings encoded.
+
+        Long strings are compressed, which is slow with large outputs. If
+        ``processes`` is larger than one and there is enough data, strings
+        are encoded in batches in the given number of worker processes.
+        """
+        strings = list(self._cache)
+        if processes > 1:
+            batches = self._get_batches(strings)
+            if len(batches) > 1:
+                return self._dump_in_workers(batches, processes)
+        return tuple(self._encode(text, html) for text, html in strings)
+
+    def _get_batches(self, strings):
+        batches = []
+        start = size = total = 0
+        for index, (text, _) in enumerate(strings, start=1):
+            size += len(text)
+            if size >= self._batch_size:
+                batches.append(strings[start:index])
+                total += size
+                start, size = index, 0
+        if start < len(strings):
+            batches.append(strings[start:])
+            total += size
+        return batches if total > self._parallel_threshold else [strings]
+
+    def _dump_in_workers(self, batches, processes):
+        encode = partial(encode_strings, compression_level=self._compression_level)
+        with ProcessPoolExecutor(min(processes, len(batches)),
+                                 mp_context=get_context('spawn')) as executor:
+            return tuple(string for batch in executor.map(encode, batches)
+                         for string in batch)
 
     def _encode(self, text, html=False):
         if html:
             text = html_format(text)
         if len(text) > self._compress_threshold:
-            compressed = compress_text(text)
+            compressed = compress_text(text, self._compression_level)
             if len(compressed) * self._use_compressed_threshold < len(text):
                 return compressed
         # Strings starting with '*' are raw, others are compressed.
         return '*' + text
+
+
+def encode_strings(strings, compression_level=9):
+    """Encodes ``(text, html)`` pairs like :meth:`StringCache.dump`.
+
+    Used in worker processes.
+    """
+    encode = StringCache(compression_level)._encode
+    return [encode(text, html) for text, html in strings]
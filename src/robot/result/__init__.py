@@ -41,5 +41,7 @@ from .executionresult import Result
 from .model import (Break, Continue, Error, For, ForIteration, Group, If, IfBranch, Keyword,
                     Message, Return, TestCase, TestSuite, Try, TryBranch, Var, While,
                     WhileIteration)
+from .outputindex import OutputIndex, OutputIndexBuilder
 from .resultbuilder import ExecutionResult, ExecutionResultBuilder
+from .resultstream import ResultStream, StreamedTestSuite
 from .visitor import ResultVisitor
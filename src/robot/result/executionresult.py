@@ -19,7 +19,7 @@ from typing import overload, TextIO
 
 from robot.errors import DataError
 from robot.model import Statistics
-from robot.utils import JsonDumper, JsonLoader, setter
+from robot.utils import JsonDumper, open_file, setter, strip_compression_suffix
 from robot.version import get_full_version
 
 from .executionerrors import ExecutionErrors
@@ -46,7 +46,7 @@ def is_json_source(source) -> bool:
         path = Path(source.name)
     else:
         return False
-    return bool(path and path.suffix.lower() == '.json')
+    return bool(path and strip_compression_suffix(path).suffix.lower() == '.json')
 
 
 class Result:
@@ -149,7 +149,10 @@ class Result:
 
     @classmethod
     def from_json(cls, source: 'str|bytes|TextIO|Path',
-                  rpa: 'bool|None' = None) -> 'Result':
+                  rpa: 'bool|None' = None, include_keywords: bool = True,
+                  flattened_keywords: 'list[str]|None' = None,
+                  remove_keywords: 'list[str]|None' = None,
+                  log_level: 'str|None' = None) -> 'Result':
         """Construct a result object from JSON data.
 
         The data is given as the ``source`` parameter. It can be:
@@ -171,34 +174,29 @@ class Result:
         The ``rpa`` argument can be used to override the RPA mode. The mode is
         got from the data by default.
 
-        New in Robot Framework 7.2.
+        The data is read incrementally so that the whole JSON document does not
+        need to be loaded into memory. ``include_keywords``,
+        ``flattened_keywords``, ``remove_keywords`` and ``log_level`` work
+        the same way as with XML outputs and further reduce memory usage.
+        See :class:`~.jsonbuilder.JsonResultBuilder` for more details.
+
+        New in Robot Framework 7.2. ``include_keywords``, ``flattened_keywords``,
+        ``remove_keywords`` and ``log_level`` are new in Robot Framework 7.3.
         """
+        from .jsonbuilder import JsonResultBuilder
+
+        builder = JsonResultBuilder(source, include_keywords, flattened_keywords,
+                                    remove_keywords, log_level)
         try:
-            data = JsonLoader().load(source)
+            result = builder.build(Result(rpa=rpa))
         except (TypeError, ValueError) as err:
             raise DataError(f'Loading JSON data failed: {err}')
-        if 'suite' in data:
-            result = cls._from_full_json(data)
-        else:
-            result = cls._from_suite_json(data)
-        result.rpa = data.get('rpa', False) if rpa is None else rpa
         if isinstance(source, Path):
             result.source = source
         elif isinstance(source, str) and source[0] != '{' and Path(source).exists():
             result.source = Path(source)
         return result
 
-    @classmethod
-    def _from_full_json(cls, data) -> 'Result':
-        return Result(suite=TestSuite.from_dict(data['suite']),
-                      errors=ExecutionErrors(data.get('errors')),
-                      generator=data.get('generator'),
-                      generation_time=data.get('generated'))
-
-    @classmethod
-    def _from_suite_json(cls, data) -> 'Result':
-        return Result(suite=TestSuite.from_dict(data))
-
     @overload
     def to_json(self, file: None = None, *,
                 include_statistics: bool = True,
@@ -225,7 +223,8 @@ class Result:
         - ``None`` (default) to return the data as a string,
         - an open file object where to write the data to, or
         - a path (``pathlib.Path`` or string) to a file where to write
-          the data using UTF-8 encoding.
+          the data using UTF-8 encoding. The file is compressed if the path
+          has a ``.gz`` or ``.xz`` suffix.
 
         The ``include_statistics`` controls including statistics information
         in the resulting JSON data. Statistics are not needed if the serialized
@@ -247,8 +246,12 @@ class Result:
         if include_statistics:
             data['statistics'] = self.statistics.to_dict()
         data['errors'] = self.errors.messages.to_dicts()
-        return JsonDumper(ensure_ascii=ensure_ascii, indent=indent,
-                          separators=separators).dump(data, file)
+        dumper = JsonDumper(ensure_ascii=ensure_ascii, indent=indent,
+                            separators=separators)
+        if isinstance(file, (Path, str)):
+            with open_file(file, 'w', encoding='UTF-8', compress=True) as output:
+                return dumper.dump(data, output)
+        return dumper.dump(data, file)
 
     def save(self, target=None, legacy_output=False):
         """Save results as XML or JSON file.
@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 from robot.errors import DataError
-from robot.model import TagPatterns, SuiteVisitor
+from robot.model import BodyItem, TagPatterns, SuiteVisitor
 from robot.utils import html_escape, MultiMatcher
 
 from .model import Keyword
@@ -97,21 +97,78 @@ class FlattenByTagMatcher:
 
 class FlattenByTags(SuiteVisitor):
 
-    def __init__(self, flatten):
+    def __init__(self, flatten, include_tests=True):
         if isinstance(flatten, str):
             flatten = [flatten]
         patterns = [p[4:] for p in flatten if p[:4].lower() == 'tag:']
         self.matcher = TagPatterns(patterns)
+        self.include_tests = include_tests
 
     def start_suite(self, suite):
         return bool(self.matcher)
 
+    def start_test(self, test):
+        return self.include_tests
+
     def start_keyword(self, keyword: Keyword):
         if self.matcher.match(keyword.tags):
             keyword.message = create_flatten_message(keyword.message)
             keyword.body = MessageFinder(keyword).messages
 
 
+class FlattenByNamesAndTypes(SuiteVisitor):
+    """Flattens keywords and control structures based on names and types.
+
+    Results are the same as when XML outputs are flattened during parsing.
+    """
+    _tags = {BodyItem.KEYWORD: 'kw', BodyItem.SETUP: 'kw', BodyItem.TEARDOWN: 'kw',
+             BodyItem.FOR: 'for', BodyItem.WHILE: 'while', BodyItem.ITERATION: 'iter',
+             BodyItem.IF_ELSE_ROOT: 'if', BodyItem.TRY_EXCEPT_ROOT: 'try'}
+
+    def __init__(self, flatten):
+        self.name_matcher = FlattenByNameMatcher(flatten)
+        self.type_matcher = FlattenByTypeMatcher(flatten)
+
+    def start_body_item(self, item):
+        tag = self._tags.get(item.type)
+        if not tag:
+            return None
+        if tag == 'kw':
+            name, owner = item.name or '', item.owner
+        else:
+            name, owner = '', None
+        if (self.name_matcher and self.name_matcher.match(name, owner)
+                or self.type_matcher.match(tag)):
+            self._flatten(item)
+            return False
+        return None
+
+    def _flatten(self, item):
+        # Messages of nested keywords and control structures are preserved.
+        # Other items, such as IF branches and RETURN, are preserved as well,
+        # but they are flattened recursively.
+        item.message = create_flatten_message(item.message)
+        body = []
+        if getattr(item, 'has_setup', False):
+            body.extend(MessageFinder(item.setup).messages)
+            item.setup = None
+        for child in item.body:
+            if child.type == BodyItem.MESSAGE:
+                body.append(child)
+            elif child.type in self._tags:
+                body.extend(MessageFinder(child).messages)
+            else:
+                self._flatten(child)
+                body.append(child)
+        if getattr(item, 'has_teardown', False):
+            body.extend(MessageFinder(item.teardown).messages)
+            item.teardown = None
+        item.body = body
+
+    def __bool__(self):
+        return bool(self.name_matcher or self.type_matcher)
+
+
 class MessageFinder(SuiteVisitor):
 
     def __init__(self, keyword: Keyword):
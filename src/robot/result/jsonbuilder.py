@@ -0,0 +1,378 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import codecs
+import json
+import re
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.model import BodyItem
+from robot.model.modelobject import full_name
+from robot.utils import open_file, type_name
+
+from .executionerrors import ExecutionErrors
+from .flattenkeywordmatcher import FlattenByNamesAndTypes, FlattenByTags
+from .model import TestCase
+from .resultbuilder import TestProcessor
+
+
+class JsonResultBuilder:
+    """Builds :class:`~.executionresult.Result` objects based on JSON outputs.
+
+    The JSON data is read incrementally. Suites are built key by key and
+    tests, as well as suite setups and teardowns, one by one. Only the data
+    of the test being built is kept in memory as dictionaries in addition
+    to the model that is built. Peak memory usage is thus considerably lower
+    than when the whole JSON document is loaded first.
+
+    Instead of using this builder directly, it is recommended to use the
+    :func:`~.resultbuilder.ExecutionResult` factory method or the
+    :meth:`~.executionresult.Result.from_json` method.
+    """
+    _result_keys = {'generator', 'generated', 'rpa', 'statistics', 'errors'}
+    _ignored_suite_keys = {'id', 'body', 'status'}
+    # Same items that are omitted from XML outputs when keywords are excluded.
+    _omitted = {BodyItem.KEYWORD, BodyItem.FOR, BodyItem.WHILE, BodyItem.IF_ELSE_ROOT,
+                BodyItem.TRY_EXCEPT_ROOT}
+    # Values that typically repeat are interned so that all occurrences share
+    # the same string object. Same values are interned as with XML outputs.
+    _interned_values = ('name', 'owner', 'source_name', 'type', 'status', 'level',
+                        'flavor', 'timeout', 'doc')
+    _interned_lists = ('tags', 'args', 'assign')
+
+    def __init__(self, source, include_keywords=True, flattened_keywords=None,
+                 remove_keywords=None, log_level=None):
+        """
+        :param source: JSON data as a string or bytes, a path to a JSON file,
+            or an open file object.
+        :param include_keywords: Controls whether to include keywords and
+            control structures like FOR and IF in the result or not.
+        :param flattened_keywords: List of patterns controlling what keywords
+            and control structures to flatten. See the documentation of
+            the ``--flattenkeywords`` option for more details.
+        :param remove_keywords: List of ``--removekeywords`` options to apply
+            to tests right after they are built.
+        :param log_level: Messages below this level are not included in
+            the result.
+        """
+        self._source = source
+        self._include_keywords = include_keywords
+        self._flattened_keywords = flattened_keywords
+        self._flatten = FlattenByNamesAndTypes(flattened_keywords or []) \
+            if include_keywords else None
+        self._remove_keywords = remove_keywords
+        self._log_level = log_level
+        self._processor = None
+        self._strings = {}
+
+    def build(self, result):
+        """Builds the given ``result`` based on the source.
+
+        The ``result`` is typically empty. If its ``rpa`` is set, it is
+        not overridden with the value in the data.
+        """
+        rpa = result.rpa
+        self._processor = TestProcessor(result, self._flattened_keywords,
+                                        self._remove_keywords, self._log_level)
+        with JsonReader(self._source, object_hook=self._intern) as reader:
+            self._build_result(reader, result)
+        self._strings.clear()
+        if rpa is not None:
+            result.rpa = rpa
+        result.handle_suite_teardown_failures()
+        if self._flattened_keywords:
+            # Tests have already been flattened after they were built.
+            result.suite.visit(FlattenByTags(self._flattened_keywords,
+                                             include_tests=False))
+        if not self._include_keywords:
+            self._remove_suite_fixtures(result.suite)
+        return result
+
+    def _intern(self, data):
+        strings = self._strings
+        for key in self._interned_values:
+            if key in data:
+                value = data[key]
+                if isinstance(value, str):
+                    data[key] = strings.setdefault(value, value)
+        for key in self._interned_lists:
+            if key in data:
+                value = data[key]
+                if isinstance(value, list):
+                    data[key] = [strings.setdefault(v, v) if isinstance(v, str) else v
+                                 for v in value]
+        # Failure messages are typically repeated by parent keywords, but log
+        # messages, that also have a level, are typically unique.
+        if 'message' in data and 'level' not in data:
+            value = data['message']
+            if isinstance(value, str):
+                data['message'] = strings.setdefault(value, value)
+        return data
+
+    def _build_result(self, reader, result):
+        if reader.peek() != '{':
+            data = reader.value()
+            raise TypeError(f'Expected dictionary, got {type_name(data)}.')
+        full = False
+        result_data = {}
+        keys = reader.keys()
+        for key in keys:
+            if key == 'suite':
+                full = True
+                # Generator is needed when tests are processed.
+                result.generator = result_data.get('generator', 'unknown')
+                self._build_suite(reader, result.suite)
+            elif key in self._result_keys:
+                result_data[key] = reader.value()
+            else:
+                self._build_suite(reader, result.suite, keys, key, result_data)
+        if full:
+            result.errors = ExecutionErrors(result_data.get('errors'))
+            result.generator = result_data.get('generator', 'unknown')
+            result.generation_time = result_data.get('generated')
+        result.rpa = result_data.get('rpa', False)
+
+    def _build_suite(self, reader, suite, keys=None, first_key=None, initial=None):
+        # Suite-only data is detected based on the first non-result key.
+        # In that case `keys` is the already started key iterator and
+        # `initial` contains values of possible result level keys.
+        if keys is None:
+            keys = reader.keys()
+        else:
+            self._config_suite(suite, **initial)
+            keys = self._chain(first_key, keys)
+        for key in keys:
+            if key == 'suites':
+                for _ in reader.items():
+                    self._build_suite(reader, suite.suites.create())
+            elif key == 'tests':
+                for _ in reader.items():
+                    suite.tests.append(self._build_test(reader.value()))
+            elif key == 'setup':
+                data = reader.value()
+                if self._include_keywords:
+                    self._config_suite(suite, setup=data)
+                    self._flatten_fixture(suite.setup)
+            elif key == 'teardown':
+                self._config_suite(suite, teardown=reader.value())
+                self._flatten_fixture(suite.teardown)
+            elif key in self._ignored_suite_keys:
+                # Suite status is got from tests and ids from the structure.
+                # Suite body is ignored similarly as with `TestSuite.from_dict`.
+                reader.value()
+            else:
+                self._config_suite(suite, **{key: reader.value()})
+
+    def _config_suite(self, suite, **attributes):
+        try:
+            suite.config(**attributes)
+        except (AttributeError, TypeError) as err:
+            raise DataError(f"Creating '{full_name(suite)}' object from "
+                            f"dictionary failed: {err}")
+
+    def _chain(self, first, rest):
+        yield first
+        yield from rest
+
+    def _build_test(self, data):
+        if not isinstance(data, dict):
+            raise TypeError(f'Expected test to be a dictionary, '
+                            f'got {type_name(data)}.')
+        data.pop('id', None)
+        if not self._include_keywords:
+            data.pop('body', None)
+            data.pop('setup', None)
+            if 'teardown' in data:
+                self._omit_keywords(data['teardown'])
+        test = TestCase.from_dict(data)
+        if self._flatten:
+            test.visit(self._flatten)
+        if self._processor:
+            self._processor.process(test)
+        return test
+
+    def _omit_keywords(self, data):
+        # Teardowns are preserved similarly as when omitting keywords with
+        # XML outputs, but their keywords and control structures are removed.
+        data.pop('setup', None)
+        if 'body' in data:
+            data['body'] = [self._omit_keywords(item) for item in data['body']
+                            if item.get('type', BodyItem.KEYWORD) not in self._omitted]
+        if 'teardown' in data:
+            self._omit_keywords(data['teardown'])
+        return data
+
+    def _flatten_fixture(self, fixture):
+        if self._flatten and fixture:
+            fixture.visit(self._flatten)
+
+    def _remove_suite_fixtures(self, suite):
+        suite.setup = None
+        suite.teardown = None
+        for child in suite.suites:
+            self._remove_suite_fixtures(child)
+
+
+class JsonReader:
+    """Incremental JSON reader.
+
+    Objects and arrays can be iterated using :meth:`keys` and :meth:`items`
+    without reading them fully. Values can be read using :meth:`value`.
+    Data is read from files in chunks and parsing is done using the C
+    accelerated functions in the standard ``json`` module when possible.
+    The optional ``object_hook`` is used with values similarly as with
+    ``json.loads``.
+    """
+    chunk_size = 256 * 1024
+    _whitespace = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, source, object_hook=None):
+        self._source = source
+        self._file = None
+        self._close = False
+        self._decoder = None
+        self._buffer = ''
+        self._position = 0
+        self._offset = 0
+        self._eof = False
+        self._json_decoder = json.JSONDecoder(object_hook=object_hook)
+
+    def __enter__(self):
+        source = self._source
+        if isinstance(source, bytes):
+            source = source.decode(json.detect_encoding(source))
+        if isinstance(source, Path) or (isinstance(source, str)
+                                        and '{' not in source):
+            self._file = open_file(source, encoding='UTF-8')
+            self._close = True
+        elif isinstance(source, str):
+            self._buffer = source
+            self._eof = True
+        elif hasattr(source, 'read'):
+            self._file = source
+        else:
+            raise TypeError(f"Expected string, bytes, path or open file, "
+                            f"got {type_name(source)}.")
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._close:
+            self._file.close()
+
+    def _read(self):
+        if self._eof:
+            return False
+        # Reading at least the size of the unprocessed data makes retrying
+        # to parse values that do not fit into the buffer linear.
+        remaining = len(self._buffer) - self._position
+        data = self._file.read(max(self.chunk_size, remaining))
+        if isinstance(data, bytes):
+            if not self._decoder:
+                self._decoder = codecs.getincrementaldecoder('UTF-8')()
+            data = self._decoder.decode(data, final=not data)
+        if not data:
+            self._eof = True
+            return False
+        self._offset += self._position
+        self._buffer = self._buffer[self._position:] + data
+        self._position = 0
+        return True
+
+    def peek(self):
+        """Returns the next non-whitespace character without consuming it.
+
+        Returns an empty string at the end of the data.
+        """
+        while True:
+            match = self._whitespace.match(self._buffer, self._position)
+            self._position = match.end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                return ''
+
+    def _consume(self, expected):
+        char = self.peek()
+        if char not in expected:
+            expected = ' or '.join(f"'{e}'" for e in expected)
+            self._error(f'Expecting {expected}')
+        self._position += 1
+        return char
+
+    def _error(self, message, position=None):
+        if position is None:
+            position = self._position
+        raise ValueError(f'Invalid JSON data: {message}: '
+                         f'char {self._offset + position}')
+
+    def value(self):
+        """Reads the next value fully."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer,
+                                                           self._position)
+            except json.JSONDecodeError as err:
+                if not self._read():
+                    self._error(err.msg, err.pos)
+            else:
+                # Numbers and literals may continue in the next chunk.
+                if end < len(self._buffer) or not self._read():
+                    self._position = end
+                    return value
+
+    def keys(self):
+        """Iterates over keys of the next object.
+
+        The value of each key must be read before getting the next key.
+        """
+        self._consume('{')
+        if self.peek() == '}':
+            self._position += 1
+            return
+        while True:
+            yield self._key()
+            if self._consume(',}') == '}':
+                return
+
+    def _key(self):
+        if self.peek() != '"':
+            self._error('Expecting property name enclosed in double quotes')
+        while True:
+            try:
+                key, end = json.decoder.scanstring(self._buffer, self._position + 1)
+            except json.JSONDecodeError as err:
+                if not self._read():
+                    self._error(err.msg, err.pos)
+            else:
+                self._position = end
+                self._consume(':')
+                return key
+
+    def items(self):
+        """Iterates over items of the next array.
+
+        Yields ``None`` for each item and the item must be read before
+        getting the next one.
+        """
+        self._consume('[')
+        if self.peek() == ']':
+            self._position += 1
+            return
+        while True:
+            yield None
+            if self._consume(',]') == ']':
+                return
@@ -24,6 +24,7 @@ class Merger(SuiteVisitor):
         self.result = result
         self.current = None
         self.rpa = rpa
+        self._indices = {}
 
     def merge(self, merged):
         self.result.set_execution_mode(merged)
@@ -34,7 +35,7 @@ class Merger(SuiteVisitor):
         if self.current is None:
             old = self._find_root(suite.name)
         else:
-            old = self._find(self.current.suites, suite.name)
+            old = self._get_index(self.current.suites).find(suite.name)
         if old is not None:
             old.start_time = old.end_time = old.elapsed_time = None
             old.doc = suite.doc
@@ -44,7 +45,7 @@ class Merger(SuiteVisitor):
             self.current = old
         else:
             suite.message = self._create_add_message(suite, suite=True)
-            self.current.suites.append(suite)
+            self._get_index(self.current.suites).append(suite)
         return old is not None
 
     def _find_root(self, name):
@@ -54,26 +55,28 @@ class Merger(SuiteVisitor):
                             f"Original suite is '{root.name}' and merged is '{name}'.")
         return root
 
-    def _find(self, items, name):
-        for item in items:
-            if item.name == name:
-                return item
-        return None
+    def _get_index(self, items):
+        # Indices are created lazily when items are searched the first time.
+        # The original result is not otherwise modified during merging.
+        key = id(items)
+        if key not in self._indices:
+            self._indices[key] = NameIndex(items)
+        return self._indices[key]
 
     def end_suite(self, suite):
         self.current = self.current.parent
 
     def visit_test(self, test):
-        old = self._find(self.current.tests, test.name)
+        tests = self._get_index(self.current.tests)
+        old = tests.find(test.name)
         if old is None:
             test.message = self._create_add_message(test)
-            self.current.tests.append(test)
+            tests.append(test)
         elif test.skipped:
             old.message = self._create_skip_message(old, test)
         else:
             test.message = self._create_merge_message(test, old)
-            index = self.current.tests.index(old)
-            self.current.tests[index] = test
+            tests.replace(old, test)
 
     def _create_add_message(self, item, suite=False):
         item_type = 'Suite' if suite else test_or_task('Test', self.rpa)
@@ -130,3 +133,51 @@ class Merger(SuiteVisitor):
         if test.message:
             msg += f'<hr>Original message:\n{self._html(test.message)}'
         return msg
+
+
+class NameIndex:
+    """Maps item names to positions in a suite's ``suites`` or ``tests``.
+
+    If there are multiple items with the same name, the first one is found.
+    Items should be modified only using :meth:`append` and :meth:`replace`.
+    Other modifications are detected only partially: the index is rebuilt
+    if the number of items has changed or if the item found with a name has
+    been renamed. Other renames or replacements, for example, an item being
+    renamed to a name that is searched, are not noticed. :class:`Merger`
+    modifies the original result only using these methods.
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self._positions = {}
+        self._length = 0
+        self._build()
+
+    def _build(self):
+        self._positions.clear()
+        for position, item in enumerate(self.items):
+            self._positions.setdefault(item.name, position)
+        self._length = len(self.items)
+
+    def find(self, name):
+        if len(self.items) != self._length:
+            self._build()
+        position = self._positions.get(name)
+        if position is None:
+            return None
+        item = self.items[position]
+        if item.name != name:
+            self._build()
+            return self.find(name)
+        return item
+
+    def append(self, item):
+        self.items.append(item)
+        self._positions.setdefault(item.name, self._length)
+        self._length += 1
+
+    def replace(self, old, new):
+        position = self._positions[old.name]
+        self.items[position] = new
+        if new.name != old.name:
+            self._build()
@@ -43,7 +43,7 @@ from typing import Literal, Mapping, overload, Sequence, Union, TextIO, TypeVar
 from robot import model
 from robot.model import (BodyItem, create_fixture, DataDict, Tags, TestSuites,
                          TotalStatistics, TotalStatisticsBuilder)
-from robot.utils import setter
+from robot.utils import open_file, setter
 
 from .configurer import SuiteConfigurer
 from .messagefilter import MessageFilter
@@ -107,16 +107,16 @@ class StatusMixin:
 
         New in Robot Framework 6.1. Heavily enhanced in Robot Framework 7.0.
         """
-        if self._start_time:
-            return self._start_time
-        if self._end_time:
-            return self._end_time - self.elapsed_time
+        start_time = self._get_start_time()
+        if start_time:
+            return start_time
+        end_time = self._get_end_time()
+        if end_time:
+            return end_time - self.elapsed_time
         return None
 
     @start_time.setter
     def start_time(self, start_time: 'datetime|str|None'):
-        if isinstance(start_time, str):
-            start_time = datetime.fromisoformat(start_time)
         self._start_time = start_time
 
     @property
@@ -131,16 +131,16 @@ class StatusMixin:
 
         New in Robot Framework 6.1. Heavily enhanced in Robot Framework 7.0.
         """
-        if self._end_time:
-            return self._end_time
-        if self._start_time:
-            return self._start_time + self.elapsed_time
+        end_time = self._get_end_time()
+        if end_time:
+            return end_time
+        start_time = self._get_start_time()
+        if start_time:
+            return start_time + self.elapsed_time
         return None
 
     @end_time.setter
     def end_time(self, end_time: 'datetime|str|None'):
-        if isinstance(end_time, str):
-            end_time = datetime.fromisoformat(end_time)
         self._end_time = end_time
 
     @property
@@ -156,12 +156,34 @@ class StatusMixin:
 
         New in Robot Framework 6.1. Heavily enhanced in Robot Framework 7.0.
         """
-        if self._elapsed_time is not None:
-            return self._elapsed_time
-        if self._start_time and self._end_time:
-            return self._end_time - self._start_time
+        elapsed_time = self._elapsed_time
+        if elapsed_time is not None:
+            if isinstance(elapsed_time, (int, float)):
+                elapsed_time = self._elapsed_time = timedelta(seconds=elapsed_time)
+            return elapsed_time
+        start_time = self._get_start_time()
+        end_time = self._get_end_time()
+        if start_time and end_time:
+            return end_time - start_time
         return self._elapsed_time_from_children()
 
+    @elapsed_time.setter
+    def elapsed_time(self, elapsed_time: 'timedelta|int|float|None'):
+        self._elapsed_time = elapsed_time
+
+    # Times set as strings and numbers, for example, when results are parsed,
+    # are stored as-is and converted only when they are accessed first time.
+
+    def _get_start_time(self) -> 'datetime|None':
+        if isinstance(self._start_time, str):
+            self._start_time = datetime.fromisoformat(self._start_time)
+        return self._start_time
+
+    def _get_end_time(self) -> 'datetime|None':
+        if isinstance(self._end_time, str):
+            self._end_time = datetime.fromisoformat(self._end_time)
+        return self._end_time
+
     def _elapsed_time_from_children(self) -> timedelta:
         elapsed = timedelta()
         for child in self.body:
@@ -173,12 +195,6 @@ class StatusMixin:
             elapsed += self.teardown.elapsed_time
         return elapsed
 
-    @elapsed_time.setter
-    def elapsed_time(self, elapsed_time: 'timedelta|int|float|None'):
-        if isinstance(elapsed_time, (int, float)):
-            elapsed_time = timedelta(seconds=elapsed_time)
-        self._elapsed_time = elapsed_time
-
     @property
     def starttime(self) -> 'str|None':
         """Execution start time as a string or as a ``None`` if not set.
@@ -1205,7 +1221,7 @@ class TestSuite(model.TestSuite[Keyword, TestCase], StatusMixin):
         if output is None:
             output = StringIO()
         elif isinstance(output, (Path, str)):
-            output = open(output, 'w', encoding='UTF-8')
+            output = open_file(output, 'w', encoding='UTF-8', compress=True)
             close = True
         return output, close
 
@@ -0,0 +1,484 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import mmap
+import re
+from io import BytesIO
+from pathlib import Path
+from xml.parsers import expat
+
+from robot.errors import DataError
+from robot.utils import ET, file_writer, get_error_message, is_compressed
+
+from .executionresult import is_json_source, Result
+from .model import TestCase, TestSuite
+from .suiteteardownfailed import SuiteTeardownFailed
+from .xmlelementhandlers import ElementHandler, XmlElementHandler
+
+
+class IndexItem:
+    """Location of a suite or a test in an output file."""
+    __slots__ = ('id', 'name', 'start', 'end', 'teardown')
+
+    def __init__(self, id: str, name: str, start: int, end: int = -1,
+                 teardown: 'tuple[int, int]|None' = None):
+        self.id = id
+        self.name = name
+        self.start = start
+        self.end = end
+        #: Start and end offsets of the suite teardown or ``None``.
+        self.teardown = teardown
+
+    @property
+    def is_test(self) -> bool:
+        return self.id.rsplit('-', 1)[-1][0] == 't'
+
+    def to_list(self) -> list:
+        data = [self.id, self.name, self.start, self.end]
+        if self.teardown:
+            data.extend(self.teardown)
+        return data
+
+    @classmethod
+    def from_list(cls, data: list) -> 'IndexItem':
+        id, name, start, end, *teardown = data
+        return cls(id, name, start, end, tuple(teardown) if teardown else None)
+
+
+class OutputIndex:
+    """Index of byte offsets of suites and tests in an XML or JSON output file.
+
+    The index allows building individual suites and tests without parsing
+    the whole output. Robot Framework writes the index next to the output
+    file when the ``--outputindex`` option is used. The index file has the
+    same name as the output file with an additional ``.index`` suffix.
+
+    Use :meth:`from_output` to get an index for an output file. It reads
+    the index file if it exists and matches the output, and otherwise
+    creates the index by scanning the output. Scanning is a lot faster than
+    building the whole result model, but it still needs to read the whole
+    output, so the created index is saved for later usage if possible.
+
+    Example::
+
+        from robot.result import OutputIndex
+
+        index = OutputIndex.from_output('output.xml')
+        test = index.get_test('Root.Suite.Failing Test')
+        print(test.status, test.message)
+        for kw in test.body:
+            ...
+    """
+    version = 1
+
+    def __init__(self, output: 'Path|str', format: str = 'xml',
+                 generator: str = 'unknown', rpa: bool = False,
+                 items: 'list[IndexItem]|None' = None):
+        self.output = Path(output)
+        self.format = format
+        self.generator = generator
+        self.rpa = rpa
+        self.items = {item.id: item for item in items or ()}
+        self._full_names = None
+
+    @classmethod
+    def get_index_path(cls, output: 'Path|str') -> Path:
+        output = Path(output)
+        return output.with_name(output.name + '.index')
+
+    @classmethod
+    def from_output(cls, output: 'Path|str', save: bool = True) -> 'OutputIndex':
+        """Returns an index for the given output file.
+
+        :param output: Path to an XML or JSON output file.
+        :param save: When ``True``, an index created by scanning the output is
+            saved for later usage. Failures in saving are silently ignored.
+        """
+        output = Path(output)
+        if not output.is_file():
+            raise DataError(f"Output file '{output}' does not exist.")
+        index = cls.load(output)
+        if index is None:
+            index = cls.scan(output)
+            if save:
+                try:
+                    index.save()
+                except DataError:
+                    pass
+        return index
+
+    @classmethod
+    def load(cls, output: 'Path|str') -> 'OutputIndex|None':
+        """Loads the index of the given output from the index file.
+
+        Returns ``None`` if the index file does not exist, it cannot be read,
+        or it does not match the current output file.
+        """
+        output = Path(output)
+        try:
+            with open(cls.get_index_path(output), encoding='UTF-8') as file:
+                data = json.load(file)
+            stat = output.stat()
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(data, dict)
+                or data.get('version') != cls.version
+                or data.get('size') != stat.st_size
+                or data.get('mtime') != stat.st_mtime_ns):
+            return None
+        return cls(output, data['format'], data['generator'], data['rpa'],
+                   [IndexItem.from_list(item) for item in data['items']])
+
+    @classmethod
+    def scan(cls, output: 'Path|str') -> 'OutputIndex':
+        """Creates an index by scanning the given output file."""
+        output = Path(output)
+        if is_compressed(output):
+            raise DataError(f"Creating index for compressed output '{output}' "
+                            f"is not supported.")
+        scanner = JsonScanner() if is_json_source(output) else XmlScanner()
+        try:
+            return scanner.scan(output)
+        except DataError:
+            raise
+        except Exception:
+            raise DataError(f"Creating index for output '{output}' failed: "
+                            f"{get_error_message()}")
+
+    def save(self, path: 'Path|str|None' = None):
+        """Saves the index into the given path or into the default index file.
+
+        The index is bound to the size and modification time of the output
+        file, so it must be saved after the output has been written.
+        """
+        path = Path(path) if path else self.get_index_path(self.output)
+        try:
+            stat = self.output.stat()
+        except OSError:
+            raise DataError(f"Output file '{self.output}' does not exist.")
+        data = {'version': self.version,
+                'format': self.format,
+                'generator': self.generator,
+                'rpa': self.rpa,
+                'size': stat.st_size,
+                'mtime': stat.st_mtime_ns,
+                'items': [item.to_list() for item in self.items.values()]}
+        with file_writer(path, usage='output index') as file:
+            json.dump(data, file, separators=(',', ':'))
+
+    @property
+    def generated_by_robot(self) -> bool:
+        return self.generator.split()[0].upper() == 'ROBOT'
+
+    def get_test(self, test: str) -> TestCase:
+        """Builds a test based on its id like ``s1-s2-t3`` or its full name.
+
+        The test has its whole body and its status takes possible suite
+        teardown failures into account similarly as when building the whole
+        result. Parent suites of the test contain only names. To get ids of
+        the test and its body items right, parent suites contain also
+        placeholders with only names for suites and tests preceding the test.
+        """
+        item = self._get_item(test, test=True)
+        return self._build(item, TestCase)
+
+    def get_suite(self, suite: str) -> TestSuite:
+        """Builds a suite based on its id like ``s1-s2`` or its full name.
+
+        Parent suites are created similarly as with :meth:`get_test`.
+        """
+        item = self._get_item(suite, test=False)
+        return self._build(item, TestSuite)
+
+    def _get_item(self, name_or_id, test):
+        item = self.items.get(name_or_id)
+        if not item:
+            if self._full_names is None:
+                self._full_names = self._get_full_names()
+            item = self.items.get(self._full_names.get(name_or_id))
+        if not item or item.is_test != test:
+            kind = 'Test' if test else 'Suite'
+            raise DataError(f"{kind} '{name_or_id}' not found from "
+                            f"output '{self.output}'.")
+        return item
+
+    def _get_full_names(self):
+        full_names = {}
+        ids = {}
+        for item in self.items.values():
+            parent = ids.get(item.id.rsplit('-', 1)[0]) if '-' in item.id else None
+            full_name = f'{parent}.{item.name}' if parent else item.name
+            full_names.setdefault(full_name, item.id)
+            if not item.is_test:
+                ids[item.id] = full_name
+        return full_names
+
+    def _build(self, item, model_class):
+        data = self._read(item.start, item.end)
+        parent = self._get_parent(item)
+        if self.format == 'json':
+            data = json.loads(data)
+            if model_class is TestSuite:
+                self._remove_suite_statuses(data)
+            built = model_class.from_dict(data)
+            if parent:
+                (parent.tests if item.is_test else parent.suites).append(built)
+        else:
+            result = parent or Result(rpa=self.rpa)
+            root = ElementHandler.element_handlers['suite'] if parent else None
+            self._parse_xml(data, XmlElementHandler(result, root))
+            built = (parent.tests[-1] if item.is_test else parent.suites[-1]) \
+                if parent else result.suite
+        if self.generated_by_robot:
+            self._handle_suite_teardown_failures(built, item)
+        return built
+
+    def _remove_suite_statuses(self, data):
+        # Suite status is got from tests and cannot be set. The written status
+        # differs from the status of the built suite if suite teardown failed
+        # and teardown failures have not yet been handled.
+        data.pop('status', None)
+        for suite in data.get('suites', ()):
+            self._remove_suite_statuses(suite)
+
+    def _read(self, start, end):
+        with open(self.output, 'rb') as file:
+            file.seek(start)
+            data = file.read(end - start)
+        # JSON items can start with a separator and a key.
+        start = data.find(b'{' if self.format == 'json' else b'<')
+        return data[start:]
+
+    def _parse_xml(self, data, handler):
+        for event, elem in ET.iterparse(BytesIO(data), events=('start', 'end')):
+            if event == 'start':
+                handler.start(elem)
+            else:
+                handler.end(elem)
+                elem.clear()
+
+    def _get_parent(self, item):
+        if '-' not in item.id:
+            return None
+        parent = None
+        parts = item.id.split('-')
+        for index in range(1, len(parts)):
+            suite_id = '-'.join(parts[:index])
+            suite = TestSuite(name=self.items[suite_id].name, rpa=self.rpa)
+            if parent:
+                self._add_placeholders(parent, parts[index - 1], TestSuite)
+                parent.suites.append(suite)
+            parent = suite
+        self._add_placeholders(parent, parts[-1],
+                               TestCase if item.is_test else TestSuite)
+        return parent
+
+    def _add_placeholders(self, parent, part, model_class):
+        items = parent.tests if model_class is TestCase else parent.suites
+        for index in range(1, int(part[1:])):
+            item = self.items.get(f'{parent.id}-{part[0]}{index}')
+            items.append(model_class(name=item.name if item else ''))
+
+    def _handle_suite_teardown_failures(self, built, item):
+        if isinstance(built, TestSuite):
+            built.handle_suite_teardown_failures()
+        parts = item.id.split('-')
+        for index in range(len(parts) - 1, 0, -1):
+            teardown = self.items['-'.join(parts[:index])].teardown
+            if teardown:
+                teardown = self._build_teardown(*teardown)
+                if teardown.failed:
+                    built.visit(SuiteTeardownFailed(teardown.message))
+                elif teardown.skipped:
+                    built.visit(SuiteTeardownFailed(teardown.message, skipped=True))
+
+    def _build_teardown(self, start, end):
+        data = self._read(start, end)
+        if self.format == 'json':
+            return TestSuite.from_dict({'teardown': json.loads(data)}).teardown
+        suite = TestSuite()
+        handler = XmlElementHandler(suite, ElementHandler.element_handlers['suite'])
+        self._parse_xml(data, handler)
+        return suite.teardown
+
+
+class OutputIndexBuilder:
+    """Creates an :class:`OutputIndex` based on offsets got while writing
+    or scanning outputs."""
+
+    def __init__(self, output: 'Path|str', format: str = 'xml',
+                 generator: str = 'unknown', rpa: bool = False):
+        self.index = OutputIndex(output, format, generator, rpa)
+        self._stack = []
+
+    def start(self, id: str, name: str, offset: int):
+        item = IndexItem(id, name, offset)
+        self.index.items[id] = item
+        self._stack.append(item)
+
+    def end(self, offset: int):
+        self._stack.pop().end = offset
+
+    def teardown(self, start: int, end: int):
+        self._stack[-1].teardown = (start, end)
+
+    @property
+    def current(self) -> 'IndexItem|None':
+        return self._stack[-1] if self._stack else None
+
+
+class XmlScanner:
+
+    def scan(self, output):
+        self.builder = OutputIndexBuilder(output, 'xml')
+        self.parser = expat.ParserCreate()
+        self.parser.StartElementHandler = self.start
+        self.parser.EndElementHandler = self.end
+        self.counts = [[0, 0]]
+        self.elements = []
+        self.teardown = None
+        with open(output, 'rb') as file:
+            self.parser.ParseFile(file)
+        return self.builder.index
+
+    def start(self, tag, attrs):
+        parent = self.elements[-1] if self.elements else None
+        offset = self.parser.CurrentByteIndex
+        if tag == 'suite' and parent in (None, 'robot', 'suite'):
+            self._start('s', attrs, offset)
+        elif tag == 'test' and parent == 'suite':
+            self._start('t', attrs, offset)
+        elif tag == 'kw' and parent == 'suite' and attrs.get('type') == 'TEARDOWN':
+            self.teardown = offset
+        elif tag == 'robot':
+            index = self.builder.index
+            index.generator = attrs.get('generator', 'unknown')
+            index.rpa = attrs.get('rpa') == 'true'
+        self.elements.append(tag)
+
+    def _start(self, prefix, attrs, offset):
+        counts = self.counts[-1]
+        counts[prefix == 't'] += 1
+        parent = self.builder.current
+        number = counts[prefix == 't']
+        id = f'{parent.id}-{prefix}{number}' if parent else f'{prefix}{number}'
+        self.builder.start(id, attrs.get('name', ''), offset)
+        self.counts.append([0, 0])
+
+    def end(self, tag):
+        self.elements.pop()
+        parent = self.elements[-1] if self.elements else None
+        end = self.parser.CurrentByteIndex + len(tag) + 3
+        if (tag == 'suite' and parent in (None, 'robot', 'suite')
+                or tag == 'test' and parent == 'suite'):
+            self.builder.end(end)
+            self.counts.pop()
+        elif tag == 'kw' and parent == 'suite' and self.teardown is not None:
+            self.builder.teardown(self.teardown, end)
+            self.teardown = None
+
+
+class JsonScanner:
+    # Strings, possibly followed by a colon, structural characters and booleans.
+    _tokens = re.compile(rb'"([^"\\]*(?:\\.[^"\\]*)*)"(\s*:)?|[{}\[\]]|true|false')
+
+    def scan(self, output):
+        builder = OutputIndexBuilder(output, 'json')
+        with open(output, 'rb') as file:
+            if not file.read(1):
+                raise DataError('Output file is empty.')
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self._scan(data, builder)
+        return builder.index
+
+    def _scan(self, data, builder):
+        # Each stack item is a list `[kind, role, key, counts]` where `kind` is
+        # `{` or `[`, `role` is 'suite', 'test', 'teardown' or None, `key` is
+        # the latest key in an object, and `counts` contains counts of child
+        # suites and tests.
+        stack = []
+        value_for = None
+        teardown = None
+        for match in self._tokens.finditer(data):
+            token = match.group()
+            first = token[:1]
+            if first == b'"':
+                if match.group(2):
+                    stack[-1][2] = match.group(1).decode('UTF-8')
+                    value_for = self._get_value_target(stack)
+                    continue
+                if value_for:
+                    self._set_value(builder, value_for, json.loads(token))
+            elif first in (b'{', b'['):
+                role = self._get_role(stack) if first == b'{' else None
+                if role in ('suite', 'test'):
+                    self._start(builder, stack, role, match.start())
+                elif role == 'teardown':
+                    teardown = match.start()
+                stack.append([first, role, None, [0, 0]])
+            elif first in (b'}', b']'):
+                role = stack.pop()[1]
+                if role in ('suite', 'test'):
+                    builder.end(match.end())
+                elif role == 'teardown':
+                    builder.teardown(teardown, match.end())
+            elif value_for == 'rpa':
+                builder.index.rpa = token == b'true'
+            value_for = None
+        if stack or not builder.index.items:
+            raise DataError('Invalid JSON output.')
+
+    def _get_role(self, stack):
+        if not stack:
+            return None
+        kind, role, key, counts = stack[-1]
+        if kind == b'{':
+            if role is None and key == 'suite' and len(stack) == 1:
+                return 'suite'
+            if role == 'suite' and key == 'teardown':
+                return 'teardown'
+            return None
+        if len(stack) > 1 and stack[-2][1] == 'suite':
+            key = stack[-2][2]
+            if key == 'suites':
+                return 'suite'
+            if key == 'tests':
+                return 'test'
+        return None
+
+    def _start(self, builder, stack, role, offset):
+        prefix = 's' if role == 'suite' else 't'
+        if len(stack) > 1:
+            counts = stack[-2][3]
+            counts[prefix == 't'] += 1
+            id = f'{builder.current.id}-{prefix}{counts[prefix == "t"]}'
+        else:
+            id = 's1'
+        builder.start(id, '', offset)
+
+    def _get_value_target(self, stack):
+        kind, role, key, counts = stack[-1]
+        if role in ('suite', 'test') and key == 'name':
+            return 'name'
+        if len(stack) == 1 and key in ('generator', 'rpa'):
+            return key
+        return None
+
+    def _set_value(self, builder, target, value):
+        if target == 'name':
+            builder.current.name = value
+        else:
+            setattr(builder.index, target, value)
@@ -13,14 +13,24 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from pathlib import Path
+
 from robot.errors import DataError
 from robot.model import SuiteVisitor
+from robot.output.loglevel import LEVELS, LogLevel
 from robot.utils import ET, ETSource, get_error_message
 
 from .executionresult import CombinedResult, is_json_source, Result
 from .flattenkeywordmatcher import (create_flatten_message, FlattenByNameMatcher,
-                                    FlattenByTypeMatcher, FlattenByTags)
+                                    FlattenByTagMatcher, FlattenByTypeMatcher,
+                                    FlattenByTags)
+from .keywordremover import KeywordRemover, PassedKeywordRemover
 from .merger import Merger
+from .messagefilter import MessageFilter
 from .xmlelementhandlers import XmlElementHandler
 
 
@@ -36,6 +46,13 @@ def ExecutionResult(*sources, **options):
         Setting ``rpa`` either to ``True`` (RPA mode) or ``False`` (test
         automation) sets execution mode explicitly. By default, it is got
         from processed output files and conflicting modes cause an error.
+        Setting ``processes`` to a value larger than one causes multiple
+        sources to be read in parallel in the given number of worker
+        processes when ``include_keywords=False`` is used. The number of
+        workers is limited by the number of CPUs. Results are combined in
+        the original order. Only sources given as paths are read in workers.
+        Results containing keywords are always read in the main process,
+        because passing them from workers would be as slow as reading them.
         Other options are passed directly to the
         :class:`ExecutionResultBuilder` object used internally.
     :returns: :class:`~.executionresult.Result` instance.
@@ -50,24 +67,83 @@ def ExecutionResult(*sources, **options):
     """
     if not sources:
         raise DataError('One or more data source needed.')
+    processes = options.pop('processes', 1)
     if options.pop('merge', False):
-        return _merge_results(sources[0], sources[1:], options)
+        return _merge_results(sources, options, processes)
     if len(sources) > 1:
-        return _combine_results(sources, options)
+        return _combine_results(sources, options, processes)
     return _single_result(sources[0], options)
 
 
-def _merge_results(original, merged, options):
-    result = ExecutionResult(original, **options)
+def _merge_results(sources, options, processes=1):
+    results = _read_results(sources, options, processes)
+    result = next(results)
     merger = Merger(result, rpa=result.rpa)
-    for path in merged:
-        merged = ExecutionResult(path, **options)
+    for merged in results:
         merger.merge(merged)
     return result
 
 
-def _combine_results(sources, options):
-    return CombinedResult(ExecutionResult(src, **options) for src in sources)
+def _combine_results(sources, options, processes=1):
+    return CombinedResult(_read_results(sources, options, processes))
+
+
+def _read_results(sources, options, processes=1):
+    if _can_read_in_workers(sources, options, processes):
+        yield from _read_results_in_workers(sources, options, processes)
+    else:
+        for source in sources:
+            yield _single_result(source, dict(options))
+
+
+def _can_read_in_workers(sources, options, processes):
+    # Results are passed from workers as JSON. Building results from JSON
+    # is cheap compared to reading outputs only if keywords are excluded.
+    return (_get_worker_count(sources, processes) > 1
+            and not options.get('include_keywords', True)
+            and all(_is_path(s) for s in sources))
+
+
+def _get_worker_count(sources, processes):
+    # Reading is CPU bound. Using more workers than CPUs does not help.
+    return min(processes, len(sources), os.cpu_count() or 1)
+
+
+def _is_path(source):
+    return isinstance(source, Path) or (isinstance(source, str)
+                                        and os.path.isfile(source))
+
+
+def _read_results_in_workers(sources, options, processes):
+    with ProcessPoolExecutor(_get_worker_count(sources, processes),
+                             mp_context=get_context('spawn')) as executor:
+        try:
+            futures = [executor.submit(read_result_in_worker, source, options)
+                       for source in sources]
+            for source, future in zip(sources, futures):
+                try:
+                    data, generator, generation_time = future.result()
+                except BrokenProcessPool:
+                    raise DataError(f"Reading '{source}' in a worker process "
+                                    f"failed: {get_error_message()}")
+                result = Result.from_json(data)
+                result.source = Path(source)
+                result.generator = generator
+                result.generation_time = generation_time
+                yield result
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def read_result_in_worker(source, options):
+    """Reads a result in a worker process and returns it serialized to JSON.
+
+    JSON serialization does not preserve the generator and the generation
+    time, so they are returned separately.
+    """
+    result = _single_result(source, options)
+    return (result.to_json(include_statistics=False), result.generator,
+            result.generation_time)
 
 
 def _single_result(source, options):
@@ -78,7 +154,11 @@ def _single_result(source, options):
 
 def _json_result(source, options):
     try:
-        return Result.from_json(source, rpa=options.get('rpa'))
+        return Result.from_json(source, rpa=options.get('rpa'),
+                                include_keywords=options.get('include_keywords', True),
+                                flattened_keywords=options.get('flattened_keywords'),
+                                remove_keywords=options.get('remove_keywords'),
+                                log_level=options.get('log_level'))
     except IOError as err:
         error = err.strerror
     except Exception:
@@ -105,7 +185,8 @@ class ExecutionResultBuilder:
     :func:`ExecutionResult` factory method.
     """
 
-    def __init__(self, source, include_keywords=True, flattened_keywords=None):
+    def __init__(self, source, include_keywords=True, flattened_keywords=None,
+                 remove_keywords=None, log_level=None):
         """
         :param source: Path to the XML output file to build
             :class:`~.executionresult.Result` objects from.
@@ -115,32 +196,56 @@ class ExecutionResultBuilder:
         :param flattened_keywords: List of patterns controlling what keywords
             and control structures to flatten. See the documentation of
             the ``--flattenkeywords`` option for more details.
+        :param remove_keywords: List of ``--removekeywords`` options to apply
+            to tests already when they are parsed.
+        :param log_level: Messages below this level are not included in
+            the result.
+
+        Keywords are removed and messages filtered already during parsing
+        to save memory. Suite setups and teardowns are not processed, and
+        passed keywords are not removed from outputs generated by Robot,
+        because suite teardown failures can still change test statuses.
+        That processing is done when the result is configured.
         """
         self._source = source \
             if isinstance(source, ETSource) else ETSource(source)
         self._include_keywords = include_keywords
         self._flattened_keywords = flattened_keywords
+        self._remove_keywords = remove_keywords
+        self._log_level = log_level
 
     def build(self, result):
         # Parsing is performance optimized. Do not change without profiling!
         handler = XmlElementHandler(result)
+        # Keywords are flattened already during parsing. When keywords are
+        # removed, messages are filtered only afterwards because removal
+        # depends on what messages keywords contain.
+        log_level = self._log_level if self._remove_keywords else None
+        processor = TestProcessor(result, remove_keywords=self._remove_keywords,
+                                  log_level=log_level)
+        end = self._process_tests(handler.end, processor) if processor else handler.end
         with self._source as source:
-            self._parse(source, handler.start, handler.end)
+            self._parse(source, handler.start, end)
         result.handle_suite_teardown_failures()
-        if self._flattened_keywords:
-            # Tags are nowadays written after keyword content, so we cannot
-            # flatten based on them when parsing output.xml.
-            result.suite.visit(FlattenByTags(self._flattened_keywords))
         if not self._include_keywords:
             result.suite.visit(RemoveKeywords())
         return result
 
+    def _process_tests(self, end, processor):
+        def end_and_process(elem):
+            item = end(elem)
+            if elem.tag == 'test':
+                processor.process(item)
+        return end_and_process
+
     def _parse(self, source, start, end):
         context = ET.iterparse(source, events=('start', 'end'))
         if not self._include_keywords:
             context = self._omit_keywords(context)
         elif self._flattened_keywords:
             context = self._flatten_keywords(context, self._flattened_keywords)
+        if self._log_level and not self._remove_keywords:
+            context = self._filter_messages(context, self._log_level)
         for event, elem in context:
             if event == 'start':
                 start(elem)
@@ -169,14 +274,20 @@ class ExecutionResultBuilder:
         # Performance optimized. Do not change without profiling!
         name_match, by_name = self._get_matcher(FlattenByNameMatcher, flattened)
         type_match, by_type = self._get_matcher(FlattenByTypeMatcher, flattened)
+        tags_match, by_tags = self._get_matcher(FlattenByTagMatcher, flattened)
+        if by_tags:
+            context = self._buffer_keywords(context)
         started = -1    # if 0 or more, we are flattening
         containers = {'kw', 'for', 'while', 'iter', 'if', 'try'}
-        inside = 0    # to make sure we don't read tags from a test
+        # Keywords flattened by tags preserve only messages like `FlattenByTags`.
+        body_items = containers | {'group', 'variable', 'return', 'break',
+                                   'continue', 'error'}
+        nested = containers
+        flattened_by = 0    # how many times the status message is flattened
         for event, elem in context:
             tag = elem.tag
             if event == 'start':
-                if tag in containers:
-                    inside += 1
+                if tag in nested:
                     if started >= 0:
                         started += 1
                     elif by_name and name_match(elem.get('name', ''), elem.get('owner')
@@ -184,22 +295,112 @@ class ExecutionResultBuilder:
                         started = 0
                     elif by_type and type_match(tag):
                         started = 0
-            else:
-                if tag in containers:
-                    inside -= 1
-                elif started == 0 and tag == 'status':
+                    if (by_tags and started <= 0 and tag == 'kw'
+                            and tags_match([t.text for t in elem.iterfind('tag')])):
+                        # Flattened also by name if `started` is already 0.
+                        flattened_by = 2 if started == 0 else 1
+                        started = 0
+                        nested = body_items
+            elif started == 0 and tag == 'status':
+                for _ in range(flattened_by or 1):
                     elem.text = create_flatten_message(elem.text)
             if started <= 0 or tag == 'msg':
                 yield event, elem
             else:
                 elem.clear()
-            if started >= 0 and event == 'end' and tag in containers:
+            if started >= 0 and event == 'end' and tag in nested:
                 started -= 1
+                if started < 0:
+                    nested = containers
+                    flattened_by = 0
+
+    def _buffer_keywords(self, context):
+        # Keyword tags are written after keyword content. To be able to flatten
+        # keywords by tags, events of the outermost keyword are buffered until
+        # it has ended. At that point the whole keyword subtree, including tags
+        # of all nested keywords, is available.
+        buffered = []
+        depth = 0
+        for event, elem in context:
+            if elem.tag == 'kw':
+                depth += 1 if event == 'start' else -1
+                if not depth:
+                    buffered.append((event, elem))
+                    yield from buffered
+                    buffered = []
+                    continue
+            if depth:
+                buffered.append((event, elem))
+            else:
+                yield event, elem
 
     def _get_matcher(self, matcher_class, flattened):
         matcher = matcher_class(flattened)
         return matcher.match, bool(matcher)
 
+    def _filter_messages(self, context, level):
+        # Messages directly in tests and execution errors are not filtered.
+        # Warnings and errors are needed when keywords are removed later.
+        priority = LogLevel(level).priority
+        filtered = {lvl for lvl in LEVELS
+                    if LEVELS[lvl] < priority and lvl not in ('WARN', 'ERROR')}
+        if not filtered:
+            yield from context
+            return
+        items = {'kw', 'for', 'while', 'iter', 'group', 'if', 'branch', 'try',
+                 'variable', 'return', 'break', 'continue', 'error'}
+        inside = 0
+        skip = False
+        for event, elem in context:
+            tag = elem.tag
+            if tag == 'msg':
+                if event == 'start':
+                    skip = inside > 0 and elem.get('level', 'INFO') in filtered
+                if skip:
+                    if event == 'end':
+                        elem.clear()
+                    continue
+            elif tag in items:
+                inside += 1 if event == 'start' else -1
+            yield event, elem
+
+
+class TestProcessor:
+    """Processes tests right after they have been built.
+
+    Flattens keywords by tags, removes keywords and filters messages so that
+    content that is not needed does not need to be kept in memory for all tests.
+    Processing is stopped before removing passed keywords if test statuses can
+    still change when suite teardown failures are handled. Results are
+    configured afterwards normally, which does the remaining processing and
+    does not affect the already processed tests.
+    """
+
+    def __init__(self, result, flattened_keywords=None, remove_keywords=None,
+                 log_level=None):
+        self.result = result
+        self.visitors = []
+        flattener = FlattenByTags(flattened_keywords or [])
+        if flattener.matcher:
+            self.visitors.append(flattener)
+        if isinstance(remove_keywords, str):
+            remove_keywords = [remove_keywords]
+        for how in remove_keywords or ():
+            self.visitors.append(KeywordRemover.from_config(how))
+        message_filter = MessageFilter(log_level)
+        if not message_filter.log_all:
+            self.visitors.append(message_filter)
+
+    def process(self, test):
+        for visitor in self.visitors:
+            if (isinstance(visitor, PassedKeywordRemover)
+                    and self.result.generated_by_robot):
+                break
+            test.visit(visitor)
+
+    def __bool__(self):
+        return bool(self.visitors)
+
 
 class RemoveKeywords(SuiteVisitor):
 
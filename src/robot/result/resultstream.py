@@ -0,0 +1,332 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.model import Statistics, SuiteVisitor, TotalStatistics
+from robot.model.tagsetter import TagSetter
+from robot.utils import ETSource, get_error_message
+
+from .executionresult import CombinedResult, is_json_source, Result
+from .model import TestSuite
+from .resultbuilder import ExecutionResultBuilder
+from .suiteteardownfailed import SuiteTeardownFailed
+from .xmlelementhandlers import ElementHandler, XmlElementHandler
+
+
+class StreamedTestSuite(TestSuite):
+    """Result suite that does not contain its tests.
+
+    Used by :class:`ResultStream`. :attr:`statistics`, and thus also
+    :attr:`status`, are based on test statuses recorded when the suite
+    was built. Suite teardown failures are taken into account.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Passed, failed and skipped tests directly in this suite and in
+        # the whole suite structure, respectively.
+        self.own_counts = [0, 0, 0]
+        self.counts = [0, 0, 0]
+
+    @property
+    def statistics(self) -> TotalStatistics:
+        stats = TotalStatistics(bool(self.rpa))
+        stats.stat.passed, stats.stat.failed, stats.stat.skipped = self.counts
+        return stats
+
+    @property
+    def has_tests(self) -> bool:
+        return any(self.counts)
+
+
+class ResultStream:
+    """Reads results from XML output files test by test.
+
+    Memory usage does not depend on the number of tests, because tests are
+    not kept in memory. Outputs are read twice. First the suite structure,
+    execution errors and test statuses are read into :attr:`result`, whose
+    suites are :class:`StreamedTestSuite` objects without tests. Tests are
+    then read when the stream is visited using :meth:`visit`.
+
+    Only information needed for statistics, reports and xUnit outputs is
+    read. Keywords and control structures are ignored.
+
+    :param sources: Paths to XML output files or strings containing XML.
+        Multiple sources are combined similarly as with
+        :func:`~.resultbuilder.ExecutionResult`.
+    :param rpa: Overrides the execution mode got from the sources.
+    """
+
+    def __init__(self, *sources, rpa=None):
+        if not sources:
+            raise DataError('One or more data source needed.')
+        if any(is_json_source(s) or not isinstance(s, (Path, str)) for s in sources):
+            raise DataError('Only XML outputs given as paths or strings '
+                            'can be streamed.')
+        self._sources = sources
+        self._results = [self._build_skeleton(s, rpa) for s in sources]
+        if len(self._results) > 1:
+            self.result = CombinedResult()
+            self.result.suite = StreamedTestSuite()
+            for result in self._results:
+                self.result.add_result(result)
+        else:
+            self.result = self._results[0]
+        self._resolve_statistics(self.result.suite, [])
+        self._tag_setter = None
+        self._status_rc = True
+        self._stat_config = {}
+        #: Visitors getting the same calls as the visitor passed to :meth:`visit`.
+        self.visitors = []
+
+    def _build_skeleton(self, source, rpa):
+        ets = ETSource(source)
+        result = Result(source, suite=StreamedTestSuite(), rpa=rpa)
+        try:
+            return StreamBuilder(ets).build(result)
+        except IOError as err:
+            error = err.strerror
+        except Exception:
+            error = get_error_message()
+        raise DataError(f"Reading XML source '{ets}' failed: {error}")
+
+    def _resolve_statistics(self, suite, outer):
+        # Statistics are resolved from the innermost suite to the outermost.
+        # `outer` contains parent suites whose teardown affects all tests.
+        teardown = self._get_failed_teardown(suite)
+        affecting = [teardown] + outer if teardown else outer
+        counts = list(suite.own_counts)
+        for child in suite.suites:
+            child_counts = self._resolve_statistics(child, affecting)
+            counts = [a + b for a, b in zip(counts, child_counts)]
+        if teardown:
+            counts = self._apply_teardown(counts, teardown)
+        suite.counts = counts
+        for teardown in outer:
+            suite.counts = self._apply_teardown(suite.counts, teardown)
+        return counts
+
+    def _get_failed_teardown(self, suite):
+        teardown = suite.teardown
+        if (teardown and teardown.status in (teardown.FAIL, teardown.SKIP)
+                and self._get_source_result(suite).generated_by_robot):
+            return teardown
+        return None
+
+    def _get_source_result(self, suite):
+        for result in self._results:
+            if result.suite is suite:
+                return result
+        return self._get_source_result(suite.parent)
+
+    def _apply_teardown(self, counts, teardown):
+        passed, failed, skipped = counts
+        if teardown.status == teardown.SKIP:
+            return [0, 0, passed + failed + skipped]
+        return [0, passed + failed, skipped]
+
+    @property
+    def suite(self) -> StreamedTestSuite:
+        return self.result.suite
+
+    @property
+    def errors(self):
+        return self.result.errors
+
+    @property
+    def rpa(self) -> 'bool|None':
+        return self.result.rpa
+
+    @property
+    def statistics(self) -> Statistics:
+        """Execution statistics.
+
+        Statistics are created by reading tests from the sources every time
+        this property is accessed. Tests are passed also to :attr:`visitors`.
+        """
+        return Statistics(self, rpa=self.rpa, **self._stat_config)
+
+    @property
+    def return_code(self) -> int:
+        """Execution return code similarly as with :attr:`.Result.return_code`."""
+        if self._status_rc:
+            return min(self.suite.statistics.failed, 250)
+        return 0
+
+    def configure(self, status_rc=True, suite_config=None, stat_config=None):
+        """Configures the stream similarly as :meth:`.Result.configure`.
+
+        Options selecting tests and suites are not supported. Tags set using
+        ``set_tags`` are set to tests when they are read.
+        """
+        suite_config = dict(suite_config or {})
+        selectors = ('include_tags', 'exclude_tags', 'include_suites',
+                     'include_tests')
+        if any(suite_config.pop(name, None) for name in selectors):
+            raise DataError('Selecting tests or suites is not supported when '
+                            'streaming results.')
+        set_tags = suite_config.pop('set_tags', None) or []
+        self._tag_setter = TagSetter([t for t in set_tags if t[:1] != '-'],
+                                     [t[1:] for t in set_tags if t[:1] == '-'])
+        self.suite.configure(**suite_config)
+        self._status_rc = status_rc
+        self._stat_config = stat_config or {}
+
+    def visit(self, visitor):
+        """Reads tests from the sources and passes them to visitors.
+
+        The ``visitor`` and possible additional :attr:`visitors` get
+        ``start_suite`` and ``end_suite`` calls with :class:`StreamedTestSuite`
+        objects and ``visit_test`` calls with tests that have been read.
+        Tests are removed from their parent suites after they have been
+        visited. Other ``visit_x`` and ``start/end_x`` methods are not called.
+        """
+        visitors = [visitor] + self.visitors
+        if len(self._results) > 1:
+            for visitor in visitors:
+                visitor.start_suite(self.suite)
+            for source, result in zip(self._sources, self._results):
+                self._stream(source, result, visitors)
+            for visitor in visitors:
+                visitor.end_suite(self.suite)
+        else:
+            self._stream(self._sources[0], self._results[0], visitors)
+
+    def _stream(self, source, result, visitors):
+        streamer = TestStreamer(result, visitors, self._tag_setter)
+        try:
+            StreamBuilder(source).stream(streamer)
+        except IOError as err:
+            error = err.strerror
+        except DataError:
+            raise
+        except Exception:
+            error = get_error_message()
+        else:
+            return
+        raise DataError(f"Reading XML source '{source}' failed: {error}")
+
+
+class StreamBuilder(ExecutionResultBuilder):
+    """Parses outputs without keywords passing elements to the given handler."""
+
+    def __init__(self, source):
+        super().__init__(source, include_keywords=False)
+
+    def build(self, result):
+        handler = SkeletonElementHandler(result)
+        self.stream(handler)
+        result.suite.visit(SetupRemover())
+        return result
+
+    def stream(self, handler):
+        with self._source as source:
+            self._parse(source, handler.start, handler.end)
+
+
+class SkeletonElementHandler(XmlElementHandler):
+    _indices = {'PASS': 0, 'FAIL': 1, 'SKIP': 2}
+
+    def end(self, elem):
+        result = self._stack[-1][1]
+        super().end(elem)
+        if elem.tag == 'test' and result is not None:
+            suite = result.parent
+            suite.own_counts[self._indices.get(result.status, 1)] += 1
+            suite.tests.clear()
+
+
+class SetupRemover(SuiteVisitor):
+
+    def start_suite(self, suite):
+        # Teardowns are needed for handling suite teardown failures.
+        suite.setup = None
+
+    def visit_test(self, test):
+        pass
+
+
+class TestStreamer:
+    """Builds tests into suites read earlier and passes them to visitors."""
+    _suite_handler = ElementHandler.element_handlers['suite']
+
+    def __init__(self, result, visitors, tag_setter):
+        self._root = result.suite
+        self._visitors = visitors
+        self._tag_setter = tag_setter
+        self._handle_teardowns = result.generated_by_robot
+        self._suites = []
+        self._child_indices = []
+        self._test = None
+        self._finished = False
+
+    def start(self, elem):
+        if self._test:
+            self._test.start(elem)
+        elif elem.tag == 'suite' and not self._finished:
+            self._start_suite()
+        elif elem.tag == 'test':
+            self._test = XmlElementHandler(self._suites[-1], self._suite_handler)
+            self._test.start(elem)
+
+    def _start_suite(self):
+        if self._suites:
+            index = self._child_indices[-1]
+            self._child_indices[-1] += 1
+            suite = self._suites[-1].suites[index]
+        else:
+            suite = self._root
+        self._suites.append(suite)
+        self._child_indices.append(0)
+        for visitor in self._visitors:
+            visitor.start_suite(suite)
+
+    def end(self, elem):
+        if self._test:
+            self._test.end(elem)
+            if elem.tag == 'test':
+                self._test = None
+                self._end_test(self._suites[-1])
+        elif elem.tag == 'suite' and not self._finished:
+            suite = self._suites.pop()
+            self._child_indices.pop()
+            # Statistics also have `suite` elements.
+            self._finished = not self._suites
+            for visitor in self._visitors:
+                visitor.end_suite(suite)
+
+    def _end_test(self, suite):
+        test = suite.tests[-1]
+        # Teardowns and body items like VAR are parsed, but they are not needed.
+        test.body = []
+        test.teardown = None
+        if self._handle_teardowns:
+            self._handle_suite_teardown_failures(test, suite)
+        if self._tag_setter:
+            self._tag_setter.visit_test(test)
+        for visitor in self._visitors:
+            visitor.visit_test(test)
+        suite.tests.clear()
+
+    def _handle_suite_teardown_failures(self, test, suite):
+        while suite:
+            teardown = suite.teardown
+            if teardown and teardown.status == teardown.FAIL:
+                SuiteTeardownFailed(teardown.message).visit_test(test)
+            if teardown and teardown.status == teardown.SKIP:
+                SuiteTeardownFailed(teardown.message, skipped=True).visit_test(test)
+            suite = suite.parent if suite is not self._root else None
@@ -19,22 +19,43 @@ from robot.errors import DataError
 
 
 class XmlElementHandler:
+    # Values that typically repeat are interned so that all occurrences share
+    # the same string object. Timestamps and messages are typically unique and
+    # interning them would only grow the pool.
+    _interned_attributes = frozenset(('name', 'owner', 'library', 'source_name',
+                                      'sourcename', 'type', 'status', 'level',
+                                      'flavor', 'value'))
+    _interned_texts = frozenset(('tag', 'arg', 'var', 'doc', 'status'))
 
     def __init__(self, execution_result, root_handler=None):
         self._stack = [(root_handler or RootHandler(), execution_result)]
+        self._strings = {}
 
     def start(self, elem):
         handler, result = self._stack[-1]
         handler = handler.get_child_handler(elem.tag)
         # Previous `result` being `None` means child elements should be ignored.
         if result is not None:
+            attrib = elem.attrib
+            if attrib:
+                self._intern_attributes(attrib)
             result = handler.start(elem, result)
         self._stack.append((handler, result))
 
+    def _intern_attributes(self, attrib):
+        strings = self._strings
+        interned = self._interned_attributes
+        for name, value in attrib.items():
+            if name in interned:
+                attrib[name] = strings.setdefault(value, value)
+
     def end(self, elem):
         handler, result = self._stack.pop()
         if result is not None:
+            if elem.text and elem.tag in self._interned_texts:
+                elem.text = self._strings.setdefault(elem.text, elem.text)
             handler.end(elem, result)
+        return result
 
 
 class ElementHandler:
@@ -175,10 +175,25 @@ Options
                           path. Other output files are created based on XML
                           output files after the test execution and XML outputs
                           can also be further processed with Rebot tool. Can be
-                          disabled by giving a special value `NONE`.
+                          disabled by giving a special value `NONE`. The output
+                          is compressed if the path has a `.gz` (gzip) or `.xz`
+                          (xz) suffix like `output.xml.gz`. Rebot reads
+                          compressed outputs transparently.
                           Default: output.xml
     --legacyoutput        Create XML output file in format compatible with
                           Robot Framework 6.x and earlier.
+    --outputindex         Write an index containing byte offsets of suites and
+                          tests in the output file next to it. The index has
+                          the same name as the output file with an `.index`
+                          suffix like `output.xml.index`. It allows reading
+                          individual tests without parsing the whole output
+                          using the `robot.result.OutputIndex` API. Not
+                          supported with compressed outputs.
+    --asyncoutput         Write the output file in a background thread. Written
+                          data is buffered in memory and the file is updated in
+                          large blocks, which can speed up execution when
+                          libraries log a lot or the output is on a slow disk.
+                          All data is flushed to the file when suites end.
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l NONE`
@@ -188,6 +203,13 @@ Options
                           option is specified.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
+    --profile file        Keyword profile with call counts, total times and
+                          self times of keywords. Written as CSV if the file
+                          has a `.csv` extension and as JSON otherwise.
+                          Collapsed stacks for flame graph tools are written
+                          to a file with the same base name and a `.folded`
+                          extension. Not created unless this option is
+                          specified.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -196,6 +218,13 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --searchindex size    Add an index for finding words in suite, test and
+                          keyword names, keyword arguments and messages to the
+                          log file. The size is the maximum number of indexed
+                          word occurrences and failures. Words in items after
+                          the limit is reached are not found. The default
+                          is 0, meaning no index is created.
+                          Example: --searchindex 1000000
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Log`.
     --reporttitle title   Title for the generated report file. The default
@@ -299,6 +328,13 @@ Options
                           in test cases. Error codes are returned normally.
     --dryrun              Verifies test data and runs tests so that library
                           keywords are not executed.
+    --lazylibraries       Import libraries imported in the Settings section
+                          only when their keywords or instances are needed
+                          for the first time. Libraries are searched for
+                          keywords in import order and searching stops when
+                          the keyword is found, so possible conflicts with
+                          libraries that are not yet imported are not noticed.
+                          Import errors are reported when the import occurs.
  -X --exitonfailure       Stops test execution if any test fails.
     --exitonerror         Stops test execution if any error occurs when parsing
                           test data, importing libraries, and so on.
@@ -313,6 +349,27 @@ Options
                           The seed must be an integer.
                           Examples: --randomize all
                                     --randomize tests:1234
+    --processes count     Run child suites in the given number of worker
+                          processes in parallel. Setups and teardowns of parent
+                          suites are run in the main process around the child
+                          suites and results are combined into normal outputs.
+                          Listeners are run in workers and variables set in
+                          parent suite setups are not visible to children.
+                          Listeners must be given as names or paths, not as
+                          objects. Also suite files are parsed in parallel.
+                          Default is 1, meaning no parallel execution.
+                          Example: --processes 8
+    --shard index/total   Run only tests belonging to the given shard when
+                          tests are split into `total` shards. Running all
+                          shards, for example on different machines, runs
+                          every test exactly once. Tests are split based on
+                          their durations read from an output file given with
+                          --shardtimings or based on their count otherwise.
+                          Example: --shard 2/4
+    --shardtimings output  Output file from an earlier execution to read test
+                          durations from when using --shard. Tests not found
+                          from the output get the median duration of other
+                          tests in the same suite.
     --listener listener *  Class or module for monitoring test execution.
                           Gets notifications e.g. when tests start and end.
                           Arguments to the listener class can be given after
@@ -325,6 +382,10 @@ Options
     --prerebotmodifier modifier *  Class to programmatically modify the result
                           model before creating reports and logs. Accepts
                           arguments the same way as with --listener.
+    --parsecache dir      Cache parsed suite, initialization and resource files
+                          into the given directory and use cached data when
+                          files have not changed. Speeds up parsing large data
+                          sets. Not used by default.
     --parser parser *     Custom parser class or module. Parser classes accept
                           arguments the same way as with --listener.
     --console type        How to report execution on the console.
@@ -458,7 +519,9 @@ class RobotFramework(Application):
                                    custom_parsers=settings.parsers,
                                    rpa=settings.rpa,
                                    lang=settings.languages,
-                                   allow_empty_suite=settings.run_empty_suite)
+                                   allow_empty_suite=settings.run_empty_suite,
+                                   parse_cache=settings.parse_cache,
+                                   processes=settings.processes)
         suite = builder.build(*datasources)
         if settings.pre_run_modifiers:
             suite.visit(ModelModifier(settings.pre_run_modifiers,
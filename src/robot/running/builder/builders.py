@@ -13,13 +13,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import pickle
 import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
 from itertools import chain
+from multiprocessing import get_context
 from os.path import normpath
 from pathlib import Path
 from typing import cast, Sequence
 
-from robot.conf import LanguagesLike
+from robot.conf import Languages, LanguagesLike
 from robot.errors import DataError
 from robot.output import LOGGER
 from robot.parsing import (SuiteFile, SuiteDirectory, SuiteStructure,
@@ -28,6 +31,7 @@ from robot.utils import Importer, seq2str, split_args_from_name_or_path, type_na
 
 from ..model import TestSuite
 from ..resourcemodel import ResourceFile
+from .parsecache import ParseCache, get_added_languages
 from .parsers import (CustomParser, JsonParser, NoInitFileDirectoryParser, Parser,
                       RestParser, RobotParser)
 from .settings import TestDefaults
@@ -65,7 +69,9 @@ class TestSuiteBuilder:
                  rpa: 'bool|None' = None,
                  lang: LanguagesLike = None,
                  allow_empty_suite: bool = False,
-                 process_curdir: bool = True):
+                 process_curdir: bool = True,
+                 parse_cache: 'Path|str|None' = None,
+                 processes: int = 1):
         """
         :param included_suites:
             This argument used to be used for limiting what suite file to parse.
@@ -100,24 +106,36 @@ class TestSuiteBuilder:
             Control processing the special ``${CURDIR}`` variable. It is
             resolved already at parsing time by default, but that can be
             changed by giving this argument ``False`` value.
+        :param parse_cache:
+            Directory where to cache parsed files between executions.
+            Same as ``--parsecache``. Caching is disabled by default.
+            New in RF 7.3.
+        :param processes:
+            Number of worker processes to use for parsing suite files.
+            Files are parsed in the main process by default. Init files
+            and files handled by custom parsers are always parsed in the
+            main process. New in RF 7.3.
         """
-        self.standard_parsers = self._get_standard_parsers(lang, process_curdir)
+        self.standard_parsers = self._get_standard_parsers(lang, process_curdir,
+                                                           parse_cache)
         self.custom_parsers = self._get_custom_parsers(custom_parsers)
         self.defaults = defaults
         self.included_extensions = tuple(included_extensions or ())
         self.included_files = tuple(included_files or ())
         self.rpa = rpa
         self.allow_empty_suite = allow_empty_suite
+        self.processes = processes
         # TODO: Remove in RF 8.0.
         if included_suites != 'DEPRECATED':
             warnings.warn("'TestSuiteBuilder' argument 'included_suites' is deprecated "
                           "and has no effect. Use the new 'included_files' argument "
                           "or filter the created suite instead.")
 
-    def _get_standard_parsers(self, lang: LanguagesLike,
-                              process_curdir: bool) -> 'dict[str, Parser]':
-        robot_parser = RobotParser(lang, process_curdir)
-        rest_parser = RestParser(lang, process_curdir)
+    def _get_standard_parsers(self, lang: LanguagesLike, process_curdir: bool,
+                              parse_cache: 'Path|str|None') -> 'dict[str, Parser]':
+        cache = ParseCache(parse_cache, lang, process_curdir) if parse_cache else None
+        robot_parser = RobotParser(lang, process_curdir, cache)
+        rest_parser = RestParser(lang, process_curdir, cache)
         json_parser = JsonParser()
         return {
             'robot': robot_parser,
@@ -154,8 +172,13 @@ class TestSuiteBuilder:
         extensions = self.included_extensions + tuple(self.custom_parsers)
         structure = SuiteStructureBuilder(extensions,
                                           self.included_files).build(*paths)
-        suite = SuiteStructureParser(self._get_parsers(paths), self.defaults,
-                                     self.rpa).parse(structure)
+        parsers = self._get_parsers(paths)
+        if self.processes > 1:
+            parser = ParallelSuiteStructureParser(parsers, self.defaults, self.rpa,
+                                                  self.processes)
+        else:
+            parser = SuiteStructureParser(parsers, self.defaults, self.rpa)
+        suite = parser.parse(structure)
         if not self.allow_empty_suite:
             self._validate_not_empty(suite, multi_source=len(paths) > 1)
         suite.remove_empty_suites(preserve_direct_children=len(paths) > 1)
@@ -273,11 +296,134 @@ class SuiteStructureParser(SuiteStructureVisitor):
         return suite, defaults
 
 
+class ParallelSuiteStructureParser(SuiteStructureParser):
+    """Parses suite files in worker processes.
+
+    Init files are parsed first in the main process, because suite files need
+    test defaults set in them. Suite files are then parsed in parallel and
+    the suite is built from the results in the normal order. Messages logged
+    during parsing are relayed when the suite is built, so errors and warnings
+    are reported in the same order as when parsing sequentially. Languages
+    that ``Language: <lang>`` headers add in workers are added to the shared
+    ``Languages`` object in the main process at the same time.
+    """
+
+    def __init__(self, parsers: 'dict[str|None, Parser]',
+                 defaults: 'TestDefaults|None' = None,
+                 rpa: 'bool|None' = None,
+                 processes: int = 2):
+        super().__init__(parsers, defaults, rpa)
+        self.processes = processes
+        self._directories: 'dict[SuiteDirectory, tuple]' = {}
+        self._files: 'dict[SuiteFile, Future]' = {}
+        self._picklable: 'dict[Parser, bool]' = {}
+
+    def parse(self, structure: SuiteStructure) -> TestSuite:
+        files: 'list[tuple[SuiteFile, TestDefaults]]' = []
+        try:
+            self._prefetch(structure, files)
+            if len(files) < 2:
+                return super().parse(structure)
+            with ProcessPoolExecutor(min(self.processes, len(files)),
+                                     mp_context=get_context('spawn')) as executor:
+                try:
+                    for file, defaults in files:
+                        self._files[file] = executor.submit(
+                            parse_suite_file_in_worker, self.parsers[file.extension],
+                            cast(Path, file.source), defaults
+                        )
+                    return super().parse(structure)
+                finally:
+                    executor.shutdown(cancel_futures=True)
+        finally:
+            self._files.clear()
+            self._directories.clear()
+
+    def _prefetch(self, structure: SuiteStructure,
+                  files: 'list[tuple[SuiteFile, TestDefaults]]'):
+        if isinstance(structure, SuiteFile):
+            if self._can_parse_in_worker(structure):
+                files.append((structure, self.parent_defaults or TestDefaults()))
+            return
+        structure = cast(SuiteDirectory, structure)
+        with LOGGER.captured_messages as messages:
+            try:
+                suite, defaults = super()._build_suite_directory(structure)
+            except DataError as err:
+                # Children cannot be parsed. The error is reported when the
+                # directory is reached so that earlier errors are reported first.
+                self._directories[structure] = (err, messages)
+                return
+        self._directories[structure] = ((suite, defaults), messages)
+        self._stack.append((suite, defaults))
+        for child in structure.children:
+            self._prefetch(child, files)
+        self._stack.pop()
+
+    def _can_parse_in_worker(self, structure: SuiteFile) -> bool:
+        parser = self.parsers[structure.extension]
+        if not isinstance(parser, RobotParser):
+            return False
+        if parser not in self._picklable:
+            try:
+                pickle.dumps(parser)
+            except Exception:
+                self._picklable[parser] = False
+            else:
+                self._picklable[parser] = True
+        return self._picklable[parser]
+
+    def _build_suite_file(self, structure: SuiteFile):
+        if structure not in self._files:
+            return super()._build_suite_file(structure)
+        source = cast(Path, structure.source)
+        data, error, messages, languages = self._files[structure].result()
+        for level, message in messages:
+            LOGGER.write(message, level)
+        for lang in languages:
+            self.parsers[structure.extension].lang.add_language(lang)
+        if error is not None:
+            raise DataError(f"Parsing '{source}' failed: {error}")
+        suite = TestSuite.from_dict(data)
+        if not suite.tests:
+            LOGGER.info(f"Data source '{source}' has no tests or tasks.")
+        return suite
+
+    def _build_suite_directory(self, structure: SuiteDirectory):
+        result, messages = self._directories[structure]
+        for msg in messages:
+            LOGGER.message(msg)
+        if isinstance(result, DataError):
+            raise result
+        return result
+
+
+def parse_suite_file_in_worker(parser: RobotParser, source: Path, defaults: TestDefaults
+                               ) -> 'tuple[dict|None, str|None, list, list[str]]':
+    """Parses a suite file in a worker process.
+
+    Returns the parsed suite as a dictionary, possible error message, messages
+    logged during parsing and names of languages added by the file.
+    """
+    shared = parser.lang if isinstance(parser.lang, Languages) else None
+    before = list(shared or ())
+    with LOGGER.captured_messages as captured:
+        try:
+            data, error = parser.parse_suite_file(source, defaults).to_dict(), None
+        except DataError as err:
+            data, error = None, err.message
+    return (data, error, [(msg.level, msg.message) for msg in captured],
+            get_added_languages(shared, before))
+
+
 class ResourceFileBuilder:
 
-    def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True):
+    def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True,
+                 parse_cache: 'Path|str|None' = None):
         self.lang = lang
         self.process_curdir = process_curdir
+        self.cache = (ParseCache(parse_cache, lang, process_curdir)
+                      if parse_cache else None)
 
     def build(self, source: Path) -> ResourceFile:
         if not isinstance(source, Path):
@@ -294,9 +440,9 @@ class ResourceFileBuilder:
     def _parse(self, source: Path) -> ResourceFile:
         suffix = source.suffix.lower()
         if suffix in ('.rst', '.rest'):
-            parser = RestParser(self.lang, self.process_curdir)
+            parser = RestParser(self.lang, self.process_curdir, self.cache)
         elif suffix in ('.json', '.rsrc'):
             parser = JsonParser()
         else:
-            parser = RobotParser(self.lang, self.process_curdir)
+            parser = RobotParser(self.lang, self.process_curdir, self.cache)
         return parser.parse_resource_file(source)
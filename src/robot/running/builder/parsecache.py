@@ -0,0 +1,233 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import inspect
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
+
+from robot.conf import Language, Languages, LanguagesLike
+from robot.output import LOGGER
+from robot.output.loggerapi import LoggerApi
+from robot.utils import get_error_message
+from robot.version import get_version
+
+from ..model import TestSuite
+from ..resourcemodel import ResourceFile
+from .settings import TestDefaults
+
+
+T = TypeVar('T', TestSuite, ResourceFile)
+
+
+class ParseCache:
+    """Persistent on-disk cache for parsed suite, init and resource files.
+
+    Parsed models are stored in the given ``directory`` as JSON using their
+    ``to_dict`` methods. Entries are keyed by the file path, size, modification
+    time and content hash as well as by the used language configuration,
+    ``${CURDIR}`` processing, test defaults got from parent init files and
+    Robot Framework version. If anything does not match, the file is parsed
+    normally and the cache is updated.
+
+    Possible errors and warnings reported during parsing are stored along with
+    the model and reported again when the model is read from the cache.
+    Languages that ``Language: <lang>`` headers add to a shared ``Languages``
+    object are stored as well and added to it again.
+    Problems with the cache itself are never fatal, and they cause the file
+    to be parsed normally.
+    """
+
+    def __init__(self, directory: 'Path|str', lang: LanguagesLike = None,
+                 process_curdir: bool = True):
+        self.directory = Path(directory)
+        # Parsing adds languages in file headers to a shared `Languages` object.
+        # They affect parsing subsequent files and must be part of the key.
+        self.shared_languages = lang if isinstance(lang, Languages) else None
+        self._language_config = self._get_language_config(lang)
+        self.process_curdir = process_curdir
+
+    @property
+    def languages(self) -> 'list[str]':
+        if self.shared_languages:
+            return self._get_language_config(self.shared_languages)
+        return self._language_config
+
+    def _get_language_config(self, lang: LanguagesLike) -> 'list[str]':
+        languages = lang if isinstance(lang, Languages) else Languages(lang)
+        return [f'{type(lang).__module__}.{type(lang).__name__}'
+                for lang in languages]
+
+    def parse_suite_file(self, source: Path, defaults: TestDefaults,
+                         parse: Callable[[Path, TestDefaults], TestSuite]) -> TestSuite:
+        return self._get(source, 'suite', self._defaults_to_dict(defaults),
+                         lambda: parse(source, defaults), TestSuite.from_dict)
+
+    def parse_init_file(self, source: Path, defaults: TestDefaults,
+                        parse: Callable[[Path, TestDefaults], TestSuite]) -> TestSuite:
+        # Init files set defaults for their children. They are part of the
+        # cached data so that they can be restored when the cache is used.
+
+        def parse_init() -> 'tuple[TestSuite, dict]':
+            suite = parse(source, defaults)
+            return suite, self._own_defaults_to_dict(defaults)
+
+        def from_dict(data: dict) -> TestSuite:
+            own = data.pop('defaults')
+            defaults.setup = own['setup']
+            defaults.teardown = own['teardown']
+            defaults.tags = own['tags']
+            defaults.timeout = own['timeout']
+            return TestSuite.from_dict(data)
+
+        return self._get(source, 'init', self._defaults_to_dict(defaults.parent),
+                         parse_init, from_dict)
+
+    def parse_resource_file(self, source: Path,
+                            parse: Callable[[Path], ResourceFile]) -> ResourceFile:
+        return self._get(source, 'resource', None, lambda: parse(source),
+                         ResourceFile.from_dict)
+
+    def _defaults_to_dict(self, defaults: 'TestDefaults|None') -> 'dict|None':
+        if not defaults:
+            return None
+        return {'setup': defaults.setup,
+                'teardown': defaults.teardown,
+                'tags': list(defaults.tags),
+                'timeout': defaults.timeout}
+
+    def _own_defaults_to_dict(self, defaults: TestDefaults) -> dict:
+        return {'setup': defaults._setup,
+                'teardown': defaults._teardown,
+                'tags': list(defaults._tags),
+                'timeout': defaults._timeout}
+
+    def _get(self, source: Path, kind: str, defaults: 'dict|None',
+             parse: Callable, from_dict: Callable[[dict], T]) -> T:
+        try:
+            key = self._get_key(source, kind, defaults)
+        except OSError:
+            key = None
+        entry = self._read(key) if key else None
+        if entry is not None:
+            try:
+                model = from_dict(entry['data'])
+                for lang in entry['languages']:
+                    self.shared_languages.add_language(lang)
+            except Exception:
+                LOGGER.info(f"Reading parse cache entry for '{source}' failed: "
+                            f"{get_error_message()}")
+            else:
+                for level, message in entry['messages']:
+                    LOGGER.write(message, level)
+                return model
+        before = list(self.shared_languages or ())
+        with self._collect_messages() as messages:
+            parsed = parse()
+        if key:
+            languages = get_added_languages(self.shared_languages, before)
+            self._write(key, parsed, messages, languages)
+        return parsed[0] if isinstance(parsed, tuple) else parsed
+
+    def _get_key(self, source: Path, kind: str, defaults: 'dict|None') -> str:
+        stat = source.stat()
+        with open(source, 'rb') as file:
+            content = hashlib.sha256(file.read()).hexdigest()
+        key = {'version': get_version(),
+               'kind': kind,
+               'source': str(source),
+               'size': stat.st_size,
+               'mtime': stat.st_mtime_ns,
+               'content': content,
+               'languages': self.languages,
+               'curdir': self.process_curdir,
+               'defaults': defaults}
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def _read(self, key: str) -> 'dict|None':
+        try:
+            with open(self._get_path(key), encoding='UTF-8') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        return entry
+
+    def _write(self, key: str, parsed: 'T|tuple[TestSuite, dict]',
+               messages: 'list[tuple[str, str]]', languages: 'list[str]'):
+        if isinstance(parsed, tuple):
+            model, defaults = parsed
+            data = dict(model.to_dict(), defaults=defaults)
+        else:
+            data = parsed.to_dict()
+        entry = {'key': key, 'messages': messages, 'languages': languages,
+                 'data': data}
+        path = self._get_path(key)
+        temp = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp, 'w', encoding='UTF-8') as file:
+                json.dump(entry, file, ensure_ascii=False, default=str)
+            os.replace(temp, path)
+        except (OSError, TypeError, ValueError):
+            LOGGER.info(f"Writing parse cache entry '{path}' failed: "
+                        f"{get_error_message()}")
+            temp.unlink(missing_ok=True)
+
+    @contextmanager
+    def _collect_messages(self):
+        collector = MessageCollector()
+        LOGGER.register_logger(collector)
+        # Registering relays earlier messages to the collector. Ignore them.
+        collector.messages.clear()
+        try:
+            yield collector.messages
+        finally:
+            LOGGER.unregister_logger(collector)
+
+
+def get_added_languages(languages: 'Languages|None',
+                        before: 'list[Language]') -> 'list[str]':
+    """Returns names of languages added to ``languages`` after ``before``.
+
+    Returned names can be used with :meth:`Languages.add_language`.
+    """
+    if not languages:
+        return []
+    return get_language_names(lang for lang in languages if lang not in before)
+
+
+def get_language_names(languages: 'Iterable[Language]') -> 'list[str]':
+    """Returns names that can be used to add ``languages`` again."""
+    # Custom languages are added using module names or paths. Using paths
+    # works in both cases.
+    return [lang.code if type(lang).__module__ == Language.__module__
+            else inspect.getfile(type(lang)) for lang in languages]
+
+
+class MessageCollector(LoggerApi):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.level, msg.message))
@@ -24,6 +24,7 @@ from robot.utils import FileReader, get_error_message, read_rest_data, type_name
 
 from ..model import TestSuite
 from ..resourcemodel import ResourceFile
+from .parsecache import ParseCache
 from .settings import FileSettings, InitFileSettings, TestDefaults
 from .transformers import ResourceBuilder, SuiteBuilder
 
@@ -47,17 +48,29 @@ class Parser(ABC):
 class RobotParser(Parser):
     extensions = ()
 
-    def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True):
+    def __init__(self, lang: LanguagesLike = None, process_curdir: bool = True,
+                 cache: 'ParseCache|None' = None):
         self.lang = lang
         self.process_curdir = process_curdir
+        self.cache = cache
 
     def parse_suite_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
+        if self.cache:
+            return self.cache.parse_suite_file(source, defaults, self._parse_suite_file)
+        return self._parse_suite_file(source, defaults)
+
+    def _parse_suite_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
         model = get_model(self._get_source(source), data_only=True,
                           curdir=self._get_curdir(source), lang=self.lang)
         model.source = source
         return self.parse_model(model, defaults)
 
     def parse_init_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
+        if self.cache:
+            return self.cache.parse_init_file(source, defaults, self._parse_init_file)
+        return self._parse_init_file(source, defaults)
+
+    def _parse_init_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
         model = get_init_model(self._get_source(source), data_only=True,
                                curdir=self._get_curdir(source), lang=self.lang)
         model.source = source
@@ -79,6 +92,11 @@ class RobotParser(Parser):
         return source
 
     def parse_resource_file(self, source: Path) -> ResourceFile:
+        if self.cache:
+            return self.cache.parse_resource_file(source, self._parse_resource_file)
+        return self._parse_resource_file(source)
+
+    def _parse_resource_file(self, source: Path) -> ResourceFile:
         model = get_resource_model(self._get_source(source), data_only=True,
                                    curdir=self._get_curdir(source), lang=self.lang)
         model.source = source
@@ -29,12 +29,13 @@ RESOURCE_EXTENSIONS = {'.resource', '.robot', '.txt', '.tsv', '.rst', '.rest',
 
 class Importer:
 
-    def __init__(self):
+    def __init__(self, parse_cache=None):
         self._library_cache = ImportCache()
         self._resource_cache = ImportCache()
+        self._parse_cache = parse_cache
 
-    def reset(self):
-        self.__init__()
+    def reset(self, parse_cache=None):
+        self.__init__(parse_cache)
 
     def close_global_library_listeners(self):
         for lib in self._library_cache.values():
@@ -67,7 +68,8 @@ class Importer:
         if path in self._resource_cache:
             LOGGER.info(f"Found resource file '{path}' from cache.")
         else:
-            resource = ResourceFileBuilder(lang=lang).build(path)
+            resource = ResourceFileBuilder(lang=lang,
+                                           parse_cache=self._parse_cache).build(path)
             self._resource_cache[path] = resource
         return self._resource_cache[path]
 
@@ -13,9 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Generic, Literal, overload, TypeVar, TYPE_CHECKING
+from typing import Generic, Iterable, Literal, overload, TypeVar, TYPE_CHECKING
 
 from robot.utils import NormalizedDict, plural_or_not as s, seq2str
+from robot.variables import search_variable
 
 from .keywordimplementation import KeywordImplementation
 
@@ -67,9 +68,9 @@ class KeywordCache(Generic[K]):
 
     def __init__(self, keywords: 'list[K]'):
         self.normal = NormalizedDict[K](ignore='_')
-        self.embedded: list[K] = []
+        self.embedded = EmbeddedKeywordIndex[K]()
         add_normal = self.normal.__setitem__
-        add_embedded = self.embedded.append
+        add_embedded = self.embedded.add
         for kw in keywords:
             if kw.embedded:
                 add_embedded(kw)
@@ -80,7 +81,7 @@ class KeywordCache(Generic[K]):
         try:
             keywords = [self.normal[name]]
         except KeyError:
-            keywords = [kw for kw in self.embedded if kw.matches(name)]
+            keywords = self.embedded.find(name)
         if count is not None:
             if len(keywords) != count:
                 names = ': ' + seq2str([kw.name for kw in keywords]) if keywords else '.'
@@ -89,3 +90,96 @@ class KeywordCache(Generic[K]):
             if count == 1:
                 return keywords[0]
         return keywords
+
+
+class EmbeddedKeywordIndex(Generic[K]):
+    """Index for finding keywords accepting embedded arguments.
+
+    Keywords are stored in a trie based on the literal text before the first
+    embedded argument in their name. Keywords having no such prefix are stored
+    in another trie based on the literal text after the last argument. Only
+    keywords whose prefix or suffix matches the searched name need to be
+    matched using their regular expressions.
+
+    Literal parts are compared case-insensitively and a space matches any
+    whitespace the same way as with the actual regular expressions. Case-
+    insensitive matching of non-ASCII characters has special cases, so only
+    the ASCII part of the prefix and suffix is indexed, and a non-ASCII
+    character in the searched name matches all keywords in the remaining
+    subtree.
+    """
+
+    def __init__(self, keywords: 'Iterable[K]' = ()):
+        self.prefixes = _TrieNode[K]()
+        self.suffixes = _TrieNode[K]()
+        self.count = 0
+        for kw in keywords:
+            self.add(kw)
+
+    def add(self, keyword: K):
+        name = ' '.join(keyword.name.split())
+        first = search_variable(name, identifiers='$')
+        prefix = self._get_ascii_prefix(first.before)
+        if prefix:
+            self.prefixes.add(prefix, self.count, keyword)
+        else:
+            suffix = self._get_ascii_prefix(self._get_suffix(name)[::-1])
+            self.suffixes.add(suffix, self.count, keyword)
+        self.count += 1
+
+    def _get_ascii_prefix(self, string: str) -> str:
+        for index, char in enumerate(string):
+            if not char.isascii():
+                return string[:index].lower()
+        return string.lower()
+
+    def _get_suffix(self, name: str) -> str:
+        match = search_variable(name, identifiers='$')
+        while match:
+            name = match.after
+            match = search_variable(name, identifiers='$')
+        return name
+
+    def find(self, name: str) -> 'list[K]':
+        candidates = (self.prefixes.find(name)
+                      + self.suffixes.find(name[::-1]))
+        candidates.sort(key=lambda item: item[0])
+        return [kw for _, kw in candidates if kw.matches(name)]
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class _TrieNode(Generic[K]):
+    __slots__ = ['children', 'keywords']
+
+    def __init__(self):
+        self.children: 'dict[str, _TrieNode[K]]' = {}
+        self.keywords: 'list[tuple[int, K]]' = []
+
+    def add(self, key: str, index: int, keyword: K):
+        node = self
+        for char in key:
+            if char not in node.children:
+                node.children[char] = _TrieNode[K]()
+            node = node.children[char]
+        node.keywords.append((index, keyword))
+
+    def find(self, name: str) -> 'list[tuple[int, K]]':
+        node = self
+        found = list(node.keywords)
+        for char in name:
+            if not char.isascii():
+                for child in node.children.values():
+                    child._collect(found)
+                break
+            node = node.children.get(' ' if char.isspace() else char.lower())
+            if node is None:
+                break
+            found.extend(node.keywords)
+        return found
+
+    def _collect(self, found: 'list[tuple[int, K]]'):
+        found.extend(self.keywords)
+        for child in self.children.values():
+            child._collect(found)
@@ -48,6 +48,7 @@ from robot.variables import VariableResolver
 
 from .bodyrunner import ForRunner, GroupRunner, IfRunner, KeywordRunner, TryRunner, WhileRunner
 from .randomizer import Randomizer
+from .sharder import Sharder
 from .statusreporter import StatusReporter
 
 if TYPE_CHECKING:
@@ -695,12 +696,16 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         return cls.from_model(model, defaults=defaults)
 
     def configure(self, randomize_suites: bool = False, randomize_tests: bool = False,
-                  randomize_seed: 'int|None' = None, **options):
+                  randomize_seed: 'int|None' = None,
+                  shard: 'tuple[int, int]|None' = None,
+                  shard_timings: 'str|None' = None, **options):
         """A shortcut to configure a suite using one method call.
 
         Can only be used with the root test suite.
 
         :param randomize_xxx: Passed to :meth:`randomize`.
+        :param shard: Shard index and total number of shards as a tuple.
+            Passed to :meth:`shard` along with ``shard_timings``.
         :param options: Passed to
             :class:`~robot.model.configurer.SuiteConfigurer` that will then
             set suite attributes, call :meth:`filter`, etc. as needed.
@@ -715,8 +720,34 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         one call.
         """
         super().configure(**options)
+        if shard:
+            self.shard(*shard, timings=shard_timings,
+                       empty_suite_ok=options.get('empty_suite_ok', False))
         self.randomize(randomize_suites, randomize_tests, randomize_seed)
 
+    def shard(self, index: int, total: int, timings: 'str|None' = None,
+              empty_suite_ok: bool = False):
+        """Keeps only tests belonging to the specified shard.
+
+        :param index: Index of the shard to keep, starting from 1.
+        :param total: Total number of shards.
+        :param timings: Path to an earlier output file to read test durations
+            from. Tests are distributed so that durations of all shards are
+            as equal as possible. If not given, tests are split based on count.
+        :param empty_suite_ok: If ``False``, an error is raised if the shard
+            does not contain any tests.
+
+        Sharding is done before randomizing, so running all shards executes
+        each test exactly once also when the execution order is randomized.
+
+        New in Robot Framework 7.3.
+        """
+        Sharder(index, total, timings).shard(self)
+        if not (self.has_tests or empty_suite_ok):
+            items = {False: 'tests', True: 'tasks', None: 'tests or tasks'}[self.rpa]
+            raise DataError(f"Suite '{self.name}' contains no {items} "
+                            f"in shard {index}/{total}.")
+
     def randomize(self, suites: bool = True, tests: bool = True,
                   seed: 'int|None' = None):
         """Randomizes the order of suites and/or tests, recursively.
@@ -787,6 +818,7 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
         API for executing tests in files or directories.
         """
         from .namespace import IMPORTER
+        from .parallelrunner import ParallelSuiteRunner
         from .signalhandler import STOP_SIGNAL_MONITOR
         from .suiterunner import SuiteRunner
 
@@ -796,9 +828,12 @@ class TestSuite(model.TestSuite[Keyword, TestCase]):
                 LOGGER.register_console_logger(**settings.console_output_config)
             with pyloggingconf.robot_handler_enabled(settings.log_level):
                 with STOP_SIGNAL_MONITOR:
-                    IMPORTER.reset()
+                    IMPORTER.reset(settings.parse_cache)
                     output = Output(settings)
-                    runner = SuiteRunner(output, settings)
+                    if settings.processes > 1:
+                        runner = ParallelSuiteRunner(output, settings, self)
+                    else:
+                        runner = SuiteRunner(output, settings)
                     self.visit(runner)
                 output.close(runner.result)
         return runner.result
@@ -38,12 +38,13 @@ class Namespace:
     _library_import_by_path_ends = ('.py', '/', os.sep)
     _variables_import_by_path_ends = _library_import_by_path_ends + ('.yaml', '.yml') + ('.json',)
 
-    def __init__(self, variables, suite, resource, languages):
+    def __init__(self, variables, suite, resource, languages, lazy_libraries=False):
         LOGGER.info(f"Initializing namespace for suite '{suite.full_name}'.")
         self.variables = variables
         self.languages = languages
         self._imports = resource.imports
-        self._kw_store = KeywordStore(resource, languages)
+        self._kw_store = KeywordStore(resource, languages, self._import_lazy_library)
+        self._lazy_libraries = lazy_libraries
         self._imported_variable_files = ImportCache()
         self._suite_name = suite.full_name
         self._running_test = False
@@ -70,7 +71,9 @@ class Namespace:
                 item.report_error(err.message)
 
     def _import(self, import_setting):
-        action = import_setting.select(self._import_library,
+        import_library = (self._add_lazy_library if self._lazy_libraries
+                          else self._import_library)
+        action = import_setting.select(import_library,
                                        self._import_resource,
                                        self._import_variables)
         action(import_setting)
@@ -85,6 +88,7 @@ class Namespace:
             resource = IMPORTER.import_resource(path, self.languages)
             self.variables.set_from_variable_section(resource.variables, overwrite)
             self._kw_store.resources[path] = resource
+            self._kw_store.generation += 1
             self._handle_imports(resource.imports)
             LOGGER.resource_import(resource, import_setting)
         else:
@@ -130,10 +134,27 @@ class Namespace:
         if notify:
             LOGGER.library_import(lib, import_setting)
         self._kw_store.libraries[lib.name] = lib
+        self._kw_store.generation += 1
         lib.scope_manager.start_suite()
         if self._running_test:
             lib.scope_manager.start_test()
 
+    def _add_lazy_library(self, import_setting):
+        if import_setting.alias:
+            name = self.variables.replace_scalar(import_setting.alias)
+        else:
+            name = self._resolve_name(import_setting)
+            if self._is_import_by_path(Import.LIBRARY, name):
+                name = os.path.splitext(os.path.basename(name.rstrip('/' + os.sep)))[0]
+        LOGGER.info(f"Library '{name}' will be imported when it is needed.")
+        self._kw_store.lazy_libraries.append((name, import_setting))
+
+    def _import_lazy_library(self, import_setting):
+        try:
+            self._import_library(import_setting)
+        except DataError as err:
+            import_setting.report_error(err.message)
+
     def _resolve_name(self, setting):
         name = setting.name
         try:
@@ -165,6 +186,7 @@ class Namespace:
     def set_search_order(self, new_order):
         old_order = self._kw_store.search_order
         self._kw_store.search_order = new_order
+        self._kw_store.generation += 1
         return old_order
 
     def start_test(self):
@@ -199,12 +221,14 @@ class Namespace:
         return self._kw_store.get_library(name).instance
 
     def get_library_instances(self):
+        self._kw_store.import_lazy_libraries()
         return dict((name, lib.instance)
                     for name, lib in self._kw_store.libraries.items())
 
     def reload_library(self, name_or_instance):
         library = self._kw_store.get_library(name_or_instance)
         library.create_keywords()
+        self._kw_store.generation += 1
         return library
 
     def get_runner(self, name, recommend_on_failure=True):
@@ -220,12 +244,37 @@ class Namespace:
 
 class KeywordStore:
 
-    def __init__(self, suite_file, languages):
+    def __init__(self, suite_file, languages, import_lazy_library=None):
         self.suite_file = suite_file
         self.libraries = OrderedDict()
         self.resources = ImportCache()
         self.search_order = ()
         self.languages = languages
+        self.lazy_libraries = []
+        self._import_lazy_library = import_lazy_library
+        # Resolved runners are cached and the cache is invalidated when
+        # `generation` changes. It needs to be incremented when imports,
+        # the library search order, or keywords in libraries change.
+        self.generation = 0
+        self._runner_cache = {}
+        self._runner_cache_generation = 0
+
+    def import_lazy_libraries(self, name=None, count=None):
+        """Imports lazily imported libraries matching the given name or all.
+
+        ``count`` can be used to limit how many libraries are imported.
+        Returns ``True`` if any library was imported and ``False`` otherwise.
+        """
+        imported = 0
+        for item in list(self.lazy_libraries):
+            if count is not None and imported >= count:
+                break
+            lib_name, import_setting = item
+            if name is None or eq(lib_name, name):
+                self.lazy_libraries.remove(item)
+                self._import_lazy_library(import_setting)
+                imported += 1
+        return imported > 0
 
     def get_library(self, name_or_instance):
         if name_or_instance is None:
@@ -235,11 +284,16 @@ class KeywordStore:
         return self._get_lib_by_instance(name_or_instance)
 
     def _get_lib_by_name(self, name):
+        if self.lazy_libraries:
+            self.import_lazy_libraries(name)
         if name in self.libraries:
             return self.libraries[name]
         matches = [lib for lib in self.libraries.values() if eq(lib.name, name)]
         if len(matches) == 1:
             return matches[0]
+        # Name of a lazy library is not always known before it is imported.
+        if not matches and self.import_lazy_libraries():
+            return self._get_lib_by_name(name)
         self._no_library_found(name, multiple=bool(matches))
 
     def _no_library_found(self, name, multiple=False):
@@ -254,6 +308,33 @@ class KeywordStore:
         self._no_library_found(instance)
 
     def get_runner(self, name, recommend=True):
+        if not isinstance(name, str):
+            return self._get_uncached_runner(name, recommend)
+        if self._runner_cache_generation != self.generation:
+            self._runner_cache.clear()
+            self._runner_cache_generation = self.generation
+        key = (name, self._get_caller_source())
+        runner = self._runner_cache.get(key)
+        if runner is None:
+            runner = self._get_uncached_runner(name, recommend)
+            # Resolving can import lazy libraries and change the generation.
+            # Runners with warnings mentioning the caller cannot be shared.
+            if (self._runner_cache_generation == self.generation
+                    and not getattr(runner, 'caller_specific', False)):
+                self._runner_cache[key] = runner
+        # Runners may store state, such as embedded arguments, during execution.
+        return copy.copy(runner)
+
+    def _get_caller_source(self):
+        # Resolution depends on the caller's source in some cases. See
+        # `_get_runner_from_suite_file` and `_prioritize_same_file_or_public`.
+        ctx = EXECUTION_CONTEXTS.current
+        if not ctx:
+            return None
+        caller = ctx.user_keywords[-1] if ctx.user_keywords else ctx.test
+        return caller.source if caller else None
+
+    def _get_uncached_runner(self, name, recommend=True):
         runner = self._get_runner(name)
         if runner is None:
             self._raise_no_keyword_found(name, recommend)
@@ -330,6 +411,7 @@ class KeywordStore:
                     f"now, but this will change in Robot Framework 8.0."
                 )
                 runner.pre_run_messages += Message(message, level='WARN'),
+                runner.caller_specific = True
         return runner
 
     def _select_best_matches(self, keywords):
@@ -376,8 +458,14 @@ class KeywordStore:
         return keywords[0].create_runner(name, self.languages)
 
     def _get_runner_from_libraries(self, name):
+        if self.lazy_libraries:
+            for lib_name in self.search_order:
+                self.import_lazy_libraries(lib_name)
         keywords = [kw for lib in self.libraries.values()
                     for kw in lib.find_keywords(name)]
+        while not keywords and self.import_lazy_libraries(count=1):
+            keywords = [kw for lib in self.libraries.values()
+                        for kw in lib.find_keywords(name)]
         if not keywords:
             return None
         pre_run_message = None
@@ -441,8 +529,12 @@ class KeywordStore:
         )
 
     def _get_explicit_runner(self, name):
+        owner_and_kw_names = self._get_owner_and_kw_names(name)
+        if self.lazy_libraries:
+            for owner_name, _ in owner_and_kw_names:
+                self.import_lazy_libraries(owner_name)
         kws_and_names = []
-        for owner_name, kw_name in self._get_owner_and_kw_names(name):
+        for owner_name, kw_name in owner_and_kw_names:
             for owner in chain(self.libraries.values(), self.resources.values()):
                 if eq(owner.name, owner_name):
                     for kw in owner.find_keywords(kw_name):
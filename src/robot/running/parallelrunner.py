@@ -0,0 +1,147 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.output import LOGGER, pyloggingconf
+from robot.result import ExecutionResult, TestSuite as SuiteResult
+from robot.utils import get_error_message, text
+
+from .builder.parsecache import get_language_names
+from .model import TestSuite as SuiteData
+from .suiterunner import SuiteRunner
+
+
+class ParallelSuiteRunner(SuiteRunner):
+    """Runs child suites in separate worker processes.
+
+    The suite whose child suites are distributed is the first suite, starting
+    from the top level suite, that has more than one child suite. Its setup
+    and teardown, as well as setups and teardowns of its parents, are run in
+    the main process around the distributed children. Children are run in
+    workers using the normal :class:`~.suiterunner.SuiteRunner` and their
+    results are added to the output in the original order.
+
+    If the setup of the distributing suite fails or is skipped, children are
+    run in the main process, because they are not executed in that case anyway.
+    """
+
+    def __init__(self, output, settings, suite: SuiteData):
+        super().__init__(output, settings)
+        self.distributed = self._get_distributed(suite)
+
+    def _get_distributed(self, suite: SuiteData) -> 'SuiteData|None':
+        while len(suite.suites) == 1 and not suite.tests:
+            suite = suite.suites[0]
+        return suite if len(suite.suites) > 1 else None
+
+    def visit_suite(self, suite: SuiteData):
+        if suite is not self.distributed:
+            return super().visit_suite(suite)
+        self.start_suite(suite)
+        if self.suite_status.failed or self.suite_status.skipped:
+            suite.suites.visit(self)
+        else:
+            self._run_in_workers(suite.suites)
+        suite.tests.visit(self)
+        self.end_suite(suite)
+
+    def _run_in_workers(self, suites: 'list[SuiteData]'):
+        directory = Path(tempfile.mkdtemp(prefix='robot-processes-'))
+        try:
+            with ProcessPoolExecutor(self.settings.processes,
+                                     mp_context=get_context('spawn')) as executor:
+                futures = [executor.submit(run_suite_in_worker, self._serialize(suite),
+                                           self._get_worker_options(directory, i))
+                           for i, suite in enumerate(suites)]
+                for suite, future in zip(suites, futures):
+                    if self.suite_status.exit and future.cancel():
+                        suite.visit(self)
+                    else:
+                        self._add_result(suite, future)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def _get_worker_options(self, directory: Path, index: int) -> dict:
+        options = self.settings.get_worker_options(directory / f'{index}.json')
+        # Languages configured in files using `Language: <lang>` headers have
+        # been added to the settings when parsing and are not in the options.
+        options['language'] = get_language_names(self.settings.languages)
+        return options
+
+    def _serialize(self, suite: SuiteData) -> str:
+        # Parents are included, without their setups, teardowns and imports,
+        # so that full names and ids are same as when running sequentially.
+        data = suite.to_dict()
+        parent = suite.parent
+        while parent:
+            data = {'name': parent.name, 'source': parent.source,
+                    'rpa': parent.rpa, 'suites': [data]}
+            parent = parent.parent
+        return SuiteData.from_dict(data).to_json()
+
+    def _add_result(self, suite: SuiteData, future):
+        try:
+            result = ExecutionResult(future.result())
+        except Exception:
+            raise DataError(f"Running suite '{suite.full_name}' in a worker "
+                            f"process failed: {get_error_message()}")
+        child = result.suite
+        parent = suite.parent
+        while parent:
+            child = child.suites[0]
+            parent = parent.parent
+        self.suite_result.suites.append(child)
+        self.output.replay_suite(child)
+        for message in result.errors:
+            self.output.message(message)
+        if child.failed:
+            self.suite_status.failure_occurred()
+        self._clear_results(child)
+
+    def _clear_results(self, suite: SuiteResult):
+        self._clear_result(suite)
+        for test in suite.tests:
+            self._clear_result(test)
+        for child in suite.suites:
+            self._clear_results(child)
+
+
+def run_suite_in_worker(data: str, options: dict) -> str:
+    """Runs a suite serialized to JSON in a worker process.
+
+    Returns path to the output file containing the results.
+    """
+    from robot.conf import RobotSettings
+
+    settings = RobotSettings(options)
+    LOGGER.register_console_logger(**settings.console_output_config)
+    suite = SuiteData.from_json(data)
+    old_max_error_lines = text.MAX_ERROR_LINES
+    old_max_assign_length = text.MAX_ASSIGN_LENGTH
+    text.MAX_ERROR_LINES = settings.max_error_lines
+    text.MAX_ASSIGN_LENGTH = settings.max_assign_length
+    try:
+        with pyloggingconf.robot_handler_enabled(settings.log_level):
+            suite.run(settings)
+    finally:
+        text.MAX_ERROR_LINES = old_max_error_lines
+        text.MAX_ASSIGN_LENGTH = old_max_assign_length
+    return str(settings.output)
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any, Iterable, Literal, overload, Sequence, TYPE_CHECKING
 
 from robot import model
+from robot.errors import DataError
 from robot.model import BodyItem, create_fixture, DataDict, ModelObject, Tags
 from robot.output import LOGGER
 from robot.utils import NOT_SET, setter
@@ -257,6 +258,19 @@ class UserKeyword(KeywordImplementation):
         kw.body = self.body.to_dicts()
         return kw
 
+    @classmethod
+    def from_dict(cls, data: DataDict) -> 'UserKeyword':
+        try:
+            return super().from_dict(data)
+        except DataError:
+            if not data.get('error'):
+                raise
+        # Name contains invalid embedded arguments, which has already been
+        # reported when parsing. Need to set `_name` to bypass `@property`.
+        data = dict(data)
+        name = data.pop('name')
+        return super().from_dict(data).config(_name=name)
+
     def to_dict(self) -> DataDict:
         data: DataDict = {'name': self.name}
         for name, value in [('args', tuple(self._decorate_arg(a) for a in self.args)),
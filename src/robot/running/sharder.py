@@ -0,0 +1,100 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from statistics import median
+
+from robot.errors import DataError
+from robot.model import SuiteVisitor
+from robot.result import ExecutionResult
+from robot.utils import get_error_message
+
+
+class Sharder:
+    """Selects tests belonging to one shard out of ``total`` shards.
+
+    Tests are distributed using the greedy longest-processing-time algorithm
+    so that the total duration of tests in each shard is as equal as possible.
+    Durations are read from an earlier output file given as ``timings``.
+    Tests without earlier results get the median duration of other tests in
+    the same suite or, if there are no such tests, of all tests. If timings
+    are not given at all, every test has the same duration and tests are thus
+    split based on their count.
+
+    Sharding is deterministic so that running all shards with the same tests
+    and timings runs every test exactly once.
+    """
+
+    def __init__(self, index: int, total: int, timings: 'str|None' = None):
+        if not 1 <= index <= total:
+            raise DataError(f"Shard index must be between 1 and {total}, "
+                            f"got {index}.")
+        self.index = index
+        self.total = total
+        self.timings = self._read_timings(timings) if timings else {}
+
+    def _read_timings(self, path) -> 'dict[str, float]':
+        try:
+            suite = ExecutionResult(path, include_keywords=False).suite
+        except Exception:
+            raise DataError(f"Reading shard timings from '{path}' failed: "
+                            f"{get_error_message()}")
+        return {test.full_name: test.elapsed_time.total_seconds()
+                for test in suite.all_tests}
+
+    def shard(self, suite):
+        tests = list(suite.all_tests)
+        durations = self._get_durations(tests)
+        loads = [0.0] * self.total
+        selected = set()
+        # `sorted` is stable so tests having same duration keep their order.
+        for test in sorted(tests, key=lambda t: -durations[id(t)]):
+            shard = loads.index(min(loads))
+            loads[shard] += durations[id(test)]
+            if shard == self.index - 1:
+                selected.add(id(test))
+        suite.visit(ShardFilter(selected))
+
+    def _get_durations(self, tests) -> 'dict[int, float]':
+        known = {}
+        per_suite = {}
+        for test in tests:
+            duration = self.timings.get(test.full_name)
+            if duration is not None:
+                known[id(test)] = duration
+                per_suite.setdefault(id(test.parent), []).append(duration)
+        default = median(known.values()) if known else 1.0
+        estimates = {suite: median(durations)
+                     for suite, durations in per_suite.items()}
+        return {id(test): known.get(id(test),
+                                    estimates.get(id(test.parent), default))
+                for test in tests}
+
+
+class ShardFilter(SuiteVisitor):
+
+    def __init__(self, selected: 'set[int]'):
+        self.selected = selected
+
+    def start_suite(self, suite):
+        suite.tests = [t for t in suite.tests if id(t) in self.selected]
+
+    def end_suite(self, suite):
+        suite.suites = [s for s in suite.suites if s.has_tests]
+
+    def visit_test(self, test):
+        pass
+
+    def visit_keyword(self, keyword):
+        pass
@@ -71,7 +71,8 @@ class SuiteRunner(SuiteVisitor):
                                         self.settings.exit_on_failure,
                                         self.settings.exit_on_error,
                                         self.settings.skip_teardown_on_exit)
-        ns = Namespace(self.variables, result, data.resource, self.settings.languages)
+        ns = Namespace(self.variables, result, data.resource, self.settings.languages,
+                       self.settings.lazy_libraries)
         ns.start_suite()
         ns.variables.set_from_variable_section(data.resource.variables)
         EXECUTION_CONTEXTS.start_suite(result, ns, self.output,
@@ -60,7 +60,8 @@ from .platform import PY_VERSION, PYPY, UNIXY, WINDOWS, RERAISED_EXCEPTIONS
 from .recommendations import RecommendationFinder
 from .robotenv import get_env_var, set_env_var, del_env_var, get_env_vars
 from .robotinspect import is_init
-from .robotio import binary_file_writer, create_destination_directory, file_writer
+from .robotio import (binary_file_writer, create_destination_directory, file_writer,
+                      is_compressed, open_file, strip_compression_suffix)
 from .robotpath import abspath, find_file, get_link_path, normpath
 from .robottime import (elapsed_time_to_string, format_time, get_elapsed_time,
                         get_time, get_timestamp, secs_to_timestamp,
@@ -17,6 +17,7 @@ from io import BytesIO
 from os import fsdecode
 import re
 
+from .robotio import is_compressed, open_file
 from .robottypes import is_bytes, is_pathlike, is_string
 
 try:
@@ -39,7 +40,11 @@ class ETSource:
         return self._opened or self._source
 
     def _open_if_necessary(self, source):
-        if self._is_path(source) or self._is_already_open(source):
+        if self._is_path(source):
+            if is_compressed(self._path_to_string(source)):
+                return open_file(source, 'rb')
+            return None
+        if self._is_already_open(source):
             return None
         if is_bytes(source):
             return BytesIO(source)
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any, Dict, overload, TextIO
 
 from .error import get_error_message
+from .robotio import open_file
 from .robottypes import type_name
 
 
@@ -37,7 +38,7 @@ class JsonLoader:
 
     def _load(self, source):
         if self._is_path(source):
-            with open(source, encoding='UTF-8') as file:
+            with open_file(source, encoding='UTF-8') as file:
                 return json.load(file)
         if hasattr(source, 'read'):
             return json.load(source)
@@ -66,7 +67,7 @@ class JsonDumper:
         if not output:
             return json.dumps(data, **self.config)
         elif isinstance(output, (str, Path)):
-            with open(output, 'w', encoding='UTF-8') as file:
+            with open_file(output, 'w', encoding='UTF-8') as file:
                 json.dump(data, file, **self.config)
         elif hasattr(output, 'write'):
             json.dump(data, output, **self.config)
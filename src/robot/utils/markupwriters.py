@@ -20,15 +20,18 @@ from .robotio import file_writer
 
 class _MarkupWriter:
 
-    def __init__(self, output, write_empty=True, usage=None, preamble=True):
+    def __init__(self, output, write_empty=True, usage=None, preamble=True,
+                 compress=False):
         """
         :param output: Either an opened, file like object, or a path to the
             desired output file. In the latter case, the file is created
             and clients should use :py:meth:`close` method to close it.
         :param write_empty: Whether to write empty elements and attributes.
+        :param compress: Whether to compress the created file if its path
+            has a ``.gz`` or ``.xz`` suffix.
         """
         if is_string(output) or is_pathlike(output):
-            output = file_writer(output, usage=usage)
+            output = file_writer(output, usage=usage, compress=compress)
         self.output = output
         self._write_empty = write_empty
         if preamble:
@@ -13,7 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gzip
 import io
+import lzma
 import os.path
 from pathlib import Path
 
@@ -23,14 +25,51 @@ from .error import get_error_message
 from .robottypes import is_pathlike
 
 
-def file_writer(path=None, encoding='UTF-8', newline=None, usage=None):
+COMPRESSION_SUFFIXES = ('.gz', '.xz')
+
+
+def is_compressed(path: 'Path|str') -> bool:
+    """Returns ``True`` if the path has a ``.gz`` or ``.xz`` suffix."""
+    return os.path.splitext(path)[1].lower() in COMPRESSION_SUFFIXES
+
+
+def strip_compression_suffix(path: 'Path|str') -> Path:
+    """Returns the path without a possible ``.gz`` or ``.xz`` suffix."""
+    path = Path(path)
+    return path.with_suffix('') if is_compressed(path) else path
+
+
+def open_file(path: 'Path|str', mode: str = 'r', encoding: 'str|None' = None,
+              newline: 'str|None' = None, compress: bool = False):
+    """Opens a file so that files with ``.gz`` and ``.xz`` suffixes are
+    decompressed transparently.
+
+    Files opened for writing are compressed only if ``compress`` is true.
+    Compression levels favor speed over the compression ratio, because
+    output files are written while tests are running.
+    """
+    writing = 'r' not in mode
+    if not is_compressed(path) or (writing and not compress):
+        return open(path, mode, encoding=encoding, newline=newline)
+    if 'b' not in mode and 't' not in mode:
+        mode += 't'
+    if os.path.splitext(path)[1].lower() == '.gz':
+        level = {'compresslevel': 6} if writing else {}
+        return gzip.open(path, mode, encoding=encoding, newline=newline, **level)
+    level = {'preset': 1} if writing else {}
+    return lzma.open(path, mode, encoding=encoding, newline=newline, **level)
+
+
+def file_writer(path=None, encoding='UTF-8', newline=None, usage=None,
+                compress=False):
     if not path:
         return io.StringIO(newline=newline)
     if is_pathlike(path):
         path = str(path)
     create_destination_directory(path, usage)
     try:
-        return io.open(path, 'w', encoding=encoding, newline=newline)
+        return open_file(path, 'w', encoding=encoding, newline=newline,
+                         compress=compress)
     except EnvironmentError:
         usage = '%s file' % usage if usage else 'file'
         raise DataError("Opening %s '%s' failed: %s"
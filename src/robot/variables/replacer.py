@@ -13,13 +13,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import lru_cache
+
 from robot.errors import DataError, VariableError
 from robot.output import librarylogger as logger
 from robot.utils import (DotDict, escape, get_error_message, is_dict_like, is_list_like,
                          safe_str, type_name, unescape)
 
 from .finders import VariableFinder
-from .search import VariableMatch, search_variable
+from .search import search_variable, unescape_variable_syntax, VariableMatch
 
 
 class VariableReplacer:
@@ -58,9 +60,15 @@ class VariableReplacer:
     def _replace_list(self, items, ignore_errors):
         result = []
         for item in items:
-            match = search_variable(item, ignore_errors=ignore_errors)
-            value = self._replace(match, ignore_errors)
-            if match.is_list_variable() and is_list_like(value):
+            if isinstance(item, str):
+                template = get_template(item, ignore_errors)
+                value = self._replace_template(template, ignore_errors)
+                is_list_variable = template.is_list_variable
+            else:
+                match = search_variable(item, ignore_errors=ignore_errors)
+                value = self._replace(match, ignore_errors)
+                is_list_variable = match.is_list_variable()
+            if is_list_variable and is_list_like(value):
                 result.extend(value)
             else:
                 result.append(value)
@@ -73,6 +81,9 @@ class VariableReplacer:
         its value is returned. Otherwise, possible variables are replaced with
         'replace_string'. Result may be any object.
         """
+        if isinstance(item, str):
+            return self._replace_template(get_template(item, ignore_errors),
+                                          ignore_errors)
         if isinstance(item, VariableMatch):
             match = item
         else:
@@ -84,6 +95,10 @@ class VariableReplacer:
 
         Input can also be an already found VariableMatch.
         """
+        if isinstance(item, str):
+            result = self._replace_template(get_template(item, ignore_errors),
+                                            ignore_errors, custom_unescaper)
+            return safe_str(result)
         if isinstance(item, VariableMatch):
             match = item
         else:
@@ -91,6 +106,32 @@ class VariableReplacer:
         result = self._replace(match, ignore_errors, custom_unescaper or unescape)
         return safe_str(result)
 
+    def _replace_template(self, template, ignore_errors, unescaper=None):
+        if template.literal is not None:
+            return template.literal if not unescaper else unescaper(template.string)
+        if template.is_variable:
+            return self._get_template_variable_value(template.parts[0], ignore_errors)
+        parts = []
+        for part in template.parts:
+            if isinstance(part, TemplateVariable):
+                parts.append(self._get_template_variable_value(part, ignore_errors))
+            elif unescaper:
+                parts.append(unescaper(part[0]))
+            else:
+                parts.append(part[1])
+        if all(isinstance(p, (bytes, bytearray)) for p in parts):
+            return b''.join(parts)
+        return ''.join(safe_str(p) for p in parts)
+
+    def _get_template_variable_value(self, variable, ignore_errors):
+        if variable.resolved:
+            return self._get_variable_value(variable.match, ignore_errors,
+                                            resolve_base=False)
+        match = variable.match
+        match = VariableMatch(match.string, match.identifier, match.base,
+                              match.items, match.start, match.end)
+        return self._get_variable_value(match, ignore_errors)
+
     def _replace(self, match, ignore_errors, unescaper=unescape):
         if not match:
             return unescaper(match.string)
@@ -108,8 +149,9 @@ class VariableReplacer:
             return b''.join(parts)
         return ''.join(safe_str(p) for p in parts)
 
-    def _get_variable_value(self, match, ignore_errors):
-        match.resolve_base(self, ignore_errors)
+    def _get_variable_value(self, match, ignore_errors, resolve_base=True):
+        if resolve_base:
+            match.resolve_base(self, ignore_errors)
         # TODO: Do we anymore need to reserve `*{var}` syntax for anything?
         if match.identifier == '*':
             logger.warn(rf"Syntax '{match}' is reserved for future use. Please "
@@ -203,3 +245,63 @@ class VariableReplacer:
                                     f"or dictionary-like.")
             return DotDict(value)
         return value
+
+
+@lru_cache(maxsize=10000)
+def get_template(string, ignore_errors=False):
+    """Returns a cached :class:`ReplacementTemplate` for the given string."""
+    return ReplacementTemplate(string, ignore_errors)
+
+
+class ReplacementTemplate:
+    """Pre-parsed representation of a string possibly containing variables.
+
+    Finding variables from a string is relatively expensive and the same
+    strings, typically keyword arguments, are replaced over and over again
+    in loops. Templates contain the found variables and literal parts
+    between them so that replacing only requires looking up the variables
+    and joining the parts.
+    """
+    __slots__ = ['string', 'literal', 'parts', 'is_variable', 'is_list_variable']
+
+    def __init__(self, string, ignore_errors=False):
+        self.string = string
+        match = search_variable(string, ignore_errors=ignore_errors)
+        self.is_variable = match.is_variable()
+        self.is_list_variable = match.is_list_variable()
+        if not match:
+            self.literal = unescape(string)
+            self.parts = ()
+            return
+        self.literal = None
+        parts = []
+        while match:
+            if match.before:
+                parts.append((match.before, unescape(match.before)))
+            parts.append(TemplateVariable(match))
+            match = search_variable(match.after, ignore_errors=ignore_errors)
+        if match.string:
+            parts.append((match.string, unescape(match.string)))
+        self.parts = tuple(parts)
+
+
+class TemplateVariable:
+    """Variable in a :class:`ReplacementTemplate`.
+
+    If the variable base does not contain nested variables, it is resolved
+    already when the template is created and ``resolved`` is ``True``.
+    Otherwise, the base must be resolved separately every time using
+    a copy of the match.
+    """
+    __slots__ = ['match', 'resolved']
+
+    def __init__(self, match):
+        self.match = match
+        self.resolved = False
+        try:
+            internal = search_variable(match.base)
+        except DataError:
+            return
+        if not internal:
+            match.base = unescape_variable_syntax(match.base)
+            self.resolved = True
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from collections.abc import Mapping
+
 from robot.errors import DataError
 from robot.utils import (DotDict, is_dict_like, is_list_like, NormalizedDict, NOT_SET,
                          type_name)
@@ -22,10 +24,124 @@ from .resolvable import GlobalVariableValue, Resolvable
 from .search import is_assign, unescape_variable_syntax
 
 
+class LayeredVariableData(NormalizedDict):
+    """Variable data that shares unmodified items with its copies.
+
+    Copying does not copy the items. Instead, items set so far are frozen
+    into a layer that both the original and the copy refer to, and later
+    modifications are stored to separate local dictionaries. Removed items
+    that exist in shared layers are tracked by their normalized names.
+    """
+    max_layers = 8
+
+    def __init__(self, initial=None):
+        self._layers = ()
+        self._removed = frozenset()
+        super().__init__(initial, ignore='_')
+
+    @property
+    def normalized_keys(self):
+        return tuple(self._get_keys())
+
+    def _get_keys(self):
+        keys = {}
+        for data, layer_keys in reversed(self._layers):
+            keys.update(layer_keys)
+        keys.update(self._keys)
+        for key in self._removed:
+            keys.pop(key, None)
+        return keys
+
+    def __getitem__(self, key):
+        norm_key = self._normalize(key)
+        if norm_key in self._data:
+            return self._data[norm_key]
+        if norm_key not in self._removed:
+            for data, keys in self._layers:
+                if norm_key in data:
+                    return data[norm_key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        norm_key = self._normalize(key)
+        if norm_key not in self._keys:
+            self._keys[norm_key] = self._get_layer_key(norm_key) or key
+        self._data[norm_key] = value
+        if norm_key in self._removed:
+            self._removed = self._removed - {norm_key}
+
+    def _get_layer_key(self, norm_key):
+        if norm_key not in self._removed:
+            for data, keys in self._layers:
+                if norm_key in keys:
+                    return keys[norm_key]
+        return None
+
+    def __delitem__(self, key):
+        norm_key = self._normalize(key)
+        in_layers = self._get_layer_key(norm_key) is not None
+        if norm_key in self._data:
+            del self._data[norm_key]
+            del self._keys[norm_key]
+        elif not in_layers:
+            raise KeyError(key)
+        if in_layers:
+            self._removed = self._removed | {norm_key}
+
+    def __iter__(self):
+        keys = self._get_keys()
+        return (keys[norm_key] for norm_key in sorted(keys))
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def __contains__(self, key):
+        norm_key = self._normalize(key)
+        if norm_key in self._data:
+            return True
+        if norm_key in self._removed:
+            return False
+        return any(norm_key in data for data, keys in self._layers)
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return False
+        if not isinstance(other, NormalizedDict):
+            other = NormalizedDict(other, ignore='_')
+        return ({self._normalize(k): v for k, v in self.items()}
+                == {self._normalize(k): v for k, v in other.items()})
+
+    def copy(self):
+        if self._data:
+            self._freeze()
+        copy = type(self)()
+        copy._layers = self._layers
+        copy._removed = self._removed
+        copy._normalize = self._normalize
+        return copy
+
+    def _freeze(self):
+        if len(self._layers) < self.max_layers:
+            self._layers = ((self._data, self._keys),) + self._layers
+        else:
+            keys = self._get_keys()
+            data = {norm_key: self[norm_key] for norm_key in keys}
+            self._layers = ((data, keys),)
+            self._removed = frozenset()
+        self._data = {}
+        self._keys = {}
+
+    def clear(self):
+        self._data = {}
+        self._keys = {}
+        self._layers = ()
+        self._removed = frozenset()
+
+
 class VariableStore:
 
     def __init__(self, variables):
-        self.data = NormalizedDict(ignore='_')
+        self.data = LayeredVariableData()
         self._variables = variables
 
     def resolve_delayed(self, item=None):
@@ -6,12 +6,14 @@ import threading
 import tempfile
 import signal
 import logging
+import shutil
 from io import StringIO
 from os.path import abspath, curdir, dirname, exists, join
 from os import chdir, getenv
 
 from robot import run, run_cli, rebot, rebot_cli
 from robot.model import SuiteVisitor
+from robot.result import ExecutionResult
 from robot.running import namespace
 from robot.utils.asserts import assert_equal, assert_raises, assert_true
 
@@ -134,6 +136,44 @@ class TestRun(RunningTestCase):
         assert_equal(run_without_outputs(self.data, listener=[module_file+":1", Listener(2)]), 1)
         self._assert_outputs([("[from listener 1]", 1), ("[from listener 2]", 1)])
 
+    def test_processes(self):
+        data = join(ROOT, 'atest', 'testdata', 'misc', 'suites')
+        parallel = join(TEMP, 'parallel.xml')
+        self.remove_files.append(parallel)
+        assert_equal(run(data, output=parallel, log=None, report=None,
+                         processes=3, variable='SUITE_TEARDOWN_ARG:Torn down'), 1)
+        assert_equal(run(data, output=OUTPUT_PATH, log=None, report=None,
+                         variable='SUITE_TEARDOWN_ARG:Torn down'), 1)
+        expected = ExecutionResult(OUTPUT_PATH)
+        result = ExecutionResult(parallel)
+        assert_equal(result.suite.teardown.messages[0].message, 'Torn down')
+        assert_equal(result.suite.stat_message,
+                     expected.suite.stat_message)
+        for test, exp in zip(result.suite.all_tests, expected.suite.all_tests):
+            assert_equal((test.id, test.full_name, test.status),
+                         (exp.id, exp.full_name, exp.status))
+            assert_equal(len(test.body), len(exp.body))
+
+    def test_processes_with_languages_in_files(self):
+        data = tempfile.mkdtemp()
+        for name in 'a', 'b':
+            with open(join(data, f'{name}.robot'), 'w', encoding='UTF-8') as file:
+                file.write('Language: Finnish\n\n*** Testit ***\n'
+                           'BDD\n    Oletetaan Log    x\n'
+                           'Boolean\n    Log    <b>x</b>    html=Ei\n')
+        parallel = join(TEMP, 'parallel.xml')
+        self.remove_files.append(parallel)
+        try:
+            assert_equal(run(data, output=parallel, log=None, report=None,
+                             processes=2), 0)
+            assert_equal(run(data, output=OUTPUT_PATH, log=None, report=None), 0)
+        finally:
+            shutil.rmtree(data)
+        for output in OUTPUT_PATH, parallel:
+            tests = ExecutionResult(output).suite.all_tests
+            assert_equal([(t.status, t.body[0].messages[0].html) for t in tests],
+                         [('PASS', False)] * 4)
+
     def test_pre_run_modifier_as_instance(self):
         class Modifier(SuiteVisitor):
             def start_suite(self, suite):
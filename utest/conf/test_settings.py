@@ -136,7 +136,8 @@ class TestRobotAndRebotSettings(unittest.TestCase):
         settings = RobotSettings(
             name='N', doc=':doc:', metadata='m:d', settag='s',
             include='i', exclude='e', test='t', suite='s',
-            output='out.xml', loglevel='DEBUG:INFO', timestampoutputs=True
+            output='out.xml', loglevel='DEBUG:INFO', timestampoutputs=True,
+            processes=4
         ).get_rebot_settings()
         for name in 'Name', 'Doc', 'Output':
             assert_equal(settings[name], None)
@@ -144,6 +145,59 @@ class TestRobotAndRebotSettings(unittest.TestCase):
             assert_equal(settings[name], [])
         assert_equal(settings['LogLevel'], 'TRACE')
         assert_equal(settings['TimestampOutputs'], False)
+        assert_equal(settings.processes, 1)
+
+    def test_processes(self):
+        assert_equal(RobotSettings().processes, 1)
+        assert_equal(RobotSettings(processes=4).processes, 4)
+        assert_equal(RobotSettings(processes='2').processes, 2)
+        assert_equal(RobotSettings(processes=0).processes, 1)
+        self.assertRaises(DataError, RobotSettings, processes='many')
+
+    def test_compression_level(self):
+        assert_equal(RebotSettings().compression_level, 9)
+        assert_equal(RebotSettings(compressionlevel='0').compression_level, 0)
+        assert_equal(RebotSettings(compressionlevel=5).compression_level, 5)
+        for invalid in 'high', 10, -1:
+            self.assertRaises(DataError, RebotSettings, compressionlevel=invalid)
+
+    def test_async_output(self):
+        assert_equal(RobotSettings().async_output, False)
+        assert_equal(RobotSettings(asyncoutput=True).async_output, True)
+
+    def test_search_index_size(self):
+        assert_equal(RebotSettings().search_index_size, 0)
+        assert_equal(RebotSettings(searchindex='1000').search_index_size, 1000)
+        assert_equal(RobotSettings(searchindex=50).search_index_size, 50)
+        assert_equal(RebotSettings(searchindex=-1).search_index_size, 0)
+        self.assertRaises(DataError, RebotSettings, searchindex='big')
+
+    def test_shard(self):
+        assert_equal(RobotSettings().shard, None)
+        assert_equal(RobotSettings(shard='2/4').shard, (2, 4))
+        assert_equal(RobotSettings(shard=(1, 1)).shard, (1, 1))
+        assert_equal(RobotSettings(shard='1/2', shardtimings='x.xml').suite_config['shard_timings'],
+                     'x.xml')
+        for invalid in '0/2', '3/2', '1', 'a/b':
+            self.assertRaises(DataError, RobotSettings, shard=invalid)
+
+    def test_get_worker_options(self):
+        settings = RobotSettings(include='i', loglevel='DEBUG', processes=4,
+                                 listener='Listener.py', log='x.html', quiet=True)
+        options = settings.get_worker_options(Path('worker.json'))
+        assert_equal(options['include'], 'i')
+        assert_equal(options['loglevel'], 'DEBUG')
+        assert_equal(options['listener'], 'Listener.py')
+        assert_equal(options['output'], 'worker.json')
+        assert_equal(options['processes'], 1)
+        worker = RobotSettings(options)
+        assert_equal(worker.log, None)
+        assert_equal(worker.report, None)
+        assert_equal(worker.console_type, 'none')
+
+    def test_get_worker_options_does_not_support_listener_objects(self):
+        settings = RobotSettings(listener=['Listener.py', object()], processes=2)
+        self.assertRaises(DataError, settings.get_worker_options, Path('x.json'))
 
     def _verify_log_level(self, input, level=None, default=None):
         level = level or input
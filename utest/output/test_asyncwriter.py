@@ -0,0 +1,113 @@
+import os
+import tempfile
+import threading
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from robot.output.asyncwriter import AsyncFileWriter
+from robot.output.outputfile import OutputFile
+from robot.output.loglevel import LogLevel
+from robot.result import ExecutionResult, TestSuite
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
+
+
+class RecordingFile(StringIO):
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+        self.threads = set()
+        self.closed_value = None
+
+    def write(self, text):
+        self.writes.append(text)
+        self.threads.add(threading.current_thread().name)
+        return super().write(text)
+
+    def close(self):
+        self.closed_value = self.getvalue()
+        super().close()
+
+
+class FailingFile(RecordingFile):
+
+    def write(self, text):
+        raise OSError('No space left on device')
+
+
+class TestAsyncFileWriter(unittest.TestCase):
+
+    def test_text_is_written_in_blocks_in_background_thread(self):
+        file = RecordingFile()
+        writer = AsyncFileWriter(file, block_size=10)
+        for text in 'abc', 'def', 'ghijk', 'lm', 'n':
+            writer.write(text)
+        writer.flush()
+        assert_equal(file.writes, ['abcdefghijk', 'lmn'])
+        assert_equal(file.threads, {'RobotOutputWriter'})
+        writer.close()
+
+    def test_flush_and_tell(self):
+        file = RecordingFile()
+        writer = AsyncFileWriter(file)
+        writer.write('hello')
+        assert_equal(file.getvalue(), '')
+        assert_equal(writer.tell(), 5)
+        assert_equal(file.getvalue(), 'hello')
+        writer.write(', world!')
+        writer.flush()
+        assert_equal(file.getvalue(), 'hello, world!')
+        writer.close()
+
+    def test_close_writes_remaining_text_and_closes_file(self):
+        file = RecordingFile()
+        writer = AsyncFileWriter(file, block_size=3, queue_size=1)
+        for i in range(100):
+            writer.write(str(i))
+        writer.close()
+        assert_equal(file.closed_value, ''.join(str(i) for i in range(100)))
+        assert_true(file.closed)
+        assert_true(not writer._thread.is_alive())
+
+    def test_errors_are_raised_later(self):
+        file = FailingFile()
+        writer = AsyncFileWriter(file, block_size=1)
+        writer.write('x')
+        assert_raises_with_msg(OSError, 'No space left on device', writer.flush)
+        assert_raises_with_msg(OSError, 'No space left on device', writer.write, 'y')
+        assert_raises_with_msg(OSError, 'No space left on device', writer.close)
+        assert_true(file.closed)
+
+
+class TestAsyncOutputFile(unittest.TestCase):
+
+    def setUp(self):
+        self.path = Path(tempfile.gettempdir(), 'robot-utest-async.xml')
+
+    def tearDown(self):
+        for path in self.path, self.path.with_name(self.path.name + '.index'):
+            if path.exists():
+                os.remove(path)
+
+    def test_output_is_same_as_when_writing_synchronously(self):
+        for index in False, True:
+            output = OutputFile(self.path, LogLevel('INFO'), index=index,
+                                async_output=True)
+            assert_true(isinstance(output.file, AsyncFileWriter))
+            suite = TestSuite(name='Suite')
+            test = suite.tests.create(name='Test', status='PASS')
+            output.start_suite(suite, suite)
+            output.start_test(test, test)
+            output.end_test(test, test)
+            output.end_suite(suite, suite)
+            assert_true(self.path.read_text(encoding='UTF-8').endswith('</suite>\n'))
+            output.close()
+            result = ExecutionResult(self.path)
+            assert_equal(result.suite.tests[0].name, 'Test')
+            if index:
+                assert_equal(output.write_index().name, 'robot-utest-async.xml.index')
+
+
+if __name__ == '__main__':
+    unittest.main()
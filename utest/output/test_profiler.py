@@ -0,0 +1,80 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from robot.output.profiler import Profiler
+from robot.result import TestSuite
+from robot.utils.asserts import assert_equal
+
+
+def keyword(parent, name, owner=None, start=0, end=0, status='PASS'):
+    return parent.body.create_keyword(name=name, owner=owner, status=status,
+                                      start_time=f'2024-01-01 00:00:{start:09.6f}',
+                                      end_time=f'2024-01-01 00:00:{end:09.6f}')
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        suite = TestSuite()
+        test = suite.tests.create(name='T')
+        outer = keyword(test, 'Outer', start=0, end=10)
+        keyword(outer, 'Sleep', 'BuiltIn', start=1, end=3)
+        loop = outer.body.create_for(start_time='2024-01-01 00:00:04',
+                                     end_time='2024-01-01 00:00:09')
+        iteration = loop.body.create_iteration(start_time='2024-01-01 00:00:04',
+                                               end_time='2024-01-01 00:00:09')
+        recurse = keyword(iteration, 'Outer', start=4, end=8)
+        keyword(recurse, 'Sleep', 'BuiltIn', start=4, end=7)
+        keyword(recurse, 'Sleep', 'BuiltIn', status='NOT RUN')
+        self.profiler = Profiler.from_result(suite)
+
+    def test_keywords(self):
+        keywords = {key: p.to_dict() for key, p in self.profiler.keywords.items()}
+        assert_equal(keywords, {
+            ('', 'Outer'): {'owner': '', 'name': 'Outer', 'calls': 2,
+                            'total_time': 10.0, 'self_time': 4.0},
+            ('BuiltIn', 'Sleep'): {'owner': 'BuiltIn', 'name': 'Sleep', 'calls': 2,
+                                   'total_time': 5.0, 'self_time': 5.0}
+        })
+
+    def test_stacks(self):
+        assert_equal(self.profiler.stacks, {
+            'Outer': 3.0,
+            'Outer;BuiltIn.Sleep': 2.0,
+            'Outer;FOR': 0.0,
+            'Outer;ITERATION': 1.0,
+            'Outer;Outer': 1.0,
+            'Outer;Outer;BuiltIn.Sleep': 3.0
+        })
+
+    def test_write_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, 'profile.json')
+            self.profiler.write(path)
+            with open(path, encoding='UTF-8') as file:
+                data = json.load(file)
+            assert_equal([k['name'] for k in data['keywords']], ['Sleep', 'Outer'])
+            with open(Path(directory, 'profile.folded'), encoding='UTF-8') as file:
+                stacks = file.read().splitlines()
+            assert_equal(stacks, ['Outer 3000000',
+                                  'Outer;BuiltIn.Sleep 2000000',
+                                  'Outer;ITERATION 1000000',
+                                  'Outer;Outer 1000000',
+                                  'Outer;Outer;BuiltIn.Sleep 3000000'])
+
+    def test_write_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.csv')
+            self.profiler.write(path)
+            with open(path, encoding='UTF-8') as file:
+                lines = file.read().splitlines()
+            assert_equal(lines, ['owner,name,calls,total_time,self_time',
+                                 'BuiltIn,Sleep,2,5.0,5.0',
+                                 ',Outer,2,10.0,4.0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,8 @@ import unittest
 
 from robot.utils.asserts import assert_true, assert_equal
 from test_jsmodelbuilders import remap
-from robot.reporting.jsexecutionresult import (JsExecutionResult,
-                                               _KeywordRemover, StringIndex)
+from robot.reporting.jsexecutionresult import (JsExecutionResult, _KeywordRemover,
+                                               _TestPageMerger, StringIndex)
 from robot.reporting.jsmodelbuilders import SuiteBuilder, JsBuildingContext
 from robot.result import TestSuite
 
@@ -90,5 +90,33 @@ class TestRemoveDataNotNeededInReport(unittest.TestCase):
         assert_true('errors' not in result.data)
 
 
+class TestMergeTestPagesToReport(unittest.TestCase):
+
+    def test_merge(self):
+        suite = TestSuite(name='root')
+        for index in range(5):
+            test = suite.tests.create(name=f'test {index}', tags=['tag', f't{index}'])
+            test.body.create_keyword(name='keyword')
+        context = JsBuildingContext(split_log=True)
+        expected = remap(SuiteBuilder(context).build(suite.deepcopy()), context.strings)
+        expected = self._remove_keywords(expected)
+        context = JsBuildingContext(split_log=True, test_page_size=2)
+        model = SuiteBuilder(context).build(suite)
+        assert_equal(model[7], (3, 6, 8))
+        merged, strings = _TestPageMerger(context.split_results).merge(
+            model, context.strings
+        )
+        assert_equal(self._remove_keywords(remap(merged, strings)), expected)
+        assert_equal(len(strings), len(set(strings)))
+        result = JsExecutionResult(suite=model, strings=context.strings, errors=(),
+                                   statistics={}, split_results=context.split_results)
+        result.remove_data_not_needed_in_report()
+        assert_equal(len(result.suite[7]), 5)
+        assert_equal([test[-1] for test in result.suite[7]], [()] * 5)
+
+    def _remove_keywords(self, suite):
+        return suite[:7] + (tuple(test[:-1] for test in suite[7]),) + suite[8:]
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,14 +1,16 @@
 import base64
+import re
 import unittest
 import zlib
 from pathlib import Path
 
 from robot.utils.asserts import assert_equal, assert_true
-from robot.result import Keyword, Message, TestCase, TestSuite, For, ForIteration
+from robot.result import (ExecutionResult, Keyword, Message, Result, ResultStream,
+                          TestCase, TestSuite, For, ForIteration)
 from robot.result.executionerrors import ExecutionErrors
 from robot.model import Statistics, BodyItem
 from robot.reporting.jsmodelbuilders import (
-    ErrorsBuilder, JsBuildingContext, BodyItemBuilder, MessageBuilder,
+    ErrorsBuilder, JsBuildingContext, JsModelBuilder, BodyItemBuilder, MessageBuilder,
     StatisticsBuilder, SuiteBuilder, TestBuilder
 )
 from robot.reporting.stringcache import StringIndex
@@ -182,14 +184,16 @@ class TestBuildTestSuite(unittest.TestCase):
         suite.setup.config(name='s1', start_time='2011-12-05 00:33:33.334')
         suite.setup.body.create_message('Message', timestamp='2011-12-05 00:33:33.343')
         suite.setup.body.create_message(level='DEBUG', timestamp='2011-12-05 00:33:33.344')
-        suite.tests.create(start_time='2011-12-05 00:33:34.333')
+        suite.tests.create(start_time='2011-12-05 00:33:34.333', elapsed_time=0.5)
         context = JsBuildingContext()
         model = SuiteBuilder(context).build(suite)
-        self._verify_status(model[5], start=0)
+        self._verify_status(model[5], start=0, elapsed=500)
         self._verify_status(model[-2][0][8], start=1)
         self._verify_mapped(model[-2][0][-1], context.strings,
                             ((10, 2, 'Message'), (11, 1, '')))
-        self._verify_status(model[-3][0][4], start=1000)
+        self._verify_status(model[-3][0][4], start=1000, elapsed=500)
+        # Times set as strings are not converted in the model.
+        assert_equal(suite.tests[0]._start_time, '2011-12-05 00:33:34.333')
 
     def test_if(self):
         test = TestSuite().tests.create()
@@ -376,6 +380,35 @@ class TestSplitting(unittest.TestCase):
         sub.tests.create('test', doc='tdoc').body.create_keyword('koowee', doc='kdoc')
         return suite
 
+    def test_test_pages(self):
+        suite = self._get_suite_with_tests()
+        suite.tests.create('t3').body.create_keyword('t3-k1')
+        expected, _ = self._build_and_remap(suite)
+        expected_split = [expected[-3][0][-1], expected[-3][1][-1],
+                          expected[-3][:2], expected[-3][2][-1], expected[-3][2:]]
+        expected_split[2][0][-1], expected_split[2][1][-1] = 1, 2
+        expected_split[4][0][-1] = 4
+        expected[-3] = [3, 5]
+        context = JsBuildingContext(split_log=True, test_page_size=2)
+        model = self._to_list(remap(SuiteBuilder(context).build(suite),
+                                    context.strings))
+        assert_equal(context.strings, ('*', '*suite'))
+        assert_equal(model, expected)
+        assert_equal([strings for _, strings in context.split_results],
+                     [('*', '*t1-k1', '*t1-k1-k1', '*t1-k2'), ('*', '*t2-k1'),
+                      ('*', '*t1', '*t2'), ('*', '*t3-k1'), ('*', '*t3')])
+        assert_equal([self._to_list(remap(*res)) for res in context.split_results],
+                     expected_split)
+
+    def test_no_test_pages_without_split_log_or_with_few_tests(self):
+        suite = self._get_suite_with_tests()
+        expected, _ = self._build_and_remap(suite)
+        for split_log, page_size in [(False, 1), (True, 2)]:
+            context = JsBuildingContext(split_log=split_log, test_page_size=page_size)
+            model = SuiteBuilder(context).build(suite)
+            assert_equal(len(model[-3]), 2)
+            assert_true(all(isinstance(test, tuple) for test in model[-3]))
+
     def test_message_linking(self):
         suite = self._get_suite_with_keywords()
         msg1 = suite.setup.body[0].body.create_message(
@@ -556,5 +589,121 @@ class TestBuildErrors(unittest.TestCase):
                              (0, 3, 'Linkable', 's1-t1-k1')))
 
 
+class TestSearchIndex(unittest.TestCase):
+
+    def test_no_index_by_default(self):
+        result = JsModelBuilder().build_from(Result(suite=TestSuite(name='S')))
+        assert_equal(result.data['search_index'], None)
+
+    def test_ids_match_model_ids(self):
+        result = ExecutionResult(CURDIR.parent / 'result' / 'golden.xml')
+        index = self._build(result.suite)
+        expected = {}
+        for item in self._all_items(result.suite):
+            name = getattr(item, 'name', None) or ''
+            for word in re.findall(r'\w{3,}', name.lower()):
+                expected.setdefault(word, set()).add(item.id)
+        for word, ids in expected.items():
+            assert_true(ids <= self._find(index, word), word)
+        assert_equal(self._find(index, 'first'), {'s1-t1'})
+        assert_equal(self._find(index, 'wrong'), {'s1-t1-k4'})
+
+    def test_words(self):
+        suite = TestSuite(name='Suite')
+        test = suite.tests.create('Test Ähtäri', tags=['my-tag'])
+        kw = test.body.create_keyword('Keyword', owner='Lib', args=['a', 'abc'])
+        kw.body.create_message('<b>Bold</b> and <a href="x">link</a>', html=True)
+        kw.body.create_message('<not html>' + 'x' * 50)
+        index = self._build(suite)
+        assert_equal(set(index['tokens']),
+                     {'suite', 'test', 'ähtäri', 'tag', 'keyword', 'lib', 'abc',
+                      'bold', 'and', 'link', 'not', 'html', 'x' * 30})
+        assert_equal(self._find(index, 'abc'), {'s1-t1-k1'})
+        assert_equal(self._find(index, 'ähtäri'), {'s1-t1'})
+        assert_equal(self._find(index, 'html'), {'s1-t1-k1'})
+
+    def test_failures(self):
+        suite = TestSuite(name='Suite')
+        suite.setup.config(name='Setup', status='PASS')
+        suite.tests.create('Passing', status='PASS')
+        test = suite.tests.create('Failing', status='FAIL')
+        test.body.create_keyword('Failing', status='FAIL')
+        child = suite.suites.create(name='Child')
+        child.teardown.config(name='Teardown', status='FAIL')
+        child.tests.create('Skipped', status='SKIP')
+        index = self._build(suite)
+        assert_equal(self._ids(index, index['failures']), ['s1-s1-k1', 's1-t2'])
+        assert_equal(self._find(index, 'failing'), {'s1-t2', 's1-t2-k1'})
+        assert_equal(index['truncated'], False)
+
+    def test_size_limit(self):
+        suite = TestSuite(name='Suite')
+        for i in range(10):
+            suite.tests.create(f'Test {i}xx', status='FAIL')
+        index = self._build(suite, size=6)
+        assert_equal(len(index['failures']) + sum(len(items) for items in
+                                                   index['tokens'].values()), 6)
+        assert_equal(self._find(index, 'test'), {'s1-t1', 's1-t2'})
+        assert_equal(index['truncated'], True)
+
+    def test_index_is_not_included_in_report(self):
+        result = JsModelBuilder(search_index_size=10).build_from(
+            Result(suite=TestSuite(name='Suite'))
+        )
+        assert_equal(result.data['search_index']['tokens'], {'suite': (0,)})
+        result.remove_data_not_needed_in_report()
+        assert_true('search_index' not in result.data)
+
+    def _build(self, suite, size=1000):
+        builder = JsModelBuilder(search_index_size=size)
+        return builder.build_from(Result(suite=suite)).data['search_index']
+
+    def _all_items(self, item):
+        yield item
+        for child in getattr(item, 'suites', ()):
+            yield from self._all_items(child)
+        for child in getattr(item, 'tests', ()):
+            yield from self._all_items(child)
+        if getattr(item, 'has_setup', False):
+            yield from self._all_items(item.setup)
+        for child in getattr(item, 'body', ()):
+            if child.type != child.MESSAGE:
+                yield from self._all_items(child)
+        if getattr(item, 'has_teardown', False):
+            yield from self._all_items(item.teardown)
+
+    def _find(self, index, word):
+        return set(self._ids(index, index['tokens'].get(word, ())))
+
+    def _ids(self, index, indices):
+        def get_id(i):
+            parent, part = index['ids'][i*2:i*2+2]
+            return part if parent < 0 else f'{get_id(parent)}-{part}'
+        return [get_id(i) for i in indices]
+
+
+class TestBuildFromStream(unittest.TestCase):
+
+    def test_model_is_same_as_report_model_built_from_result(self):
+        sources = [CURDIR.parent / 'result' / name
+                   for name in ('golden.xml', 'suite_teardown_failed.xml')]
+        stream = ResultStream(*sources)
+        stream.configure(suite_config={'set_tags': ['new']},
+                         stat_config={'suite_stat_level': 1})
+        streamed = JsModelBuilder().build_from_stream(stream)
+        result = ExecutionResult(*sources, include_keywords=False)
+        result.configure(suite_config={'set_tags': ['new']},
+                         stat_config={'suite_stat_level': 1})
+        expected = JsModelBuilder().build_from(result)
+        expected.remove_data_not_needed_in_report()
+        assert_equal(streamed.suite, expected.suite)
+        assert_equal(streamed.strings, expected.strings)
+        streamed.data.pop('generated')
+        expected.data.pop('generated')
+        assert_equal(streamed.data, expected.data)
+        assert_equal(streamed.min_level, expected.min_level)
+        assert_equal(streamed.split_results, [])
+
+
 if __name__ == '__main__':
     unittest.main()
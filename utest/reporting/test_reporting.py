@@ -1,13 +1,19 @@
 from io import StringIO
+from pathlib import Path
+import tempfile
 import unittest
 
+from robot.errors import DataError
 from robot.output import LOGGER
-from robot.reporting.resultwriter import ResultWriter, Results
+from robot.output.loggerapi import LoggerApi
+from robot.reporting.resultwriter import ConcurrentFileWriter, ResultWriter, Results
 from robot.result.executionerrors import ExecutionErrors
 from robot.result import TestSuite, Result
-from robot.utils.asserts import assert_true, assert_equal
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
 
 
+CURDIR = Path(__file__).resolve().parent
+
 LOGGER.unregister_console_logger()
 
 
@@ -73,6 +79,80 @@ class TestReporting(unittest.TestCase):
         for test in result.suite.tests:
             assert_equal(len(test.body), 0)
 
+    def test_low_memory(self):
+        source = str(CURDIR.parent / 'result' / 'golden.xml')
+        report = ClosableOutput('report.html')
+        xunit = ClosableOutput('xunit.xml')
+        settings = StubSettings(report=report, xunit=xunit, low_memory=True,
+                                merge=False, pre_rebot_modifiers=[], rpa=None)
+        rc = ResultWriter(source).write_results(settings)
+        assert_equal(rc, 0)
+        assert_equal(settings.rpa, False)
+        for content in report.value, xunit.value:
+            assert_true('Normal' in content)
+            assert_true('First One' in content)
+        assert_true('Test case documentation' in report.value)
+
+    def test_low_memory_does_not_support_all_settings(self):
+        source = str(CURDIR.parent / 'result' / 'golden.xml')
+        for invalid in ({'log': 'log.html'}, {'output': 'output.xml'},
+                        {'profile': 'profile.json'}, {'merge': True},
+                        {'pre_rebot_modifiers': ['Modifier']}):
+            settings = dict(low_memory=True, merge=False, pre_rebot_modifiers=[])
+            settings.update(invalid)
+            assert_raises(DataError, ResultWriter(source).write_results,
+                          StubSettings(**settings))
+        assert_raises(DataError, ResultWriter(self._get_execution_result()).write_results,
+                      StubSettings(low_memory=True))
+
+    @unittest.skipIf(not ConcurrentFileWriter.is_supported(),
+                     'Forking processes not supported.')
+    def test_concurrent_writing(self):
+        logger = ResultFileLogger()
+        LOGGER.register_logger(logger)
+        # Registering relays earlier messages to the logger. Ignore them.
+        logger.errors.clear()
+        logger.files.clear()
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = {name: Path(tmp, f'{name}.{ext}') for name, ext in
+                         [('output', 'xml'), ('xunit', 'xml'), ('log', 'html'),
+                          ('report', 'html')]}
+                self._write_results(processes=2, **paths)
+                self._verify_output(paths['output'].read_text(encoding='UTF-8'))
+                self._verify_xunit(paths['xunit'].read_text(encoding='UTF-8'))
+                self._verify_log(paths['log'].read_text(encoding='UTF-8'))
+                self._verify_report(paths['report'].read_text(encoding='UTF-8'))
+                assert_equal(logger.files, [('Output', paths['output']),
+                                            ('XUnit', paths['xunit']),
+                                            ('Log', paths['log']),
+                                            ('Report', paths['report'])])
+                assert_equal(logger.errors, [])
+        finally:
+            LOGGER.unregister_logger(logger)
+
+    @unittest.skipIf(not ConcurrentFileWriter.is_supported(),
+                     'Forking processes not supported.')
+    def test_concurrent_writing_errors(self):
+        logger = ResultFileLogger()
+        LOGGER.register_logger(logger)
+        # Registering relays earlier messages to the logger. Ignore them.
+        logger.errors.clear()
+        logger.files.clear()
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                invalid = Path(tmp, 'file.txt')
+                invalid.write_text('Not a directory.')
+                report = Path(tmp, 'report.html')
+                self._write_results(processes=2, output=invalid / 'output.xml',
+                                    report=report)
+                self._verify_report(report.read_text(encoding='UTF-8'))
+                assert_equal(logger.files, [('Report', report)])
+                assert_equal(len(logger.errors), 1)
+                assert_true(logger.errors[0].startswith('Opening output file'))
+        finally:
+            LOGGER.unregister_logger(logger)
+
     def _write_results(self, **settings):
         result = self._get_execution_result()
         settings = StubSettings(**settings)
@@ -128,17 +208,36 @@ class StubSettings:
     report_config = None
     output = None
     xunit = None
+    profile = None
+    low_memory = False
     status_rc = True
     suite_config = {}
     statistics_config = {}
     xunit_skip_noncritical = False
     expand_keywords = None
     legacy_output = False
+    processes = 1
+    compression_level = 9
+    search_index_size = 0
 
     def __init__(self, **settings):
         self.__dict__.update(settings)
 
 
+class ResultFileLogger(LoggerApi):
+
+    def __init__(self):
+        self.files = []
+        self.errors = []
+
+    def result_file(self, kind, path):
+        self.files.append((kind, path))
+
+    def message(self, msg):
+        if msg.level == 'ERROR':
+            self.errors.append(msg.message)
+
+
 class ClosableOutput:
 
     def __init__(self, path):
@@ -1,7 +1,9 @@
+import base64
 import time
 import random
 import string
 import unittest
+import zlib
 
 from robot.reporting.stringcache import StringCache, StringIndex
 from robot.utils.asserts import assert_equal, assert_true, assert_false
@@ -60,6 +62,37 @@ class TestStringCache(unittest.TestCase):
             assert_true(i1 is i2, 'not same: %s and %s' % (i1, i2))
 
 
+class SmallBatchStringCache(StringCache):
+    _batch_size = 1000
+    _parallel_threshold = 5000
+
+
+class TestDumpingInWorkers(unittest.TestCase):
+
+    def test_same_result_as_in_main_process(self):
+        cache = SmallBatchStringCache()
+        for i in range(100):
+            cache.add(f'{i} ' * i, html=i % 2 == 0)
+        assert_true(len(cache._get_batches(list(cache._cache))) > 1)
+        assert_equal(cache.dump(processes=2), cache.dump())
+
+    def test_not_enough_data_for_workers(self):
+        cache = SmallBatchStringCache()
+        cache.add('long' * 1000)
+        assert_equal(len(cache._get_batches(list(cache._cache))), 1)
+
+    def test_compression_level(self):
+        text = 'Hello, world! ' * 100
+        for level in range(10):
+            cache = StringCache(compression_level=level)
+            cache.add(text)
+            encoded = cache.dump()[1]
+            if level == 0:
+                assert_equal(encoded, '*' + text)
+            else:
+                assert_equal(zlib.decompress(base64.b64decode(encoded)).decode(), text)
+
+
 class TestStringIndex(unittest.TestCase):
 
     def test_to_string(self):
@@ -0,0 +1,155 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.result import ExecutionResult, Result
+from robot.result.jsonbuilder import JsonReader, JsonResultBuilder
+from robot.utils.asserts import (assert_equal, assert_raises, assert_raises_with_msg,
+                                 assert_true)
+
+
+CURDIR = Path(__file__).resolve().parent
+GOLDEN_XML = CURDIR / 'golden.xml'
+SUITE_TEARDOWN_FAILED = CURDIR / 'suite_teardown_failed.xml'
+
+
+def to_json(xml):
+    # Robot writes JSON outputs without handling suite teardown failures.
+    data = xml.read_text(encoding='UTF-8').replace('generator="Robot ', 'generator="Rebot ')
+    return ExecutionResult(data).to_json().replace('"Rebot ', '"Robot ', 1)
+
+
+class SmallChunkReader(JsonReader):
+    chunk_size = 7
+
+
+class TestJsonReader(unittest.TestCase):
+    data = '{"a": 1, "b": [1, 2.5, {"c": "ä\\"}"}], "d": {}, "e": [], "ö": null}'
+
+    def test_keys_items_and_values(self):
+        for source in (self.data, self.data.encode('UTF-8'),
+                       io.StringIO(self.data), io.BytesIO(self.data.encode('UTF-8'))):
+            with SmallChunkReader(source) as reader:
+                collected = []
+                for key in reader.keys():
+                    if key == 'b':
+                        collected.append([reader.value() for _ in reader.items()])
+                    elif key == 'd':
+                        collected.append(list(reader.keys()))
+                    else:
+                        collected.append(reader.value())
+                assert_equal(collected, [1, [1, 2.5, {'c': 'ä"}'}], [], [], None])
+                assert_equal(reader.peek(), '')
+
+    def test_numbers_split_between_chunks(self):
+        for data in '[1234567890123, 1.5e10]', '1234567890123':
+            with SmallChunkReader(io.StringIO(data)) as reader:
+                assert_equal(reader.value(), json.loads(data))
+
+    def test_invalid_data(self):
+        for data, error in [('{"a" 1}', "Expecting ':'"),
+                            ('{"a": 1 "b": 2}', "Expecting ',' or '}'"),
+                            ('{"a": x}', 'Expecting value'),
+                            ('{1: 2}', 'Expecting property name enclosed in double quotes')]:
+            with SmallChunkReader(io.StringIO(data)) as reader:
+                try:
+                    for key in reader.keys():
+                        reader.value()
+                except ValueError as err:
+                    assert_equal(str(err).split(': char')[0], f'Invalid JSON data: {error}')
+                else:
+                    raise AssertionError(f'No error with {data!r}.')
+
+
+class TestJsonResultBuilder(unittest.TestCase):
+
+    def _build(self, data, **config):
+        return JsonResultBuilder(io.StringIO(data), **config).build(Result())
+
+    def test_same_result_as_with_xml(self):
+        for xml in GOLDEN_XML, SUITE_TEARDOWN_FAILED:
+            expected = ExecutionResult(xml)
+            result = self._build(to_json(xml))
+            assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+            assert_equal(result.statistics.to_dict(), expected.statistics.to_dict())
+            assert_equal(result.errors.messages.to_dicts(),
+                         expected.errors.messages.to_dicts())
+
+    def test_include_keywords(self):
+        for xml in GOLDEN_XML, SUITE_TEARDOWN_FAILED:
+            expected = ExecutionResult(xml, include_keywords=False)
+            result = self._build(to_json(xml), include_keywords=False)
+            assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+
+    def test_flattened_keywords(self):
+        for flatten in (['name:*'], ['for', 'while', 'iteration'], ['tag:*'],
+                        ['name:BuiltIn.Log', 'foritem'], ['name:*', 'tag:*']):
+            for xml in GOLDEN_XML, SUITE_TEARDOWN_FAILED:
+                expected = ExecutionResult(xml, flattened_keywords=flatten)
+                result = self._build(to_json(xml), flattened_keywords=flatten)
+                assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+
+    def test_suite_teardown_failures_are_handled_with_robot_outputs(self):
+        expected = ExecutionResult(SUITE_TEARDOWN_FAILED)
+        result = self._build(to_json(SUITE_TEARDOWN_FAILED))
+        assert_equal([t.message for t in result.suite.all_tests],
+                     [t.message for t in expected.suite.all_tests])
+        assert_equal(result.suite.statistics.message,
+                     expected.suite.statistics.message)
+        handled = self._build(result.to_json())
+        assert_equal([t.message for t in handled.suite.all_tests],
+                     [t.message for t in expected.suite.all_tests])
+
+    def test_repeating_values_are_interned(self):
+        data = ExecutionResult(CURDIR / 'goldenTwice.xml').to_json()
+        test1, test2 = self._build(data).suite.all_tests
+        kw1, kw2 = test1.body[0], test2.body[0]
+        for attr in 'name', 'owner', 'doc', 'status':
+            assert_true(getattr(kw1, attr) is getattr(kw2, attr))
+        assert_true(kw1.args[0] is kw2.args[0])
+        assert_true(test1.body[1].tags[0] is test2.body[1].tags[0])
+
+    def test_suite_only_data(self):
+        expected = ExecutionResult(GOLDEN_XML)
+        data = json.loads(expected.to_json())['suite']
+        data = dict(sorted(data.items(), key=lambda item: item[0] != 'rpa'))
+        result = self._build(json.dumps(data))
+        assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+        assert_equal(result.generator, 'unknown')
+
+    def test_rpa(self):
+        data = to_json(GOLDEN_XML)
+        assert_equal(self._build(data).rpa, False)
+        result = JsonResultBuilder(data).build(Result(rpa=True))
+        assert_equal(result.rpa, True)
+        assert_equal(result.suite.rpa, True)
+
+    def test_compressed_file(self):
+        result = ExecutionResult(GOLDEN_XML)
+        path = Path(os.getenv('TEMPDIR', tempfile.gettempdir()), 'robot-utest.json.gz')
+        try:
+            result.save(path)
+            assert_equal(Result.from_json(path).suite.to_dict(), result.suite.to_dict())
+        finally:
+            path.unlink()
+
+    def test_invalid_data(self):
+        assert_raises_with_msg(DataError, 'Loading JSON data failed: '
+                               'Expected dictionary, got list.',
+                               Result.from_json, '[{}]')
+        assert_raises_with_msg(DataError, 'Loading JSON data failed: '
+                               'Expected test to be a dictionary, got integer.',
+                               Result.from_json, '{"tests": [1]}')
+        assert_raises_with_msg(DataError, "Creating 'robot.result.TestSuite' object "
+                               "from dictionary failed: 'robot.result.TestSuite' "
+                               "object does not have attribute 'xxx'",
+                               Result.from_json, '{"name": "S", "xxx": 1}')
+        assert_raises(DataError, Result.from_json, '{"suite": {"tests": [}}')
+
+
+if __name__ == '__main__':
+    unittest.main()
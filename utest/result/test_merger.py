@@ -0,0 +1,89 @@
+import unittest
+
+from robot.result import Result, TestCase, TestSuite
+from robot.result.merger import Merger, NameIndex
+from robot.utils.asserts import assert_equal, assert_true
+
+
+def create_result(*suites, status='PASS'):
+    root = TestSuite(name='Root')
+    for name, tests in suites:
+        suite = root.suites.create(name=name)
+        for test in tests:
+            suite.tests.create(name=test, status=status)
+    return Result(suite=root)
+
+
+class TestMerger(unittest.TestCase):
+
+    def test_merge_keeps_order(self):
+        result = create_result(('A', ['1', '2', '3']), ('B', ['1']), status='FAIL')
+        merged = create_result(('B', ['2', '1']), ('A', ['3', '4']), ('C', ['1']))
+        Merger(result).merge(merged)
+        assert_equal([(s.name, [t.name for t in s.tests]) for s in result.suite.suites],
+                     [('A', ['1', '2', '3', '4']), ('B', ['1', '2']), ('C', ['1'])])
+        assert_equal([t.status for t in result.suite.all_tests],
+                     ['FAIL', 'FAIL', 'PASS', 'PASS', 'PASS', 'PASS', 'PASS'])
+        assert_true(result.suite.suites[0].tests[2].message.startswith(
+            '*HTML* <span class="merge">Test has been re-executed'))
+        assert_true(result.suite.suites[0].tests[3].message.startswith(
+            '*HTML* Test added from merged output.'))
+
+    def test_first_test_with_same_name_is_replaced(self):
+        result = create_result(('A', ['1', 'x', 'x']), status='FAIL')
+        Merger(result).merge(create_result(('A', ['x'])))
+        assert_equal([t.status for t in result.suite.suites[0].tests],
+                     ['FAIL', 'PASS', 'FAIL'])
+
+    def test_merge_multiple_times(self):
+        result = create_result(('A', ['1']), status='FAIL')
+        merger = Merger(result)
+        merger.merge(create_result(('A', ['1', '2']), status='FAIL'))
+        merger.merge(create_result(('A', ['2', '3'])))
+        merger.merge(create_result(('A', ['1'])))
+        assert_equal([(t.name, t.status) for t in result.suite.suites[0].tests],
+                     [('1', 'PASS'), ('2', 'PASS'), ('3', 'PASS')])
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def test_find(self):
+        suite = TestSuite()
+        for name in 'a', 'b', 'a':
+            suite.tests.create(name=name)
+        index = NameIndex(suite.tests)
+        assert_true(index.find('a') is suite.tests[0])
+        assert_true(index.find('b') is suite.tests[1])
+        assert_equal(index.find('c'), None)
+
+    def test_append_and_replace(self):
+        suite = TestSuite()
+        index = NameIndex(suite.tests)
+        old, new = TestCase(name='a'), TestCase(name='a')
+        index.append(old)
+        assert_true(index.find('a') is old)
+        index.replace(old, new)
+        assert_equal(list(suite.tests), [new])
+        assert_true(index.find('a') is new)
+
+    def test_index_is_rebuilt_if_length_changes_or_found_item_is_renamed(self):
+        suite = TestSuite()
+        suite.tests.create(name='a')
+        index = NameIndex(suite.tests)
+        suite.tests.insert(0, TestCase(name='b'))
+        assert_equal(index.find('b').name, 'b')
+        assert_equal(index.find('a').name, 'a')
+        suite.tests[1] = TestCase(name='c')
+        assert_equal(index.find('a'), None)
+        assert_equal(index.find('c').name, 'c')
+
+    def test_other_renames_are_not_noticed(self):
+        suite = TestSuite()
+        suite.tests.create(name='a')
+        index = NameIndex(suite.tests)
+        suite.tests[0].name = 'b'
+        assert_equal(index.find('b'), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
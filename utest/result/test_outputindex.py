@@ -0,0 +1,156 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.result import ExecutionResult, OutputIndex, OutputIndexBuilder
+from robot.utils.asserts import assert_equal, assert_false, assert_raises, assert_true
+
+
+NESTED = '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 7.0" rpa="false" schemaversion="5">
+<suite id="s1" name="Root">
+<suite id="s1-s1" name="Ä">
+<test id="s1-s1-t1" name="P ö">
+<kw name="Log" owner="BuiltIn">
+<msg time="2023-11-20T12:00:00.000" level="INFO">€</msg>
+<arg>€</arg>
+<status status="PASS" start="2023-11-20T12:00:00.000" elapsed="0.1"/>
+</kw>
+<tag>t</tag>
+<status status="PASS" start="2023-11-20T12:00:00.000" elapsed="1.0"/>
+</test>
+<test id="s1-s1-t2" name="F">
+<status status="FAIL" start="2023-11-20T12:00:01.000" elapsed="1.0">Oh no</status>
+</test>
+<status status="PASS" start="2023-11-20T12:00:00.000" elapsed="2.0"/>
+</suite>
+<suite id="s1-s2" name="Failing teardown">
+<test id="s1-s2-t1" name="P">
+<status status="PASS" start="2023-11-20T12:00:03.000" elapsed="1.0"/>
+</test>
+<kw name="Fail" owner="BuiltIn" type="TEARDOWN">
+<status status="FAIL" start="2023-11-20T12:00:04.000" elapsed="0.1">Failed</status>
+</kw>
+<status status="FAIL" start="2023-11-20T12:00:03.000" elapsed="1.1"/>
+</suite>
+<status status="FAIL" start="2023-11-20T12:00:00.000" elapsed="4.1"/>
+</suite>
+<statistics>
+<total><stat pass="1" fail="2" skip="0">All Tests</stat></total>
+<tag><stat pass="1" fail="0" skip="0">t</stat></tag>
+<suite><stat pass="1" fail="2" skip="0" id="s1" name="Root">Root</stat></suite>
+</statistics>
+<errors/>
+</robot>
+'''
+
+
+class TestOutputIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.xml = self._write('output.xml', NESTED)
+        self.result = ExecutionResult(self.xml)
+        # Robot writes JSON outputs without handling suite teardown failures.
+        unhandled = ExecutionResult(NESTED.replace('"Robot ', '"Rebot '))
+        json = unhandled.to_json().replace('"Rebot ', '"Robot ')
+        self.json = self._write('output.json', json)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, content):
+        path = Path(self.directory.name, name)
+        path.write_text(content, encoding='UTF-8')
+        return path
+
+    def test_scan(self):
+        for output in self.xml, self.json:
+            index = OutputIndex.scan(output)
+            assert_equal(list(index.items), ['s1', 's1-s1', 's1-s1-t1', 's1-s1-t2',
+                                             's1-s2', 's1-s2-t1'])
+            assert_equal([i.name for i in index.items.values()],
+                         ['Root', 'Ä', 'P ö', 'F', 'Failing teardown', 'P'])
+            assert_equal(index.format, output.suffix[1:])
+            assert_true(index.generated_by_robot)
+            assert_false(index.rpa)
+            assert_true(index.items['s1-s2'].teardown)
+            assert_false(index.items['s1'].teardown)
+
+    def test_get_test(self):
+        for output in self.xml, self.json:
+            index = OutputIndex.scan(output)
+            for test in self.result.suite.all_tests:
+                for name_or_id in test.id, test.full_name:
+                    built = index.get_test(name_or_id)
+                    assert_equal(built.to_dict(), test.to_dict())
+                    assert_equal(built.full_name, test.full_name)
+
+    def test_get_test_takes_suite_teardown_failures_into_account(self):
+        for output in self.xml, self.json:
+            test = OutputIndex.scan(output).get_test('Root.Failing teardown.P')
+            assert_equal(test.status, 'FAIL')
+            assert_equal(test.message, 'Parent suite teardown failed:\nFailed')
+
+    def test_get_suite(self):
+        for output in self.xml, self.json:
+            index = OutputIndex.scan(output)
+            for suite in [self.result.suite] + list(self.result.suite.suites):
+                for name_or_id in suite.id, suite.full_name:
+                    built = index.get_suite(name_or_id)
+                    assert_equal(built.to_dict(), suite.to_dict())
+                    assert_equal(built.status, suite.status)
+
+    def test_not_found(self):
+        index = OutputIndex.scan(self.xml)
+        assert_raises(DataError, index.get_test, 's1-s1-t3')
+        assert_raises(DataError, index.get_test, 's1-s1')
+        assert_raises(DataError, index.get_suite, 'Root.Ä.F')
+        assert_raises(DataError, index.get_suite, 'Nonex')
+
+    def test_save_and_load(self):
+        assert_equal(OutputIndex.load(self.xml), None)
+        index = OutputIndex.from_output(self.xml)
+        assert_true(OutputIndex.get_index_path(self.xml).is_file())
+        loaded = OutputIndex.load(self.xml)
+        assert_equal([i.to_list() for i in loaded.items.values()],
+                     [i.to_list() for i in index.items.values()])
+        assert_equal(loaded.generator, 'Robot 7.0')
+        assert_equal(loaded.get_test('s1-s1-t1').name, 'P ö')
+
+    def test_index_is_not_loaded_if_output_has_changed(self):
+        OutputIndex.from_output(self.xml)
+        with open(self.xml, 'a', encoding='UTF-8') as file:
+            file.write('\n')
+        assert_equal(OutputIndex.load(self.xml), None)
+        index = OutputIndex.from_output(self.xml)
+        assert_equal(index.get_test('s1-s2-t1').status, 'FAIL')
+        assert_true(OutputIndex.load(self.xml))
+
+    def test_rebot_outputs(self):
+        output = self._write('rebot.xml', NESTED.replace('"Robot 7.0"', '"Rebot 7.0"'))
+        index = OutputIndex.scan(output)
+        assert_false(index.generated_by_robot)
+        assert_equal(index.get_test('s1-s2-t1').status, 'PASS')
+
+    def test_builder(self):
+        data = NESTED.encode('UTF-8')
+        builder = OutputIndexBuilder(self.xml, generator='Robot 7.0')
+        for id in 's1', 's1-s1', 's1-s1-t1':
+            builder.start(id, 'x', data.index(f'<{"test" if "t" in id else "suite"} '
+                                              f'id="{id}"'.encode()))
+        builder.end(data.index(b'</test>') + len('</test>'))
+        assert_equal(builder.current.id, 's1-s1')
+        assert_equal(builder.index.get_test('s1-s1-t1').to_dict(),
+                     self.result.suite.suites[0].tests[0].to_dict())
+
+    def test_invalid_output(self):
+        assert_raises(DataError, OutputIndex.from_output, 'non_existing.xml')
+        assert_raises(DataError, OutputIndex.scan, self._write('x.json', '{"a": 1}'))
+        assert_raises(DataError, OutputIndex.scan, self._write('x.xml', '<robot>'))
+
+
+if __name__ == '__main__':
+    unittest.main()
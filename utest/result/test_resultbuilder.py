@@ -1,13 +1,23 @@
+import gzip
+import lzma
 import os
 import unittest
 import tempfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
+from unittest.mock import patch
 
 from robot.errors import DataError
-from robot.result import ExecutionResult, ExecutionResultBuilder, Result, TestSuite
-from robot.utils.asserts import assert_equal, assert_false, assert_true, assert_raises
+from robot.result import (ExecutionResult, ExecutionResultBuilder, Result, TestSuite,
+                          resultbuilder)
+from robot.result.executionresult import is_json_source
+from robot.result.flattenkeywordmatcher import FlattenByTags
+from robot.utils import ET
+from robot.utils.asserts import (assert_equal, assert_false, assert_true, assert_raises,
+                                 assert_raises_with_msg)
 
 
 CURDIR = Path(__file__).resolve().parent
@@ -141,6 +151,14 @@ class TestBuildingSuiteExecutionResult(unittest.TestCase):
         builder.build(result)
         assert_equal(len(result.suite.tests[0].body), 0)
 
+    def test_repeating_values_are_interned(self):
+        test1, test2 = ExecutionResult(StringIO(GOLDEN_XML_TWICE)).suite.all_tests
+        kw1, kw2 = test1.body[0], test2.body[0]
+        for attr in 'name', 'owner', 'doc', 'status':
+            assert_true(getattr(kw1, attr) is getattr(kw2, attr))
+        assert_true(kw1.args[0] is kw2.args[0])
+        assert_true(test1.body[1].tags[0] is test2.body[1].tags[0])
+
     def test_rpa_with_xml(self):
         rpa_false = GOLDEN_XML
         self._validate_rpa(ExecutionResult(rpa_false), False)
@@ -199,6 +217,68 @@ class TestMergingSuites(unittest.TestCase):
         assert_true('<span class="old-message">Old message:</span>' not in message)
 
 
+class TestReadingInWorkerProcesses(unittest.TestCase):
+    sources = [CURDIR / 'golden.xml', str(CURDIR / 'goldenTwice.xml'),
+               CURDIR / 'golden.xml']
+
+    def setUp(self):
+        # The number of workers is limited by the number of CPUs.
+        cpu_count = patch.object(resultbuilder.os, 'cpu_count', return_value=4)
+        cpu_count.start()
+        self.addCleanup(cpu_count.stop)
+
+    def test_combine(self):
+        result = ExecutionResult(*self.sources, processes=2, include_keywords=False)
+        expected = ExecutionResult(*self.sources, include_keywords=False)
+        self._verify(result, expected)
+        assert_equal([s.source for s in result.suite.suites],
+                     [s.source for s in expected.suite.suites])
+        assert_equal(len(next(result.suite.all_tests).body), 0)
+
+    def test_merge(self):
+        sources = [CURDIR / 'golden.xml'] * 3
+        result = ExecutionResult(*sources, merge=True, processes=2,
+                                 include_keywords=False)
+        expected = ExecutionResult(*sources, merge=True, include_keywords=False)
+        self._verify(result, expected)
+
+    def test_results_with_keywords_are_read_in_main_process(self):
+        with patch.object(resultbuilder, 'ProcessPoolExecutor') as executor:
+            result = ExecutionResult(*self.sources, processes=2)
+        executor.assert_not_called()
+        self._verify(result, ExecutionResult(*self.sources))
+
+    def test_workers_are_not_used_with_one_cpu(self):
+        with patch.object(resultbuilder.os, 'cpu_count', return_value=1):
+            with patch.object(resultbuilder, 'ProcessPoolExecutor') as executor:
+                result = ExecutionResult(*self.sources, processes=2,
+                                         include_keywords=False)
+        executor.assert_not_called()
+        self._verify(result, ExecutionResult(*self.sources, include_keywords=False))
+
+    def test_error(self):
+        assert_raises(DataError, ExecutionResult, CURDIR / 'golden.xml',
+                      CURDIR / 'test_resultbuilder.py', processes=2,
+                      include_keywords=False)
+
+    def test_broken_process_pool(self):
+        future = Future()
+        future.set_exception(BrokenProcessPool('Worker died.'))
+        error = (f"Reading '{CURDIR / 'golden.xml'}' in a worker process failed: "
+                 f"BrokenProcessPool: Worker died.")
+        with patch.object(resultbuilder, 'ProcessPoolExecutor') as executor:
+            executor.return_value.__enter__.return_value.submit.return_value = future
+            assert_raises_with_msg(DataError, error, ExecutionResult, *self.sources,
+                                   processes=2, include_keywords=False)
+
+    def _verify(self, result, expected):
+        assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+        assert_equal(result.errors.messages.to_dicts(),
+                     expected.errors.messages.to_dicts())
+        assert_equal(result.generator, expected.generator)
+        assert_equal(result.rpa, expected.rpa)
+
+
 class TestElements(unittest.TestCase):
 
     def test_nested_suites(self):
@@ -305,6 +385,126 @@ class TestSuiteTeardownFailed(unittest.TestCase):
             assert_equal(list(item.body), [])
 
 
+class TestProcessingDuringParsing(unittest.TestCase):
+
+    def test_same_result_as_when_configuring_afterwards(self):
+        for xml in (GOLDEN_XML, SUITE_TEARDOWN_FAILED,
+                    SUITE_TEARDOWN_FAILED.replace('generator="Robot', 'generator="Rebot')):
+            for remove, level, flatten in [(['ALL'], None, None),
+                                           (['PASSED'], 'WARN', None),
+                                           (['FOR', 'PASSED', 'NAME:*'], 'INFO', ['tag:*']),
+                                           (['WUKS', 'TAG:x'], 'NONE', ['name:*']),
+                                           (None, 'ERROR', ['tag:*'])]:
+                config = {'remove_keywords': remove, 'log_level': level}
+                expected = ExecutionResult(StringIO(xml), flattened_keywords=flatten)
+                expected.configure(suite_config=config)
+                result = ExecutionResult(StringIO(xml), flattened_keywords=flatten,
+                                         **config)
+                result.configure(suite_config=config)
+                assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+
+    def test_remove_keywords(self):
+        test = ExecutionResult(StringIO(GOLDEN_XML), remove_keywords=['ALL']).suite.tests[0]
+        assert_equal(test.body[0].name, 'Log')
+        assert_equal(list(test.body[0].body), [])
+        assert_true('Content removed' in test.body[0].message)
+
+    def test_passed_keywords_are_not_removed_if_suite_teardown_failures_are_handled(self):
+        result = ExecutionResult(StringIO(SUITE_TEARDOWN_FAILED),
+                                 remove_keywords=['PASSED'], log_level='WARN')
+        passed = result.suite.tests[0]
+        assert_equal(passed.status, 'FAIL')
+        assert_true(passed.body[0].body)
+        result.configure(suite_config={'remove_keywords': ['PASSED']})
+        assert_true(passed.body[0].body)
+
+    def test_filter_messages(self):
+        result = ExecutionResult(StringIO(GOLDEN_XML), log_level='WARN')
+        assert_equal(list(result.suite.tests[0].body[0].body), [])
+        assert_equal(len(result.errors), 1)
+        result = ExecutionResult(StringIO(GOLDEN_XML), log_level='INFO')
+        assert_equal(result.suite.tests[0].body[0].body[0].message, 'Test 1')
+
+
+class TestFlatteningByTagsDuringParsing(unittest.TestCase):
+    xml = """\
+<robot>
+<suite name="S">
+<test name="T">
+<kw name="Flat">
+<msg level="INFO">1</msg>
+<kw name="Nested">
+<msg level="INFO">2</msg>
+<tag>flat</tag>
+<status status="PASS"/>
+</kw>
+<variable name="${x}">
+<var>y</var>
+<msg level="INFO">3</msg>
+<status status="PASS"/>
+</variable>
+<return>
+<value>z</value>
+<status status="PASS"/>
+</return>
+<arg>a</arg>
+<tag>flat</tag>
+<status status="PASS">Message</status>
+</kw>
+<kw name="Not flat">
+<kw name="Flat">
+<if>
+<branch type="IF" condition="True">
+<msg level="INFO">4</msg>
+<status status="PASS"/>
+</branch>
+<status status="PASS"/>
+</if>
+<tag>flat</tag>
+<status status="PASS"/>
+</kw>
+<tag>other</tag>
+<status status="PASS"/>
+</kw>
+<status status="PASS"/>
+</test>
+<status status="PASS"/>
+</suite>
+</robot>
+"""
+
+    def test_flatten(self):
+        test = ExecutionResult(StringIO(self.xml),
+                               flattened_keywords=['tag:flat']).suite.tests[0]
+        flat, not_flat = test.body
+        assert_equal([m.message for m in flat.body], ['1', '2', '3'])
+        assert_equal(flat.args, ('a',))
+        assert_equal(flat.tags, ['flat'])
+        assert_true(flat.message.startswith('*HTML* Message<hr>'))
+        assert_equal(not_flat.body[0].tags, ['flat'])
+        assert_equal([m.message for m in not_flat.body[0].body], ['4'])
+        assert_equal(not_flat.message, '')
+
+    def test_same_result_as_when_flattening_after_parsing(self):
+        for xml in GOLDEN_XML, self.xml:
+            for flatten in (['tag:*'], ['tag:flat', 'name:Flat'], ['tag:*', 'for'],
+                            ['tag:nomatch', 'name:*']):
+                expected = ExecutionResult(StringIO(xml), flattened_keywords=[
+                    f for f in flatten if not f.startswith('tag:')
+                ])
+                expected.suite.visit(FlattenByTags(flatten))
+                result = ExecutionResult(StringIO(xml), flattened_keywords=flatten)
+                assert_equal(result.suite.to_dict(), expected.suite.to_dict())
+
+    def test_tags_are_available_when_keyword_starts(self):
+        builder = ExecutionResultBuilder(StringIO(self.xml))
+        context = ET.iterparse(StringIO(self.xml), events=('start', 'end'))
+        tags = [[t.text for t in elem.iterfind('tag')]
+                for event, elem in builder._buffer_keywords(context)
+                if event == 'start' and elem.tag == 'kw']
+        assert_equal(tags, [['flat'], ['flat'], ['other'], ['flat']])
+
+
 class TestBuildingFromXmlStringAndHandlingMissingInformation(unittest.TestCase):
 
     def setUp(self):
@@ -401,5 +601,54 @@ class TestUsingPathlibPath(unittest.TestCase):
         self.test_test_is_built(result.suite)
 
 
+
+class TestCompressedOutputs(unittest.TestCase):
+
+    def setUp(self):
+        self.result = ExecutionResult(Path(__file__).parent / 'golden.xml')
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_read(self):
+        for name in ('output.xml.gz', 'output.xml.xz', 'output.json.gz',
+                     'output.json.xz', 'OUTPUT.XML.GZ'):
+            path = Path(self.directory.name, name)
+            self.result.save(path)
+            opener = gzip.open if name.lower().endswith('.gz') else lzma.open
+            with opener(path) as file:
+                assert_equal(file.read(1), b'{' if '.json' in name else b'<')
+            for source in path, str(path):
+                result = ExecutionResult(source)
+                assert_equal(result.suite.to_dict(), self.result.suite.to_dict())
+                assert_equal(result.errors.messages[0].message,
+                             self.result.errors.messages[0].message)
+
+    def test_only_outputs_are_compressed(self):
+        from robot import rebot
+        directory = self.directory.name
+        rebot(Path(__file__).parent / 'golden.xml', outputdir=directory,
+              output='output.xml.gz', log='log.html.gz', report='report.html.xz',
+              xunit='xunit.xml.gz', stdout=StringIO())
+        with gzip.open(Path(directory, 'output.xml.gz')) as file:
+            assert_equal(file.read(1), b'<')
+        for name in 'log.html.gz', 'report.html.xz', 'xunit.xml.gz':
+            with open(Path(directory, name), 'rb') as file:
+                assert_equal(file.read(1), b'<')
+
+    def test_json_dumper_does_not_compress(self):
+        path = Path(self.directory.name, 'suite.json.gz')
+        self.result.suite.to_json(path)
+        with open(path, 'rb') as file:
+            assert_equal(file.read(1), b'{')
+
+    def test_is_json_source(self):
+        assert_true(is_json_source('output.json.gz'))
+        assert_true(is_json_source(Path('output.JSON.xz')))
+        assert_false(is_json_source('output.xml.gz'))
+        assert_false(is_json_source('output.gz'))
+
+
 if __name__ == '__main__':
     unittest.main()
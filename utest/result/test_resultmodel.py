@@ -189,6 +189,17 @@ class TestTimes(unittest.TestCase):
             assert_equal(obj.end_time, datetime(2023, 9, 7, 20, 33, 44, 999999))
             self.assert_elapsed(obj, 0.444444)
 
+    def test_times_are_converted_lazily(self):
+        for cls in (TestSuite, TestCase, Keyword, For, Return):
+            obj = cls(start_time='2023-05-12T16:40:00.001', elapsed_time=1.5)
+            assert_equal(obj._start_time, '2023-05-12T16:40:00.001')
+            assert_equal(obj._elapsed_time, 1.5)
+            assert_equal(obj.end_time, datetime(2023, 5, 12, 16, 40, 1, 501000))
+            assert_equal(obj._start_time, datetime(2023, 5, 12, 16, 40, 0, 1000))
+            assert_equal(obj._elapsed_time, timedelta(seconds=1.5))
+            obj.config(start_time='invalid')
+            assert_raises(ValueError, getattr, obj, 'start_time')
+
     def test_times_are_calculated_if_not_set(self):
         for cls in (TestSuite, TestCase, Keyword, If, IfBranch, Try, TryBranch,
                     For, While, Break, Continue, Return, Error):
@@ -0,0 +1,174 @@
+import unittest
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.model import SuiteVisitor
+from robot.result import ExecutionResult, ResultStream, StreamedTestSuite
+from robot.utils.asserts import assert_equal, assert_false, assert_raises, assert_true
+
+
+CURDIR = Path(__file__).resolve().parent
+GOLDEN_XML = (CURDIR / 'golden.xml').read_text(encoding='UTF-8')
+SUITE_TEARDOWN_FAILED = (CURDIR / 'suite_teardown_failed.xml').read_text(encoding='UTF-8')
+NESTED_TEARDOWNS = '''\
+<robot generator="Robot 7.0" rpa="false" schemaversion="5">
+<suite name="Root">
+<suite name="Skipping">
+<test name="P"><tag>t</tag><status status="PASS" start="2023-11-20T12:00:00.000" elapsed="1.0"/></test>
+<test name="F"><status status="FAIL" start="2023-11-20T12:00:01.000" elapsed="1.0">Oh no</status></test>
+<kw name="Skip" type="TEARDOWN"><status status="SKIP" start="2023-11-20T12:00:02.000" elapsed="0.1">Skipped</status></kw>
+<status status="SKIP" start="2023-11-20T12:00:00.000" elapsed="2.1"/>
+</suite>
+<suite name="Passing">
+<test name="P1"><status status="PASS" start="2023-11-20T12:00:03.000" elapsed="1.0"/></test>
+<test name="P2"><status status="PASS" start="2023-11-20T12:00:04.000" elapsed="1.0"/></test>
+<test name="S"><status status="SKIP" start="2023-11-20T12:00:05.000" elapsed="1.0">Skip</status></test>
+<status status="PASS" start="2023-11-20T12:00:03.000" elapsed="3.0"/>
+</suite>
+<kw name="Fail" type="TEARDOWN"><status status="FAIL" start="2023-11-20T12:00:06.000" elapsed="0.1">Failed</status></kw>
+<status status="FAIL" start="2023-11-20T12:00:00.000" elapsed="6.1"/>
+</suite>
+<statistics>
+<total><stat pass="0" fail="2" skip="3">All Tests</stat></total>
+<tag><stat pass="0" fail="0" skip="1">t</stat></tag>
+<suite><stat pass="0" fail="2" skip="3" id="s1" name="Root">Root</stat></suite>
+</statistics>
+<errors><msg time="2023-11-20T12:00:00.000" level="ERROR">Error</msg></errors>
+</robot>
+'''
+
+
+class EventCollector(SuiteVisitor):
+
+    def __init__(self):
+        self.events = []
+
+    def start_suite(self, suite):
+        self.events.append(('start', suite.name, len(suite.tests)))
+
+    def end_suite(self, suite):
+        self.events.append(('end', suite.name, len(suite.tests)))
+
+    def visit_test(self, test):
+        self.events.append((test.full_name, test.status, test.message,
+                            list(test.tags), len(test.body)))
+
+
+def get_events(result):
+    collector = EventCollector()
+    result.suite.visit(collector)
+    return [(e[0], e[1], 0) if e[0] in ('start', 'end') else e[:4] + (0,)
+            for e in collector.events]
+
+
+class TestResultStream(unittest.TestCase):
+
+    def test_skeleton_contains_suites_without_tests(self):
+        stream = ResultStream(NESTED_TEARDOWNS)
+        assert_true(isinstance(stream.suite, StreamedTestSuite))
+        assert_equal([s.name for s in stream.suite.suites], ['Skipping', 'Passing'])
+        assert_equal(list(stream.suite.all_tests), [])
+        assert_false(stream.suite.suites[0].setup)
+        assert_equal(stream.errors.messages[0].message, 'Error')
+
+    def test_statistics_take_suite_teardowns_into_account(self):
+        stream = ResultStream(NESTED_TEARDOWNS)
+        result = ExecutionResult(NESTED_TEARDOWNS)
+        for s1, s2 in zip([stream.suite] + list(stream.suite.suites),
+                          [result.suite] + list(result.suite.suites)):
+            assert_equal(s1.statistics.message, s2.statistics.message)
+            assert_equal(s1.status, s2.status)
+        assert_equal(stream.suite.statistics.message,
+                     '5 tests, 0 passed, 2 failed, 3 skipped')
+        assert_equal(stream.return_code, 2)
+
+    def test_suite_teardowns_are_not_handled_with_rebot_outputs(self):
+        xml = NESTED_TEARDOWNS.replace('generator="Robot', 'generator="Rebot')
+        stream = ResultStream(xml)
+        assert_equal(stream.suite.statistics.message,
+                     '5 tests, 3 passed, 1 failed, 1 skipped')
+        assert_equal(self._get_events(stream), get_events(ExecutionResult(xml)))
+
+    def test_visit(self):
+        stream = ResultStream(NESTED_TEARDOWNS)
+        assert_equal(self._get_events(stream),
+                     get_events(ExecutionResult(NESTED_TEARDOWNS)))
+        assert_equal(self._get_events(stream)[2],
+                     ('Root.Skipping.P', 'SKIP',
+                      'Skipped in parent suite teardown:\nSkipped\n\n'
+                      'Also parent suite teardown failed:\nFailed', ['t'], 0))
+
+    def test_tests_are_removed_after_visiting(self):
+        stream = ResultStream(SUITE_TEARDOWN_FAILED)
+        collector = EventCollector()
+        stream.visit(collector)
+        assert_equal(collector.events[-1], ('end', 'Suite Teardown Fail', 0))
+        assert_equal(list(stream.suite.all_tests), [])
+        assert_equal(collector.events[1:], self._get_events(stream)[1:])
+
+    def test_additional_visitors(self):
+        stream = ResultStream(GOLDEN_XML)
+        first, second = EventCollector(), EventCollector()
+        stream.visitors.append(second)
+        stream.visit(first)
+        assert_equal(first.events, second.events)
+        assert_equal(len(first.events), 3)
+
+    def test_statistics(self):
+        for xml in NESTED_TEARDOWNS, SUITE_TEARDOWN_FAILED, GOLDEN_XML:
+            stream = ResultStream(xml)
+            result = ExecutionResult(xml)
+            assert_equal(stream.statistics.to_dict(), result.statistics.to_dict())
+
+    def test_multiple_sources(self):
+        sources = [NESTED_TEARDOWNS, GOLDEN_XML, SUITE_TEARDOWN_FAILED]
+        stream = ResultStream(*sources)
+        result = ExecutionResult(*sources)
+        assert_equal(stream.suite.name, 'Root & Normal & Suite Teardown Fail')
+        assert_equal(stream.suite.statistics.message, result.suite.statistics.message)
+        assert_equal(stream.statistics.to_dict(), result.statistics.to_dict())
+        assert_equal(self._get_events(stream), get_events(result))
+        assert_equal(len(stream.errors), len(result.errors))
+
+    def test_configure(self):
+        config = dict(name='New', doc='Doc', metadata={'x': 'y'}, set_tags=['n', '-t'])
+        stat_config = {'tag_stat_combine': [('nNOTt', 'Combined')]}
+        stream = ResultStream(NESTED_TEARDOWNS)
+        stream.configure(status_rc=False, suite_config=config, stat_config=stat_config)
+        result = ExecutionResult(NESTED_TEARDOWNS)
+        result.configure(status_rc=False, suite_config=config, stat_config=stat_config)
+        assert_equal(stream.suite.name, 'New')
+        assert_equal(stream.suite.doc, 'Doc')
+        assert_equal(stream.suite.metadata, {'x': 'y'})
+        assert_equal(self._get_events(stream), get_events(result))
+        assert_equal(stream.statistics.to_dict(), result.statistics.to_dict())
+        assert_equal(stream.return_code, 0)
+
+    def test_selecting_tests_is_not_supported(self):
+        stream = ResultStream(GOLDEN_XML)
+        for name in 'include_tags', 'exclude_tags', 'include_suites', 'include_tests':
+            assert_raises(DataError, stream.configure,
+                          suite_config={name: ['x']})
+        stream.configure(suite_config={'include_tags': [], 'include_tests': None})
+
+    def test_rpa(self):
+        assert_equal(ResultStream(GOLDEN_XML).rpa, False)
+        stream = ResultStream(GOLDEN_XML, rpa=True)
+        assert_equal(stream.rpa, True)
+        assert_equal(stream.suite.statistics.message, '1 task, 1 passed, 0 failed')
+
+    def test_invalid_sources(self):
+        assert_raises(DataError, ResultStream)
+        assert_raises(DataError, ResultStream, '{"suite": {}}')
+        assert_raises(DataError, ResultStream, 'output.json')
+        assert_raises(DataError, ResultStream, '<robot><invalid/></robot>')
+        assert_raises(DataError, ResultStream, 'non_existing.xml')
+
+    def _get_events(self, stream):
+        collector = EventCollector()
+        stream.visit(collector)
+        return collector.events
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,13 @@
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
+from robot.conf import Languages
 from robot.errors import DataError
 from robot.utils import Importer
 from robot.utils.asserts import assert_equal, assert_raises, assert_true
-from robot.running import TestSuite, TestSuiteBuilder
+from robot.running import ResourceFileBuilder, TestSuite, TestSuiteBuilder
 
 
 DATADIR = (Path(__file__).parent / '../../atest/testdata/misc').resolve()
@@ -155,6 +158,130 @@ class TestBuilding(unittest.TestCase):
                                   "'integer' does not have mandatory 'parse' method.")
 
 
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = Path(tempfile.mkdtemp())
+        self.data = Path(tempfile.mkdtemp())
+        (self.data / '__init__.robot').write_text(
+            '*** Settings ***\nTest Tags    from init\nTest Timeout    1 min\n'
+        )
+        (self.data / 'suite.robot').write_text(
+            '*** Settings ***\nResource    ${CURDIR}/example.resource\n'
+            '*** Test Cases ***\nExample\n    Log    ${CURDIR}\n'
+        )
+        (self.data / 'example.resource').write_text(
+            '*** Keywords ***\nKeyword\n    No Operation\n'
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.cache)
+        shutil.rmtree(self.data)
+
+    def test_cached_suite_is_same_as_parsed(self):
+        expected = TestSuiteBuilder().build(self.data).to_dict()
+        for _ in range(2):
+            suite = TestSuiteBuilder(parse_cache=self.cache).build(self.data)
+            assert_equal(suite.to_dict(), expected)
+            assert_equal(len(list(self.cache.glob('*.json'))), 2)
+        test = suite.suites[0].tests[0]
+        assert_equal(test.tags, ['from init'])
+        assert_equal(test.timeout, '1 min')
+        assert_equal(test.body[0].args, (str(self.data),))
+
+    def test_changed_file_is_parsed_again(self):
+        TestSuiteBuilder(parse_cache=self.cache).build(self.data)
+        path = self.data / 'suite.robot'
+        path.write_text(path.read_text().replace('Example', 'Changed'))
+        suite = TestSuiteBuilder(parse_cache=self.cache).build(self.data)
+        assert_equal(suite.suites[0].tests[0].name, 'Changed')
+        assert_equal(len(list(self.cache.glob('*.json'))), 3)
+
+    def test_changed_defaults_are_not_taken_from_cache(self):
+        TestSuiteBuilder(parse_cache=self.cache).build(self.data)
+        (self.data / '__init__.robot').write_text('*** Settings ***\nTest Tags    new\n')
+        suite = TestSuiteBuilder(parse_cache=self.cache).build(self.data)
+        assert_equal(suite.suites[0].tests[0].tags, ['new'])
+        assert_equal(suite.suites[0].tests[0].timeout, None)
+
+    def test_resource_file(self):
+        path = self.data / 'example.resource'
+        expected = ResourceFileBuilder().build(path).to_dict()
+        for _ in range(2):
+            resource = ResourceFileBuilder(parse_cache=self.cache).build(path)
+            assert_equal(resource.to_dict(), expected)
+        assert_equal(len(list(self.cache.glob('*.json'))), 1)
+
+    def test_languages_in_headers_are_added_when_using_cache(self):
+        (self.data / 'localized.robot').write_text(
+            'Language: Finnish\n\n*** Testit ***\nTesti\n    Oletetaan Log    x\n',
+            encoding='UTF-8'
+        )
+        expected = TestSuiteBuilder().build(self.data).to_dict()
+        for _ in range(2):
+            lang = Languages()
+            suite = TestSuiteBuilder(lang=lang, parse_cache=self.cache).build(self.data)
+            assert_equal(suite.to_dict(), expected)
+            assert_equal([lang.code for lang in lang], ['en', 'fi'])
+            assert_equal(lang.bdd_prefixes, {'Given', 'When', 'Then', 'And', 'But',
+                                             'Oletetaan', 'Kun', 'Niin', 'Ja', 'Mutta'})
+        assert_equal(len(list(self.cache.glob('*.json'))), 3)
+
+    def test_invalid_cache_entry_is_ignored(self):
+        TestSuiteBuilder(parse_cache=self.cache).build(self.data)
+        for path in self.cache.glob('*.json'):
+            path.write_text('{"invalid": ')
+        suite = TestSuiteBuilder(parse_cache=self.cache).build(self.data)
+        assert_equal(suite.suites[0].tests[0].name, 'Example')
+
+
+class TestParallelParsing(unittest.TestCase):
+
+    def setUp(self):
+        self.data = Path(tempfile.mkdtemp())
+        (self.data / '__init__.robot').write_text('*** Settings ***\nTest Tags    init\n')
+        for name in 'a', 'b', 'c':
+            (self.data / f'{name}.robot').write_text(
+                f'*** Test Cases ***\nTest {name}\n    Log    {name}\n'
+                f'*** Keywords ***\nInvalid ${{x:(}}\n    No Operation\n'
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.data)
+
+    def test_parallel_parsing_is_same_as_sequential(self):
+        expected = TestSuiteBuilder().build(self.data).to_dict()
+        suite = TestSuiteBuilder(processes=2).build(self.data)
+        assert_equal(suite.to_dict(), expected)
+        assert_equal([t.tags for t in suite.all_tests], [['init']] * 3)
+
+    def test_languages_in_headers_are_added_to_main_process(self):
+        (self.data / 'd.robot').write_text(
+            'Language: Finnish\n\n*** Testit ***\nTesti\n    Oletetaan Log    x\n',
+            encoding='UTF-8'
+        )
+        (self.data / 'e.robot').write_text(
+            'language: pl\n\n*** Przypadki Testowe ***\nTest\n    Log    x\n',
+            encoding='UTF-8'
+        )
+        results = []
+        for processes in 1, 2:
+            lang = Languages()
+            suite = TestSuiteBuilder(lang=lang, processes=processes).build(self.data)
+            results.append((suite.to_dict(), [lang.code for lang in lang]))
+        assert_equal(results[0], results[1])
+        assert_equal(results[1][1], ['en', 'fi', 'pl'])
+
+    def test_first_error_is_reported(self):
+        for name in 'b', 'c':
+            (self.data / f'{name}.robot').write_bytes(b'\xe4')
+        expected = f"Parsing '{self.data / 'b.robot'}' failed: UnicodeDecodeError: "
+        for processes in 1, 2:
+            error = assert_raises(DataError, TestSuiteBuilder(processes=processes).build,
+                                  self.data)
+            assert_true(str(error).startswith(expected), error)
+
+
 class TestTemplates(unittest.TestCase):
 
     def test_from_setting_table(self):
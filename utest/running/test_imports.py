@@ -3,7 +3,7 @@ import unittest
 
 from robot.running import TestSuite
 from robot.running.resourcemodel import Import
-from robot.utils.asserts import assert_equal, assert_raises_with_msg
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
 
 
 def run(suite, **config):
@@ -94,3 +94,59 @@ class TestImports(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+class LibraryImportListener:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self):
+        self.libraries = []
+
+    def library_import(self, library, importer):
+        self.libraries.append(library.name)
+
+
+class TestLazyLibraries(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = TestSuite(name='Suite')
+        self.suite.resource.imports.library('Collections')
+        self.suite.resource.imports.library('String')
+        self.suite.resource.imports.library('OperatingSystem', alias='OS')
+        self.test = self.suite.tests.create(name='Test')
+        self.listener = LibraryImportListener()
+
+    def run_suite(self):
+        self.stderr = StringIO()
+        return self.suite.run(output=None, log=None, report=None,
+                              stdout=StringIO(), stderr=self.stderr,
+                              lazylibraries=True, listener=[self.listener])
+
+    def test_only_needed_libraries_are_imported(self):
+        self.test.body.create_keyword('Log', args=['Hello'])
+        self.test.body.create_keyword('Convert To Lower Case', args=['ROBOT'])
+        assert_test(self.run_suite().suite.tests[0], 'Test', 'PASS')
+        assert_equal(self.listener.libraries, ['BuiltIn', 'Collections', 'String'])
+
+    def test_explicit_names(self):
+        self.test.body.create_keyword('OS.Directory Should Exist', args=['.'])
+        self.test.body.create_keyword('Get Library Instance', args=['String'])
+        assert_test(self.run_suite().suite.tests[0], 'Test', 'PASS')
+        assert_equal(self.listener.libraries, ['BuiltIn', 'OS', 'String'])
+
+    def test_search_order(self):
+        self.test.body.create_keyword('Set Library Search Order', args=['OS'])
+        self.test.body.create_keyword('Directory Should Exist', args=['.'])
+        assert_test(self.run_suite().suite.tests[0], 'Test', 'PASS')
+        assert_equal(self.listener.libraries, ['BuiltIn', 'OS'])
+
+    def test_import_error_is_reported_against_import(self):
+        self.suite.resource.imports.library('NonExisting', lineno=42)
+        self.test.body.create_keyword('Non Existing Keyword')
+        result = self.run_suite()
+        assert_test(result.suite.tests[0], 'Test', 'FAIL',
+                    msg="No keyword with name 'Non Existing Keyword' found.")
+        assert_equal(self.listener.libraries,
+                     ['BuiltIn', 'Collections', 'String', 'OS'])
+        assert_true("[ ERROR ] Error in file '<unknown>' on line 42: "
+                    "Importing library 'NonExisting' failed:" in self.stderr.getvalue())
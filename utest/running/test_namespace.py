@@ -1,8 +1,12 @@
-import unittest
 import os
 import pkgutil
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
 
-from robot.running import namespace
+from robot.running import namespace, TestSuite
 from robot import libraries
 from robot.utils.asserts import assert_equal
 
@@ -14,3 +18,63 @@ class TestNamespace(unittest.TestCase):
         exp_libs = (name for _, name, _ in pkgutil.iter_modules([module_path])
                     if name[0].isupper() and not name.startswith('Deprecated'))
         assert_equal(set(exp_libs), namespace.STDLIBS)
+
+
+class TestRunnerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = TestSuite(name='Suite')
+        self.test = self.suite.tests.create(name='Test')
+
+    def run_suite(self):
+        result = self.suite.run(output=None, log=None, report=None,
+                                stdout=StringIO(), stderr=StringIO())
+        return result.suite.tests[0]
+
+    def test_embedded_arguments_are_not_shared(self):
+        self.suite.resource.keywords.create('Echo ${x}').body.create_return(['${x}'])
+        loop = self.test.body.create_for(assign=['${i}'], values=['1', '2', '3'])
+        loop.body.create_keyword('Echo ${i}', assign=['${result}'])
+        loop.body.create_keyword('Should Be Equal', args=['${result}', '${i}'])
+        test = self.run_suite()
+        assert_equal(test.status, 'PASS', test.message)
+
+    def test_search_order_change_is_noticed(self):
+        directory = Path(tempfile.mkdtemp())
+        try:
+            for name in 'first', 'second':
+                path = directory / f'{name}.resource'
+                path.write_text(f'*** Keywords ***\nKeyword\n    RETURN    {name}\n')
+                self.suite.resource.imports.resource(str(path))
+            for name in 'first', 'second', 'first':
+                self.test.body.create_keyword('Set Library Search Order', args=[name])
+                self.test.body.create_keyword('Keyword', assign=['${result}'])
+                self.test.body.create_keyword('Should Be Equal',
+                                              args=['${result}', name])
+            test = self.run_suite()
+        finally:
+            shutil.rmtree(directory)
+        assert_equal(test.status, 'PASS', test.message)
+
+    def test_caller_specific_warnings_are_not_shared(self):
+        directory = Path(tempfile.mkdtemp())
+        try:
+            (directory / 'res.resource').write_text(
+                '*** Keywords ***\n'
+                'Caller One\n    Target\n'
+                'Caller Two\n    Target\n'
+                'Target\n    No Operation\n'
+            )
+            (directory / 'suite.robot').write_text(
+                '*** Settings ***\nResource    res.resource\n'
+                '*** Test Cases ***\nTest\n    Caller One\n    Caller Two\n'
+                '*** Keywords ***\nTarget\n    No Operation\n'
+            )
+            suite = TestSuite.from_file_system(directory / 'suite.robot')
+            stderr = StringIO()
+            suite.run(output=None, log=None, report=None, stdout=StringIO(),
+                      stderr=stderr)
+        finally:
+            shutil.rmtree(directory)
+        assert_equal([line.split("'")[1] for line in stderr.getvalue().splitlines()],
+                     ['res.Caller One', 'res.Caller Two'])
@@ -51,6 +51,31 @@ class TestResourceFile(unittest.TestCase):
         )
 
 
+class TestEmbeddedKeywordIndex(unittest.TestCase):
+    names = ['User ${name} logs in', 'user ${name} logs out', 'User has ${n} items',
+             '${x} should be ${y}', '${x} is valid', '${a} and ${b}',
+             'Value is ${x:\\d+}', 'Value is ${x}', 'Kelvin ${k}', 'Ström ${x}',
+             'Stop  ${x}', 'Prefix ${x} suffix', r'Esc\${aped} ${x}']
+
+    def setUp(self):
+        self.resource = ResourceFile()
+        for name in self.names:
+            self.resource.keywords.create(name)
+
+    def test_same_matches_as_linear_search(self):
+        for name in ['User bob logs in', 'USER  bob logs in', 'user\tbob logs out',
+                     'User has 3 items', 'foo should be bar', 'x is valid',
+                     'a and b', 'Value is 42', 'Value is x', 'value\xa0is 1',
+                     '\u212aelvin 0', 'Ström 1', 'STRÖM 1', 'Stop 1', 'Prefix 1 SUFFIX',
+                     r'Esc\${aped} 1', 'x', '', 'Nothing matches']:
+            expected = [kw for kw in self.resource.keywords if kw.matches(name)]
+            assert_equal(self.resource.find_keywords(name), expected, name)
+
+    def test_order_is_preserved(self):
+        kws = self.resource.find_keywords('Value is 1')
+        assert_equal([kw.name for kw in kws], ['Value is ${x:\\d+}', 'Value is ${x}'])
+
+
 class TestCacheInvalidation(unittest.TestCase):
 
     def setUp(self):
@@ -443,6 +443,13 @@ class TestToFromDictAndJson(unittest.TestCase):
                      error='E',
                      body=[])
 
+    def test_user_keyword_with_invalid_embedded_args(self):
+        data = {'name': 'Invalid ${x:(}', 'error': 'Invalid regexp.', 'body': []}
+        uk = UserKeyword.from_dict(data)
+        assert_equal(uk.name, 'Invalid ${x:(}')
+        assert_equal(uk.embedded, None)
+        assert_equal(uk.to_dict(), data)
+
     def test_user_keyword_args(self):
         for spec in [('${a}', '${b}'),
                      ('${a}', '@{b}'),
@@ -0,0 +1,124 @@
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.result import Result
+from robot.running import TestSuite
+from robot.utils.asserts import assert_equal, assert_raises_with_msg
+
+
+def generate_suite():
+    root = TestSuite(name='Root')
+    for suite_index in range(3):
+        suite = root.suites.create(name=f'S{suite_index}')
+        suite.setup.config(name='Suite Setup')
+        for test_index in range(4):
+            suite.tests.create(name=f'T{suite_index}{test_index}')
+    return root
+
+
+def test_names(suite):
+    return [test.name for test in suite.all_tests]
+
+
+class TestSharding(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        for path in self.directory.iterdir():
+            path.unlink()
+        self.directory.rmdir()
+
+    def _write_timings(self, durations):
+        result = Result()
+        result.suite.name = 'Root'
+        for suite_name in sorted({name[:2] for name in durations}):
+            suite = result.suite.suites.create(name=suite_name.replace('T', 'S'))
+            for name, seconds in durations.items():
+                if name[:2] == suite_name:
+                    suite.tests.create(name=name, status='PASS',
+                                       elapsed_time=timedelta(seconds=seconds))
+        path = self.directory / 'timings.json'
+        result.save(path)
+        return str(path)
+
+    def _shard_all(self, total, timings=None):
+        shards = []
+        for index in range(1, total + 1):
+            suite = generate_suite()
+            suite.shard(index, total, timings, empty_suite_ok=True)
+            shards.append(suite)
+        return shards
+
+    def test_every_test_is_in_exactly_one_shard(self):
+        for total in range(1, 15):
+            names = [name for shard in self._shard_all(total)
+                     for name in test_names(shard)]
+            assert_equal(sorted(names), sorted(test_names(generate_suite())))
+
+    def test_split_by_count_without_timings(self):
+        shards = self._shard_all(3)
+        assert_equal([s.test_count for s in shards], [4, 4, 4])
+        assert_equal(test_names(shards[0]), ['T00', 'T03', 'T12', 'T21'])
+
+    def test_split_by_duration(self):
+        timings = self._write_timings({'T00': 10, 'T01': 1, 'T02': 1, 'T03': 1,
+                                       'T10': 1, 'T11': 1, 'T12': 1, 'T13': 1,
+                                       'T20': 1, 'T21': 1, 'T22': 1, 'T23': 1})
+        first, second = self._shard_all(2, timings)
+        assert_equal(test_names(first), ['T00', 'T23'])
+        assert_equal(second.test_count, 10)
+
+    def test_tests_without_history_get_suite_median(self):
+        timings = self._write_timings({'T00': 5, 'T01': 5, 'T02': 5,
+                                       'T10': 1, 'T11': 1, 'T12': 1, 'T13': 1})
+        first, second = self._shard_all(2, timings)
+        # T03 gets 5 seconds from its suite and suite S2 gets overall median 1.
+        assert_equal(test_names(first), ['T00', 'T02', 'T10', 'T12', 'T20', 'T22'])
+        assert_equal(test_names(second), ['T01', 'T03', 'T11', 'T13', 'T21', 'T23'])
+
+    def test_setups_are_preserved_and_empty_suites_removed(self):
+        suite = generate_suite()
+        suite.shard(1, 12)
+        assert_equal([s.name for s in suite.suites], ['S0'])
+        assert_equal(suite.suites[0].setup.name, 'Suite Setup')
+        assert_equal(dict(suite.metadata), {})
+
+    def test_empty_shard(self):
+        suite = generate_suite()
+        assert_raises_with_msg(DataError,
+                               "Suite 'Root' contains no tests in shard 13/13.",
+                               suite.shard, 13, 13)
+        suite = generate_suite()
+        suite.shard(13, 13, empty_suite_ok=True)
+        assert_equal(suite.test_count, 0)
+
+    def test_invalid_index(self):
+        assert_raises_with_msg(DataError, 'Shard index must be between 1 and 2, got 3.',
+                               generate_suite().shard, 3, 2)
+
+    def test_invalid_timings(self):
+        path = self.directory / 'invalid.xml'
+        path.write_text('<invalid')
+        assert_raises_with_msg(DataError,
+                               f"Reading shard timings from '{path}' failed: "
+                               f"Reading XML source '{path}' failed: "
+                               f"ParseError: unclosed token: line 1, column 0",
+                               generate_suite().shard, 1, 2, str(path))
+
+    def test_configure_shards_before_randomizing(self):
+        names = []
+        for index in 1, 2:
+            suite = generate_suite()
+            suite.configure(shard=(index, 2), randomize_tests=True,
+                            randomize_suites=True)
+            names.extend(test_names(suite))
+        assert_equal(sorted(names), sorted(test_names(generate_suite())))
+
+
+if __name__ == '__main__':
+    unittest.main()
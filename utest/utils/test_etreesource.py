@@ -1,4 +1,7 @@
 import os
+import gzip
+import lzma
+import tempfile
 import unittest
 import pathlib
 
@@ -39,6 +42,18 @@ class TestETSource(unittest.TestCase):
             assert_true(src is f)
         assert_true(src.closed is True)
 
+    def test_compressed_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name, opener in ('x.xml.gz', gzip.open), ('x.xml.xz', lzma.open):
+                path = os.path.join(directory, name)
+                with opener(path, 'wb') as file:
+                    file.write('<tag>hyvä</tag>'.encode('UTF-8'))
+                source = ETSource(path)
+                with source as src:
+                    assert_equal(ET.parse(src).getroot().text, 'hyvä')
+                self._verify_string_representation(source, path)
+                assert_true(source._opened.closed)
+
     def test_string(self):
         self._test_string('\n<tag>content</tag>\n')
 
@@ -204,6 +204,16 @@ class TestVariables(unittest.TestCase):
         assert_equal(self.varz.replace_scalar('${${whos${name}}${name}}'), [1, 2, 3])
         assert_equal(self.varz.replace_scalar('- ${${whos${name}}${name}} -'), '- [1, 2, 3] -')
 
+    def test_same_items_are_replaced_using_current_values(self):
+        for value in 'a', 'b', 'c':
+            self.varz['${x}'] = value
+            self.varz[f'${{y {value}}}'] = value.upper()
+            assert_equal(self.varz.replace_scalar('${x}'), value)
+            assert_equal(self.varz.replace_string('-${x}-${y ${x}}-'),
+                         f'-{value}-{value.upper()}-')
+            assert_equal(self.varz.replace_list(['${x}', '${y ${x}}', '\\${x}', 'x']),
+                         [value, value.upper(), '${x}', 'x'])
+
     def test_math_with_internal_vars(self):
         assert_equal(self.varz.replace_scalar('${${1}+${2}}'), 3)
         assert_equal(self.varz.replace_scalar('${${1}-${2}}'), -1)
@@ -234,6 +244,48 @@ class TestVariables(unittest.TestCase):
         copy = varz.copy()
         assert_equal(copy['${foo}'], 'bar')
 
+    def test_copy_is_independent(self):
+        varz = Variables()
+        varz['${foo}'] = 'bar'
+        varz['${zap}'] = 'zip'
+        copy = varz.copy(exclude=['${zap}'])
+        copy['${foo}'] = 'copy'
+        copy['${new}'] = 'new'
+        varz['${foo}'] = 'original'
+        varz['${other}'] = 'other'
+        assert_equal(varz['${foo}'], 'original')
+        assert_equal(varz['${zap}'], 'zip')
+        assert_equal(copy['${foo}'], 'copy')
+        assert_equal('${zap}' in copy, False)
+        assert_equal('${other}' in copy, False)
+        assert_equal('${new}' in varz, False)
+        assert_equal(sorted(copy.store), ['foo', 'new'])
+        assert_equal(sorted(varz.store), ['foo', 'other', 'zap'])
+
+    def test_copy_of_copy(self):
+        varz = Variables()
+        varz['${a}'] = 1
+        copies = [varz]
+        for index in range(20):
+            copy = copies[-1].copy()
+            copy['${a}'] += 1
+            copy['${b%d}' % index] = index
+            copies.append(copy)
+        del copies[10].store.data['b5']
+        for index, copy in enumerate(copies):
+            assert_equal(copy['${a}'], index + 1)
+            assert_equal(len(copy.store), index + 1 - (index == 10))
+        assert_equal('${b5}' in copies[10], False)
+        assert_equal(copies[11]['${b5}'], 5)
+
+    def test_copy_keeps_original_name(self):
+        varz = Variables()
+        varz['${Foo Bar}'] = 1
+        copy = varz.copy()
+        copy['${foo_bar}'] = 2
+        assert_equal(list(copy.store), ['Foo Bar'])
+        assert_equal(copy['${FOOBAR}'], 2)
+
     def test_ignore_error(self):
         v = Variables()
         v['${X}'] = 'x'
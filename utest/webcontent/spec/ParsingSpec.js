@@ -575,3 +575,141 @@ describe("Should split tests and keywords with --splitlog", function (){
     });
 
 });
+
+describe("Loading tests lazily from pages with --splitlog", function (){
+
+    beforeEach(function (){
+        // Suite model is replaced when it is built, so each spec needs a copy.
+        window.output = {};
+        for (var key in window.testPagesOutput)
+            window.output[key] = window.testPagesOutput[key];
+        window.output.suite = JSON.parse(JSON.stringify(window.testPagesOutput.suite));
+        var i = 0;
+        while (window['testPagesOutputKeywords'+i]) {
+            window['keywords'+(i+1)] = window['testPagesOutputKeywords'+i];
+            window['strings'+(i+1)] = window['testPagesOutputStrings'+i];
+            i = i+1;
+        }
+    });
+
+    function names(items) {
+        return window.util.map(items, function (item) { return item.name; });
+    }
+
+    function loadPage(index) {
+        window.fileLoading.notify('log-' + index + '.js');
+    }
+
+    it("should have tests split across pages", function (){
+        var suite = window.testdata.suite();
+        expect(suite.testPageFileNames).toEqual(['log-4.js', 'log-6.js']);
+        expect(suite.loadedTestPages).toEqual(0);
+        expect(suite.tests()).toEqual([]);
+        var called = false;
+        suite.callWhenTestPagesReady(1, function () { called = true; });
+        expect(called).toBeFalsy();
+        loadPage(4);
+        expect(called).toBeTruthy();
+        expect(names(suite.tests())).toEqual(['Test 1', 'Test 2', 'Test 3']);
+        expect(suite.tests()[2].id).toEqual('s1-t3');
+        expect(suite.hasMoreTestPages()).toBeTruthy();
+    });
+
+    it("should grow tests when more pages are loaded", function (){
+        var suite = window.testdata.suite();
+        suite.callWhenTestPagesReady(1, function () {});
+        loadPage(4);
+        var first = suite.tests()[0];
+        var ready = false;
+        suite.callWhenChildrenReady(function () { ready = true; });
+        expect(ready).toBeFalsy();
+        expect(suite.tests().length).toEqual(3);
+        loadPage(6);
+        expect(ready).toBeTruthy();
+        expect(names(suite.tests())).toEqual(['Test 1', 'Test 2', 'Test 3', 'Test 4']);
+        expect(suite.tests()[0]).toBe(first);
+        expect(suite.tests()[3].id).toEqual('s1-t4');
+        expect(suite.children().length).toEqual(4);
+        expect(suite.hasMoreTestPages()).toBeFalsy();
+    });
+
+    it("should call callbacks in the order they were registered", function (){
+        var suite = window.testdata.suite();
+        var calls = [];
+        suite.callWhenTestPagesReady(2, function () { calls.push('two pages'); });
+        suite.callWhenTestPagesReady(1, function () { calls.push('one page'); });
+        loadPage(4);
+        expect(calls).toEqual([]);
+        loadPage(6);
+        expect(calls).toEqual(['two pages', 'one page']);
+        suite.callWhenTestPagesReady(1, function () { calls.push('loaded'); });
+        expect(calls).toEqual(['two pages', 'one page', 'loaded']);
+    });
+
+    it("should load pages only until test needed by ensureLoaded", function (){
+        var ids = null;
+        window.testdata.ensureLoaded('s1-t2', function (result) { ids = result; });
+        expect(ids).toBeNull();
+        loadPage(4);
+        expect(ids).toEqual(['s1', 's1-t2']);
+        expect(window.testdata.suite().hasMoreTestPages()).toBeTruthy();
+    });
+
+    it("should load pages until later page when needed by ensureLoaded", function (){
+        var ids = null;
+        window.testdata.ensureLoaded('s1-t4', function (result) { ids = result; });
+        loadPage(4);
+        expect(ids).toBeNull();
+        loadPage(6);
+        expect(ids).toEqual(['s1', 's1-t4']);
+        expect(window.testdata.findLoaded('s1-t4').name).toEqual('Test 4');
+    });
+});
+
+describe("Searching with search index", function (){
+
+    beforeEach(function (){
+        // Items: s1, s1-t1, s1-t2, s1-t1-k1, s1-s1
+        window.output = {search_index: {
+            ids: [-1, 's1', 0, 't1', 0, 't2', 1, 'k1', 0, 's1'],
+            tokens: {'login': [1, 3], 'logout': [2], 'failed': [3, 4], 'user': [1, 2],
+                     'abcdefghijklmnopqrstuvwxyz0123': [4]},
+            failures: [2, 4],
+            truncated: false
+        }};
+    });
+
+    it("should return null when there is no index", function (){
+        window.output = {search_index: null};
+        expect(window.testdata.searchIndex()).toBeNull();
+    });
+
+    it("should reconstruct ids", function (){
+        var index = window.testdata.searchIndex();
+        expect(index.failures).toEqual(['s1-t2', 's1-s1']);
+        expect(index.find('logout')).toEqual(['s1-t2']);
+        expect(index.find('failed')).toEqual(['s1-t1-k1', 's1-s1']);
+        expect(index.truncated).toEqual(false);
+    });
+
+    it("should match words by prefix case-insensitively", function (){
+        var index = window.testdata.searchIndex();
+        expect(index.find('log')).toEqual(['s1-t1', 's1-t2', 's1-t1-k1']);
+        expect(index.find('LOGIN')).toEqual(['s1-t1', 's1-t1-k1']);
+        expect(index.find('abcdefghijklmnopqrstuvwxyz0123456789')).toEqual(['s1-s1']);
+    });
+
+    it("should intersect results of multiple words", function (){
+        var index = window.testdata.searchIndex();
+        expect(index.find('login failed')).toEqual(['s1-t1-k1']);
+        expect(index.find('User, log!')).toEqual(['s1-t1', 's1-t2']);
+        expect(index.find('login logout')).toEqual([]);
+    });
+
+    it("should find nothing without matching words", function (){
+        var index = window.testdata.searchIndex();
+        expect(index.find('nomatch')).toEqual([]);
+        expect(index.find('login nomatch')).toEqual([]);
+        expect(index.find('!?')).toEqual([]);
+    });
+});
@@ -11,17 +11,19 @@ OUTPUT = join(BASEDIR, 'output.xml')
 sys.path.insert(0, join(BASEDIR, '..', '..', '..', '..', 'src'))
 
 import robot
+from robot.api import ExecutionResult
 from robot.conf.settings import RebotSettings
+from robot.reporting.jsmodelbuilders import JsModelBuilder
 from robot.reporting.resultwriter import Results
 from robot.reporting.jswriter import JsResultWriter, JsonWriter
 
 
-def create(testdata, target, split_log=False):
+def create(testdata, target, split_log=False, test_page_size=None):
     testdata = join(BASEDIR, testdata)
     output_name = target[0].lower() + target[1:-3] + 'Output'
     target = join(BASEDIR, target)
     run_robot(testdata)
-    create_jsdata(target, split_log)
+    create_jsdata(target, split_log, test_page_size=test_page_size)
     inplace_replace_all(target, 'window.output', 'window.' + output_name)
 
 
@@ -29,9 +31,15 @@ def run_robot(testdata, output=OUTPUT):
     robot.run(testdata, log='NONE', report='NONE', output=output)
 
 
-def create_jsdata(target, split_log, outxml=OUTPUT):
-    result = Results(RebotSettings({'splitlog': split_log}), outxml).js_result
+def create_jsdata(target, split_log, outxml=OUTPUT, test_page_size=None):
+    if test_page_size:
+        builder = JsModelBuilder(split_log=True, test_page_size=test_page_size)
+        result = builder.build_from(ExecutionResult(outxml))
+    else:
+        result = Results(RebotSettings({'splitlog': split_log}), outxml).js_result
     config = {'logURL': 'log.html', 'reportURL': 'report.html', 'background': {'fail': 'DeepPink'}}
+    if split_log:
+        config['splitLogBase'] = 'log'
     with open(target, 'w') as output:
         JsResultWriter(output, start_block='', end_block='\n').write(result, config)
         writer = JsonWriter(output)
@@ -54,4 +62,5 @@ if __name__ == '__main__':
     create('TestsAndKeywords.robot', 'TestsAndKeywords.js')
     create('.', 'allData.js')
     create('.', 'splitting.js', split_log=True)
+    create('TestsAndKeywords.robot', 'testPages.js', split_log=True, test_page_size=3)
     os.remove(OUTPUT)
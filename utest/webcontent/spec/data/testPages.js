@@ -0,0 +1,34 @@
+window.testPagesOutput = {};
+
+window.testPagesOutput["suite"] = [1,2,0,0,[],[1,0,41],[],[4,6],[],[4,4,0,0]];
+
+window.testPagesOutput["strings"] = [];
+
+window.testPagesOutput["strings"] = window.testPagesOutput["strings"].concat(["*","*TestsAndKeywords","*/root/package/utest/webcontent/spec/data/TestsAndKeywords.robot"]);
+
+window.testPagesOutput["stats"] = [[{"elapsed":"00:00:00","fail":0,"label":"All Tests","pass":4,"skip":0}],[],[{"elapsed":"00:00:00","fail":0,"id":"s1","label":"TestsAndKeywords","name":"TestsAndKeywords","pass":4,"skip":0}]];
+
+window.testPagesOutput["errors"] = [];
+
+window.testPagesOutput["baseMillis"] = 1792202248308;
+
+window.testPagesOutput["generated"] = 45;
+
+window.testPagesOutput["expand_keywords"] = null;
+
+window.testPagesOutput["search_index"] = null;
+
+window.settings = {"background":{"fail":"DeepPink"},"logURL":"log.html","reportURL":"report.html","splitLogBase":"log"};
+
+window.testPagesOutputKeywords0 = [[0,1,0,0,0,0,0,0,[1,34,1],[[0,2,3,0,4,0,0,0,[1,35,0],[]]]],[0,5,0,0,0,0,0,0,[1,35,1],[[0,2,3,0,4,0,0,0,[1,36,0],[]]]],[0,6,0,0,0,0,0,0,[1,36,1],[[0,2,3,0,4,0,0,0,[1,36,0],[]]]],[0,7,0,0,0,0,0,0,[1,37,1],[[0,2,3,0,4,0,0,0,[1,37,0],[]]]]];
+window.testPagesOutputStrings0 = ["*","*kw1","*No Operation","*BuiltIn","*<p>Does absolutely nothing.\x3c/p>","*kw2","*kw3","*kw4"];
+window.testPagesOutputKeywords1 = [[0,1,2,0,3,0,0,0,[1,38,0],[]]];
+window.testPagesOutputStrings1 = ["*","*No Operation","*BuiltIn","*<p>Does absolutely nothing.\x3c/p>"];
+window.testPagesOutputKeywords2 = [[0,1,2,0,3,0,0,0,[1,40,0],[]]];
+window.testPagesOutputStrings2 = ["*","*No Operation","*BuiltIn","*<p>Does absolutely nothing.\x3c/p>"];
+window.testPagesOutputKeywords3 = [[1,0,0,[],[1,33,5],1],[2,0,0,[],[1,38,1],2],[3,0,0,[],[1,39,1],3]];
+window.testPagesOutputStrings3 = ["*","*Test 1","*Test 2","*Test 3"];
+window.testPagesOutputKeywords4 = [[0,1,2,0,3,0,0,0,[1,40,0],[]]];
+window.testPagesOutputStrings4 = ["*","*No Operation","*BuiltIn","*<p>Does absolutely nothing.\x3c/p>"];
+window.testPagesOutputKeywords5 = [[1,0,0,[],[1,40,1],5]];
+window.testPagesOutputStrings5 = ["*","*Test 4"];